@@ -0,0 +1,206 @@
+"""
+Incrementally maintained dashboard aggregates with mergeable quantile sketches
+
+The dashboard's summary metrics used to be recomputed from every result on
+each rerun. AggregateStats instead keeps running counts, sums and a band
+histogram, plus a quantile sketch of domain score and of experience, updated
+as results are added. Two aggregates merge by adding their counters, so each
+process (the app, a folder watcher, a screening worker) can aggregate its own
+batch and fold it into the shared total. The candidate store keeps the total
+in the database, so percentiles over a huge history need no row scan.
+
+QuantileSketch follows DDSketch: values fall into logarithmic buckets whose
+width guarantees every quantile within a fixed relative error, and merging
+two sketches is bucket-wise addition, so a merged sketch is exactly the one
+built from the combined values.
+"""
+
+import math
+
+# Relative error guaranteed for every quantile
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+# Values at or below this are counted in the sketch's zero bucket
+MIN_INDEXABLE_VALUE = 1e-9
+
+PERCENTILES = (50, 90)
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch of non-negative values with relative accuracy
+    """
+
+    def __init__(self, relative_accuracy=DEFAULT_RELATIVE_ACCURACY):
+        """
+        Args:
+            relative_accuracy (float): Maximum relative error of a quantile
+        """
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        # bucket key -> count; bucket k holds values in (gamma^(k-1), gamma^k]
+        self.bins = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value, count=1):
+        """
+        Args:
+            value (float): Non-negative value
+            count (int): Times to add it
+        """
+        if value <= MIN_INDEXABLE_VALUE:
+            self.zero_count += count
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.count += count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        """
+        Fold another sketch with the same accuracy into this one
+
+        Raises:
+            ValueError: If the sketches' accuracies differ
+        """
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q):
+        """
+        Args:
+            q (float): Quantile between 0 and 1
+
+        Returns:
+            float: Estimated value, or None if the sketch is empty
+        """
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return max(self.min, 0.0)
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                # Midpoint of the bucket in relative terms
+                value = 2 * self.gamma ** key / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'bins': {str(key): count for key, count in self.bins.items()},
+            'zero_count': self.zero_count,
+            'count': self.count,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        sketch = cls(state['relative_accuracy'])
+        sketch.bins = {int(key): count for key, count in state['bins'].items()}
+        sketch.zero_count = state['zero_count']
+        sketch.count = state['count']
+        if sketch.count:
+            sketch.min, sketch.max = state['min'], state['max']
+        return sketch
+
+
+class AggregateStats:
+    """
+    Running dashboard summary of a result population
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.experience_sum = 0.0
+        self.premium_count = 0
+        self.band_counts = {}
+        self.domain_score = QuantileSketch()
+        self.experience = QuantileSketch()
+
+    def add(self, result):
+        """
+        Args:
+            result: Result dict or CandidateResult
+        """
+        self.total += 1
+        self.experience_sum += result['experience']
+        if result['premium_skills']:
+            self.premium_count += 1
+        self.band_counts[result['band']] = self.band_counts.get(result['band'], 0) + 1
+        self.domain_score.add(result['domain_score'])
+        self.experience.add(result['experience'])
+
+    def add_many(self, results):
+        for result in results:
+            self.add(result)
+        return self
+
+    def merge(self, other):
+        """Fold another aggregate (e.g. from another process) into this one"""
+        self.total += other.total
+        self.experience_sum += other.experience_sum
+        self.premium_count += other.premium_count
+        for band, count in other.band_counts.items():
+            self.band_counts[band] = self.band_counts.get(band, 0) + count
+        self.domain_score.merge(other.domain_score)
+        self.experience.merge(other.experience)
+        return self
+
+    def summary(self, percentiles=PERCENTILES):
+        """
+        Dashboard summary metrics
+
+        Args:
+            percentiles (tuple): Percentiles of domain score and experience to estimate
+
+        Returns:
+            dict: total, avg_experience, premium_count, band_counts and
+                percentiles ({'domain_score': {50: ...}, 'experience': {...}})
+        """
+        return {
+            'total': self.total,
+            'avg_experience': self.experience_sum / self.total if self.total else 0.0,
+            'premium_count': self.premium_count,
+            'band_counts': dict(self.band_counts),
+            'percentiles': {
+                name: {p: sketch.quantile(p / 100) for p in percentiles}
+                for name, sketch in (('domain_score', self.domain_score), ('experience', self.experience))
+            }
+        }
+
+    def to_dict(self):
+        return {
+            'total': self.total,
+            'experience_sum': self.experience_sum,
+            'premium_count': self.premium_count,
+            'band_counts': self.band_counts,
+            'domain_score': self.domain_score.to_dict(),
+            'experience': self.experience.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        stats = cls()
+        stats.total = state['total']
+        stats.experience_sum = state['experience_sum']
+        stats.premium_count = state['premium_count']
+        stats.band_counts = dict(state['band_counts'])
+        stats.domain_score = QuantileSketch.from_dict(state['domain_score'])
+        stats.experience = QuantileSketch.from_dict(state['experience'])
+        return stats
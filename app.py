@@ -1,12 +1,18 @@
 import streamlit as st
-import pandas as pd
 from datetime import datetime
 import re
 from pathlib import Path
 import json
-from resume_parser import ResumeParser
-from band_classifier import BandClassifier
-from skills_analyzer import SkillsAnalyzer
+import zipfile
+from ingestion import ZipIngest
+from job_manager import JobManager, ACTIVE_STATES, RESUMABLE_STATES
+from screening_pool import ScreeningPool
+from candidate_index import CandidateIndex, BANDS, SORT_OPTIONS
+from candidate_result import CandidateResult
+from candidate_store import CandidateStore
+from similarity_index import SimilarityIndex
+from skyline import ResultShortlist, StoreShortlist
+from warmup import start_background_warmup
 
 # Page Configuration
 st.set_page_config(
@@ -152,9 +158,36 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Batches at least this large are screened on the shared process pool
+POOL_MIN_FILES = 8
+
+# Candidate cards shown per dashboard page
+PAGE_SIZE = 20
+
+# Rows shown in the export preview table
+PREVIEW_ROWS = 1000
+
+# Internal result fields left out of the preview and the exports
+EXPORT_HIDDEN_FIELDS = ('features',)
+
+# Earlier screenings of the same candidate looked up for a card
+PREVIOUS_SCREENINGS = 5
+
+# Neighbours listed by a card's "Similar candidates" button
+SIMILAR_CANDIDATES = 5
+
+# How often the upload tab polls a running screening job
+JOB_POLL_SECONDS = 1.0
+
+VIEW_OPTIONS = ["Latest batch", "All history"]
+
+LIST_OPTIONS = ["All candidates", "Shortlist"]
+
 # Initialize session state
 if 'analyzed_resumes' not in st.session_state:
     st.session_state.analyzed_resumes = []
+if 'active_job' not in st.session_state:
+    st.session_state.active_job = None
 
 def main():
     # Header
@@ -168,8 +201,15 @@ def main():
     # Sidebar
     with st.sidebar:
         if st.sidebar.button("🔄 Reset", use_container_width=True):
-            st.session_state.analyzed_resumes = []
+            reset_batch()
             st.rerun()
+        
+        st.radio(
+            "Candidate view",
+            options=VIEW_OPTIONS,
+            key="candidate_view",
+            help="Reset only clears the latest batch; the full history is kept in the candidate database"
+        )
 
         st.markdown("### 📊 Band Guide")
         st.markdown("""
@@ -226,6 +266,9 @@ def main():
     
     with tab3:
         export_results()
+    
+    # The page is rendered; preload heavy dependencies for the first analysis/export
+    start_background_warmup()
 
 def upload_resumes_section():
     st.markdown("### 📤 Upload Candidate Resumes")
@@ -240,18 +283,56 @@ def upload_resumes_section():
         </div>
         """, unsafe_allow_html=True)
         
-        uploaded_files = st.file_uploader(
-            "Choose resume files",
-            type=['pdf', 'docx'],
-            accept_multiple_files=True,
+        upload_mode = st.radio(
+            "Upload mode",
+            options=["Resume files", "ZIP archive"],
+            horizontal=True,
             label_visibility="collapsed"
         )
+        isolate = st.checkbox(
+            "🛡️ Isolate each document",
+            value=False,
+            help="Extract every file in a separate worker with a 30s timeout and a 1 GB memory cap, "
+                 "so a malformed PDF is reported as failed instead of stalling the batch"
+        )
         
-        if uploaded_files:
-            st.success(f"✅ {len(uploaded_files)} file(s) uploaded successfully")
+        if upload_mode == "ZIP archive":
+            uploaded_zip = st.file_uploader(
+                "Choose a ZIP archive of resumes",
+                type=['zip'],
+                label_visibility="collapsed"
+            )
             
-            if st.button("🚀 Start Analysis", use_container_width=True):
-                analyze_resumes(uploaded_files)
+            if uploaded_zip:
+                zip_ingest = ZipIngest(uploaded_zip)
+                try:
+                    member_count = len(zip_ingest)
+                except zipfile.BadZipFile:
+                    st.error("❌ The uploaded file is not a valid ZIP archive")
+                    return
+                st.success(f"✅ {member_count} resume(s) found in {uploaded_zip.name}")
+                
+                if member_count and st.button("🚀 Start Analysis", use_container_width=True):
+                    start_analysis(archive=uploaded_zip, isolate=isolate)
+        else:
+            uploaded_files = st.file_uploader(
+                "Choose resume files",
+                type=['pdf', 'docx'],
+                accept_multiple_files=True,
+                label_visibility="collapsed"
+            )
+            
+            if uploaded_files:
+                st.success(f"✅ {len(uploaded_files)} file(s) uploaded successfully")
+                
+                if st.button("🚀 Start Analysis", use_container_width=True):
+                    start_analysis(uploaded_files, isolate=isolate)
+        
+        if st.session_state.active_job:
+            job_progress()
+        elif st.session_state.get('finished_job'):
+            job_summary()
+        screening_jobs()
     
     with col2:
         st.markdown("### 📈 Scoring Methodology")
@@ -268,75 +349,182 @@ def upload_resumes_section():
         </div>
         """, unsafe_allow_html=True)
 
-def analyze_resumes(uploaded_files):
+@st.cache_resource
+def get_screening_pool():
+    """Process pool shared across sessions; workers keep spaCy loaded between batches"""
+    corpus = get_candidate_store().corpus
+    return ScreeningPool(corpus_path=corpus.path if corpus else None)
+
+@st.cache_resource
+def get_job_manager():
+    """Background screening jobs shared by every session; they keep running across reruns"""
+    return JobManager(store=get_candidate_store(), pool_factory=get_screening_pool, pool_min_files=POOL_MIN_FILES)
+
+def start_analysis(uploaded_files=None, archive=None, isolate=False):
+    job_id = get_job_manager().submit(uploaded_files, archive=archive, isolate=isolate)
+    watch_job(job_id)
+
+def watch_job(job_id):
+    """Make job_id the latest batch; its results stream in as the job checkpoints them"""
     # Clear previous results to ensure only the latest batch is shown
     st.session_state.analyzed_resumes = []
+    st.session_state.active_job = job_id
+    st.session_state.finished_job = None
+    st.session_state.job_celebrated = False
+    st.session_state.job_results_loaded = 0
+    st.session_state.job_failures = []
+
+def reset_batch():
+    """Clear the latest batch and stop the job feeding it (it stays resumable from its checkpoint)"""
+    if st.session_state.active_job:
+        get_job_manager().cancel(st.session_state.active_job)
+    st.session_state.analyzed_resumes = []
+    st.session_state.active_job = None
+    st.session_state.finished_job = None
+    st.session_state.job_results_loaded = 0
+    st.session_state.job_failures = []
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def job_progress():
+    """Poll the active job without rerunning the rest of the page"""
+    manager = get_job_manager()
+    job_id = st.session_state.active_job
+    job = manager.get(job_id)
+    if job is None:
+        st.session_state.active_job = None
+        return
+    # Read the status before the results: a finished job has checkpointed everything
+    finished = job.status not in ACTIVE_STATES
     
-    parser = ResumeParser()
-    classifier = BandClassifier()
-    skills_analyzer = SkillsAnalyzer()
-    
-    progress_bar = st.progress(0)
-    status_text = st.empty()
+    for result in manager.results(job_id, start=st.session_state.job_results_loaded):
+        st.session_state.job_results_loaded += 1
+        if result.get('error'):
+            st.session_state.job_failures.append(result)
+        else:
+            # Session state holds the compact form; cards and exports expand it
+            st.session_state.analyzed_resumes.append(CandidateResult.from_dict(result))
     
-    for idx, file in enumerate(uploaded_files):
-        status_text.text(f"Analyzing {file.name}...")
-        
-        # Parse resume
-        resume_data = parser.parse(file)
-        
-        # Classify band
-        band_info = classifier.classify(resume_data['experience'])
-        
-        # Analyze skills
-        skills_info = skills_analyzer.analyze(resume_data['text'], resume_data['experience'])
-        
-        # Combine results
-        result = {
-            'filename': file.name,
-            'name': resume_data.get('name', 'Unknown'),
-            'email': resume_data.get('email', 'Not found'),
-            'phone': resume_data.get('phone', 'Not found'),
-            'experience': resume_data['experience'],
-            'band': band_info['band'],
-            'designation': band_info['designation'],
-            'procurement_skills': skills_info['procurement_skills'],
-            'premium_skills': skills_info['premium_skills'],
-            'domain_score': skills_info['domain_score'],
-            'score_breakdown': skills_info.get('score_breakdown', {}),
-            'suitability': skills_info.get('suitability', {}),
-            'best_fit_role': skills_info.get('best_fit_role', 'General Procurement'),
-            'pros': skills_info.get('pros', []),
-            'cons': skills_info.get('cons', []),
-            'analysis_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-        
-        st.session_state.analyzed_resumes.append(result)
-        
-        progress_bar.progress((idx + 1) / len(uploaded_files))
+    st.progress(min(1.0, job.done / job.total) if job.total else 1.0)
+    if not finished:
+        col1, col2 = st.columns([3, 1])
+        col1.text(f"Analyzing {job.total} file(s)... {job.done} done" if job.status == 'running'
+                  else "Waiting for the previous job to finish...")
+        if col2.button("⏹️ Cancel", key=f"cancel_{job_id}", use_container_width=True):
+            manager.cancel(job_id)
+        return
     
-    status_text.text("✅ Analysis completed!")
-    st.balloons()
+    # Stop polling and rerun the whole page so the dashboard shows the final batch
+    st.session_state.active_job = None
+    st.session_state.finished_job = job_id
+    st.rerun()
+
+def job_summary():
+    """Outcome of the job that last finished in this session"""
+    job = get_job_manager().get(st.session_state.finished_job)
+    if job is None:
+        return
+    if job.status == 'completed':
+        st.success("✅ Analysis completed!")
+    elif job.status == 'cancelled':
+        st.info(f"⏹️ Cancelled after {job.done} of {job.total} file(s); resume it below")
+    else:
+        st.error(f"❌ Job stopped after {job.done} of {job.total} file(s): {job.error or job.status}")
+    for result in st.session_state.job_failures:
+        st.warning(f"⚠️ Could not analyze {result['filename']}: {result['error']}")
+    for name, reason in job.skipped:
+        st.warning(f"⚠️ Skipped {name}: {reason}")
+    if job.status == 'completed' and not st.session_state.get('job_celebrated'):
+        st.session_state.job_celebrated = True
+        st.balloons()
+
+def screening_jobs():
+    """Jobs that stopped before finishing, with a button to continue from their checkpoint"""
+    manager = get_job_manager()
+    resumable = [job for job in manager.list_jobs() if job.status in RESUMABLE_STATES]
+    if not resumable:
+        return
+    with st.expander(f"🗂️ Unfinished screening jobs ({len(resumable)})"):
+        for job in resumable:
+            col1, col2 = st.columns([3, 1])
+            started = datetime.fromtimestamp(job.created).strftime('%Y-%m-%d %H:%M')
+            col1.caption(f"{started} · {job.status} · {job.done}/{job.total} file(s) screened")
+            if col2.button("▶️ Resume", key=f"resume_{job.job_id}", use_container_width=True,
+                           disabled=st.session_state.active_job is not None):
+                if manager.resume(job.job_id):
+                    watch_job(job.job_id)
+                    st.rerun()
+
+@st.cache_resource
+def get_candidate_store():
+    """Candidate database shared by every session of this server"""
+    return CandidateStore()
+
+@st.cache_resource
+def get_similarity_index():
+    """Skill-vector index over the candidate database, shared by every session"""
+    return SimilarityIndex(store=get_candidate_store())
+
+def similar_candidates(candidate_id):
+    """Stored candidates with the closest skill profiles, with their similarity"""
+    index = get_similarity_index()
+    index.refresh()
+    neighbours = index.similar(candidate_id, k=SIMILAR_CANDIDATES)
+    results = get_candidate_store().fetch([neighbour_id for neighbour_id, _ in neighbours])
+    return list(zip(results, (similarity for _, similarity in neighbours)))
+
+def get_candidate_source():
+    """Index over the latest batch, or the persistent store for the full history"""
+    if st.session_state.get('candidate_view') == "All history":
+        return get_candidate_store()
+    return get_candidate_index()
+
+def get_candidate_index():
+    """Return the dashboard index, extended with any results appended since the last rerun"""
+    results = st.session_state.analyzed_resumes
+    index = st.session_state.get('candidate_index')
+    if index is None or index.results is not results:
+        index = CandidateIndex(results)
+        st.session_state.candidate_index = index
+    else:
+        index.refresh()
+    return index
+
+def get_shortlist():
+    """Pareto shortlist of the current candidate source, extended with new results"""
+    if st.session_state.get('candidate_view') == "All history":
+        shortlist = st.session_state.get('history_shortlist')
+        if shortlist is None:
+            shortlist = StoreShortlist(get_candidate_store())
+            st.session_state.history_shortlist = shortlist
+        else:
+            shortlist.refresh()
+        return shortlist
+    results = st.session_state.analyzed_resumes
+    shortlist = st.session_state.get('batch_shortlist')
+    if shortlist is None or shortlist.results is not results:
+        shortlist = ResultShortlist(results)
+        st.session_state.batch_shortlist = shortlist
+    else:
+        shortlist.refresh()
+    return shortlist
 
 def analytics_dashboard():
     st.markdown("### 📊 Analytics Dashboard")
     
-    if not st.session_state.analyzed_resumes:
+    source = get_candidate_source()
+    summary = source.summary()
+    
+    if not summary['total']:
         st.info("📭 No resumes analyzed yet. Please upload resumes in the 'Upload Resumes' tab.")
         return
     
     # Summary Metrics
     col1, col2, col3, col4 = st.columns(4)
     
-    total_candidates = len(st.session_state.analyzed_resumes)
-    avg_experience = sum(r['experience'] for r in st.session_state.analyzed_resumes) / total_candidates
-    
-    band_counts = {}
-    for resume in st.session_state.analyzed_resumes:
-        band = resume['band']
-        band_counts[band] = band_counts.get(band, 0) + 1
-    
-    premium_count = sum(1 for r in st.session_state.analyzed_resumes if len(r['premium_skills']) > 0)
+    total_candidates = summary['total']
+    avg_experience = summary['avg_experience']
+    band_counts = summary['band_counts']
+    premium_count = summary['premium_count']
     
     with col1:
         st.markdown(f"""
@@ -371,42 +559,58 @@ def analytics_dashboard():
         </div>
         """, unsafe_allow_html=True)
     
+    # Percentiles come from mergeable sketches (within 1%), not a scan of every row
+    percentiles = summary['percentiles']
+    score, experience = percentiles['domain_score'], percentiles['experience']
+    st.caption(f"📈 Domain score p50 {score[50]:.0f} · p90 {score[90]:.0f} | "
+               f"Experience p50 {experience[50]:.1f}y · p90 {experience[90]:.1f}y")
+    
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Candidate Cards
     st.markdown("### 👥 Candidate Details")
     
+    shortlisted = st.radio(
+        "Show",
+        options=LIST_OPTIONS,
+        horizontal=True,
+        key="candidate_list",
+        help="Shortlist: candidates no one else matches or beats on experience, "
+             "domain score, premium skills and every role's fit at once"
+    ) == "Shortlist"
+    if shortlisted:
+        source = get_shortlist()
+    
     # Filter options
-    col1, col2 = st.columns(2)
+    col1, col2, col3 = st.columns([2, 2, 1])
     with col1:
         filter_band = st.multiselect(
             "Filter by Band",
-            options=["5A", "5B", "4A", "4B", "4C"],
+            options=BANDS,
             default=[]
         )
     
     with col2:
         sort_by = st.selectbox(
             "Sort by",
-            options=["Experience (High to Low)", "Experience (Low to High)", "Domain Score", "Name"]
+            options=SORT_OPTIONS
         )
     
-    # Apply filters and sorting
-    filtered_resumes = st.session_state.analyzed_resumes
-    if filter_band:
-        filtered_resumes = [r for r in filtered_resumes if r['band'] in filter_band]
-    
-    if sort_by == "Experience (High to Low)":
-        filtered_resumes = sorted(filtered_resumes, key=lambda x: x['experience'], reverse=True)
-    elif sort_by == "Experience (Low to High)":
-        filtered_resumes = sorted(filtered_resumes, key=lambda x: x['experience'])
-    elif sort_by == "Domain Score":
-        filtered_resumes = sorted(filtered_resumes, key=lambda x: x['domain_score'], reverse=True)
-    else:
-        filtered_resumes = sorted(filtered_resumes, key=lambda x: x['name'])
+    # Apply filters and sorting from the cached index (or the database for history)
+    matching = source.count(filter_band)
+    page_count = max(1, -(-matching // PAGE_SIZE))
+    
+    with col3:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+    
+    offset = (page - 1) * PAGE_SIZE
+    page_resumes = source.page(filter_band, sort_by, offset=offset, limit=PAGE_SIZE)
+    if matching:
+        label = "shortlisted candidates" if shortlisted else "candidates"
+        st.caption(f"Showing {offset + 1}-{offset + len(page_resumes)} of {matching} {label}")
     
     # Display candidates
-    for resume in filtered_resumes:
+    for resume in page_resumes:
         display_candidate_card(resume)
 
 def _generate_suitability_html(suitability):
@@ -436,6 +640,31 @@ def display_candidate_card(resume):
             st.markdown(f"**{resume['band']}**")
             st.caption(resume['designation'])
 
+        # Earlier screenings of the same person, matched on hashed email/phone
+        if resume.get('candidate_id') is not None:
+            previous = get_candidate_store().previous_screenings(
+                resume['email'], resume['phone'], before_id=resume['candidate_id'], limit=PREVIOUS_SCREENINGS)
+            if previous:
+                last = previous[0]
+                times = f"{len(previous)}+" if len(previous) == PREVIOUS_SCREENINGS else len(previous)
+                st.caption(f"🔁 Screened {times} time(s) before. Last: {last['analysis_date'] or 'unknown date'} "
+                           f"({last['filename']}), band {last['band']}, score {last['domain_score']}/100 "
+                           f"({resume['domain_score'] - last['domain_score']:+d} now)")
+
+            # "More like this": neighbours by skill profile across the whole history
+            candidate_id = resume['candidate_id']
+            if st.button("🔍 Similar candidates", key=f"similar_{candidate_id}"):
+                st.session_state.similar_to = None if st.session_state.get('similar_to') == candidate_id \
+                    else candidate_id
+            if st.session_state.get('similar_to') == candidate_id:
+                neighbours = similar_candidates(candidate_id)
+                if not neighbours:
+                    st.caption("No comparable candidates screened yet")
+                for other, similarity in neighbours:
+                    st.caption(f"{similarity:.0%} · {other['name']} ({other['filename']}) · band {other['band']} · "
+                               f"{other['experience']} yrs · score {other['domain_score']}/100 · "
+                               f"{other['analysis_date'] or 'unknown date'}")
+
         # Metrics Section
         m1, m2, m3 = st.columns(3)
         with m1:
@@ -503,25 +732,62 @@ def display_candidate_card(resume):
                 for con in resume['cons']:
                      st.markdown(f"<span style='color: #dc2626; font-size: 14px;'>• {con}</span>", unsafe_allow_html=True)
 
+def export_rows(source):
+    """Every result of the source without internal fields, one at a time"""
+    for result in source.iter_results():
+        yield {key: value for key, value in result.items() if key not in EXPORT_HIDDEN_FIELDS}
+
+def write_excel_report(source, path):
+    """Stream the source's results into an .xlsx file, laid out like DataFrame.to_excel"""
+    # Streamed rows need every column up front; the first pass only collects keys
+    columns = list(dict.fromkeys(key for row in export_rows(source) for key in row))
+
+    from openpyxl import Workbook
+    # A write-only workbook flushes rows to disk instead of keeping them in memory
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sheet1")
+    sheet.append(columns)
+    for row in export_rows(source):
+        sheet.append([_excel_value(key, row.get(key)) for key in columns])
+    workbook.save(path)
+
+def _excel_value(key, value):
+    if key in ('procurement_skills', 'premium_skills'):
+        return ', '.join(value or [])
+    if isinstance(value, (list, dict)):
+        return str(value)
+    return value
+
+def write_json_report(source, path):
+    """Stream the source's results into a JSON array, formatted like json.dumps(indent=2)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        empty = True
+        for row in export_rows(source):
+            f.write('\n  ' if empty else ',\n  ')
+            f.write(json.dumps(row, indent=2).replace('\n', '\n  '))
+            empty = False
+        f.write(']' if empty else '\n]')
+
 def export_results():
     st.markdown("### 💾 Export Results")
     
-    if not st.session_state.analyzed_resumes:
+    source = get_candidate_source()
+    if not source.count():
         st.info("📭 No data to export. Please analyze some resumes first.")
         return
     
+    # pandas is only needed once there is something to preview
+    import pandas as pd
+    
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("#### 📊 Export to Excel")
         if st.button("📥 Download Excel Report", use_container_width=True):
-            df = pd.DataFrame(st.session_state.analyzed_resumes)
-            df['procurement_skills'] = df['procurement_skills'].apply(lambda x: ', '.join(x))
-            df['premium_skills'] = df['premium_skills'].apply(lambda x: ', '.join(x))
-            
             # Create Excel file
             excel_path = "resume_analysis_report.xlsx"
-            df.to_excel(excel_path, index=False)
+            write_excel_report(source, excel_path)
             
             with open(excel_path, 'rb') as f:
                 st.download_button(
@@ -535,19 +801,25 @@ def export_results():
     with col2:
         st.markdown("#### 📄 Export to JSON")
         if st.button("📥 Download JSON Report", use_container_width=True):
-            json_data = json.dumps(st.session_state.analyzed_resumes, indent=2)
-            st.download_button(
-                label="⬇️ Download",
-                data=json_data,
-                file_name=f"resume_screening_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json",
-                use_container_width=True
-            )
+            json_path = "resume_analysis_report.json"
+            write_json_report(source, json_path)
+            
+            with open(json_path, 'rb') as f:
+                st.download_button(
+                    label="⬇️ Download",
+                    data=f,
+                    file_name=f"resume_screening_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                    mime="application/json",
+                    use_container_width=True
+                )
     
     st.markdown("---")
     st.markdown("### 📋 Preview Data")
-    df_preview = pd.DataFrame(st.session_state.analyzed_resumes)
+    df_preview = pd.DataFrame(source.page(sort_by=SORT_OPTIONS[0], limit=PREVIEW_ROWS)).drop(
+        columns=list(EXPORT_HIDDEN_FIELDS), errors='ignore')
     st.dataframe(df_preview, use_container_width=True)
+    if source.count() > PREVIEW_ROWS:
+        st.caption(f"Showing the first {PREVIEW_ROWS} of {source.count()} candidates; exports include all of them.")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,107 @@
+"""
+Bulk ingestion benchmark: text-export rows vs file-based screening
+
+Extracts the sample resumes' texts, writes them as a CSV, JSON Lines and
+SQLite export of --documents rows, and compares documents per second of
+file-based screening (screen_iter over the DOCX bytes) with BulkScreener
+reading each export in chunks. Results must match screen_text exactly.
+
+Usage:
+    python benchmarks/bulk_ingest_benchmark.py --documents 2000 --min-speedup 5
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from bulk_ingest import BulkScreener  # noqa: E402
+from ingestion import TextExportIngest  # noqa: E402
+from resume_parser import ResumeParser  # noqa: E402
+from screening_pipeline import ScreeningPipeline, screen_iter  # noqa: E402
+
+
+def write_exports(directory, rows):
+    """The same rows as CSV, JSON Lines and a SQLite table"""
+    paths = {fmt: os.path.join(directory, f'export.{fmt}') for fmt in ('csv', 'jsonl', 'db')}
+    with open(paths['csv'], 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['candidate_id', 'text'])
+        writer.writerows(rows)
+    with open(paths['jsonl'], 'w', encoding='utf-8') as f:
+        for candidate_id, text in rows:
+            f.write(json.dumps({'candidate_id': candidate_id, 'text': text}) + '\n')
+    conn = sqlite3.connect(paths['db'])
+    conn.execute("CREATE TABLE resumes (candidate_id TEXT, text TEXT)")
+    conn.executemany("INSERT INTO resumes VALUES (?, ?)", rows)
+    conn.commit()
+    conn.close()
+    return paths
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark bulk text ingestion against file screening")
+    arg_parser.add_argument('--documents', type=int, default=2000)
+    arg_parser.add_argument('--file-documents', type=int, default=100,
+                            help="Documents screened the file-based way (slow, so fewer)")
+    arg_parser.add_argument('--chunk-size', type=int, default=500)
+    arg_parser.add_argument('--min-speedup', type=float, default=None,
+                            help="Fail if bulk ingestion is less than this many times faster")
+    args = arg_parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(REPO_ROOT, 'sample_resume_*.docx')))
+    if not paths:
+        print("❌ No sample resumes found; run generate_sample_resumes.py first")
+        sys.exit(1)
+    samples = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+        with open(path, 'rb') as f:
+            samples.append((data, ResumeParser.extract_text(f)))
+
+    sources = [(f"resume_{i:06d}.docx", samples[i % len(samples)][0]) for i in range(args.file_documents)]
+    start = time.perf_counter()
+    list(screen_iter(sources))
+    file_rate = args.file_documents / (time.perf_counter() - start)
+
+    rows = [(f"ats-{i:06d}", samples[i % len(samples)][1]) for i in range(args.documents)]
+    screener = BulkScreener()
+    expected = ScreeningPipeline().screen_text(rows[0][0], rows[0][1])
+
+    rates = {}
+    mismatches = 0
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for fmt, path in write_exports(tmp_dir, rows).items():
+            start = time.perf_counter()
+            screened = 0
+            for chunk_rows, results in screener.screen_export(TextExportIngest(path, chunk_size=args.chunk_size)):
+                if screened == 0:
+                    first = dict(results[0], analysis_date=expected['analysis_date'])
+                    mismatches += first != expected
+                screened += len(results)
+            rates[fmt] = screened / (time.perf_counter() - start)
+
+    print(f"📄 file-based screening: {file_rate:8.0f} docs/s ({args.file_documents} DOCX)")
+    for fmt, rate in rates.items():
+        print(f"⚡ bulk {fmt:<5} export:   {rate:8.0f} docs/s ({args.documents} rows, {rate / file_rate:.1f}x)")
+    print(f"🔍 results differing from screen_text: {mismatches}")
+
+    slowest = min(rates.values()) / file_rate
+    failed = mismatches > 0
+    if args.min_speedup is not None and slowest < args.min_speedup:
+        print(f"❌ bulk ingestion is only {slowest:.1f}x faster (budget {args.min_speedup}x)")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
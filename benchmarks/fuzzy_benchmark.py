@@ -0,0 +1,109 @@
+"""
+Fuzzy matching benchmark: throughput and typo recall vs exact matching
+
+Takes the sample resume texts, injects seeded typos (a dropped, swapped or
+replaced letter) into a share of their keyword words, and analyzes the
+result with exact and fuzzy SkillsAnalyzers. Reports per-document cost,
+the slowdown factor, and how many of the clean text's matches each mode
+still finds; optionally fails when the slowdown exceeds a budget.
+
+Usage:
+    python benchmarks/fuzzy_benchmark.py --documents 2000 --max-slowdown 3
+"""
+
+import argparse
+import glob
+import os
+import random
+import re
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from generate_sample_resumes import misspell  # noqa: E402
+from resume_parser import ResumeParser  # noqa: E402
+from skills_analyzer import SkillsAnalyzer  # noqa: E402
+
+
+def with_typos(text, keyword_words, rng, rate):
+    """Misspell roughly `rate` of the keyword words (5+ letters) in text"""
+    def replace(match):
+        word = match.group(0)
+        if word.lower() in keyword_words and len(word) >= 5 and rng.random() < rate:
+            return misspell(word, rng)
+        return word
+    return re.sub(r'[A-Za-z]+', replace, text)
+
+
+def timed(analyzer, documents):
+    start = time.perf_counter()
+    results = [analyzer.analyze(text, experience) for text, experience in documents]
+    return results, (time.perf_counter() - start) / len(documents)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark fuzzy vs exact skill matching")
+    arg_parser.add_argument('--documents', type=int, default=2000)
+    arg_parser.add_argument('--typo-rate', type=float, default=0.3)
+    arg_parser.add_argument('--max-slowdown', type=float, default=None,
+                            help="Fail if fuzzy analysis is more than this many times slower")
+    arg_parser.add_argument('--seed', type=int, default=7)
+    args = arg_parser.parse_args()
+
+    parser = ResumeParser()
+    samples = []
+    for path in sorted(glob.glob(os.path.join(REPO_ROOT, 'sample_resume_*.docx'))):
+        with open(path, 'rb') as f:
+            data = parser.parse(f)
+        samples.append((data['text'], data['experience']))
+    if not samples:
+        print("❌ No sample resumes found; run generate_sample_resumes.py first")
+        sys.exit(1)
+
+    exact = SkillsAnalyzer(fuzzy=False)
+    fuzzy = SkillsAnalyzer(fuzzy=True)
+    keyword_words = fuzzy.fuzzy_matcher.words
+
+    rng = random.Random(args.seed)
+    clean, typo = [], []
+    for i in range(args.documents):
+        text, experience = samples[i % len(samples)]
+        clean.append((text, experience))
+        typo.append((with_typos(text, keyword_words, rng, args.typo_rate), experience))
+
+    clean_results, _ = timed(exact, clean)
+    exact_results, exact_seconds = timed(exact, typo)
+    fuzzy_results, fuzzy_seconds = timed(fuzzy, typo)
+
+    def recall(results):
+        found = expected = 0
+        for reference, result in zip(clean_results, results):
+            wanted = set(reference['procurement_skills']) | set(reference['premium_skills'])
+            got = set(result['procurement_skills']) | set(result['premium_skills'])
+            expected += len(wanted)
+            found += len(wanted & got)
+        return found / expected if expected else 1.0
+
+    # Skills fuzzy mode adds on the clean text are false positives
+    fuzzy_clean, _ = timed(fuzzy, clean[:len(samples)])
+    false_positives = sum(
+        len((set(f['procurement_skills']) | set(f['premium_skills']))
+            - (set(c['procurement_skills']) | set(c['premium_skills'])))
+        for f, c in zip(fuzzy_clean, clean_results)
+    )
+
+    slowdown = fuzzy_seconds / exact_seconds
+    print(f"⚡ exact analysis:  {exact_seconds * 1e6:8.0f} µs/document")
+    print(f"🔤 fuzzy analysis:  {fuzzy_seconds * 1e6:8.0f} µs/document ({slowdown:.2f}x)")
+    print(f"🎯 skill recall on typo'd text: exact {recall(exact_results):.1%}, fuzzy {recall(fuzzy_results):.1%}")
+    print(f"🧪 extra skills found by fuzzy mode on the {len(samples)} clean samples: {false_positives}")
+
+    if args.max_slowdown is not None and slowdown > args.max_slowdown:
+        print(f"❌ fuzzy matching is {slowdown:.2f}x slower (budget {args.max_slowdown}x)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Memory benchmark: result dicts vs compact CandidateResults
+
+Screens the sample resumes once, then builds a population of distinct
+results from them (each one JSON round-tripped, so no strings are shared by
+accident, exactly like results arriving from worker processes) and measures
+the memory held by a list of dicts and by a list of CandidateResults.
+
+Usage:
+    python benchmarks/memory_benchmark.py --candidates 100000
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from candidate_result import CandidateResult  # noqa: E402
+from screening_pipeline import screen_iter  # noqa: E402
+
+
+def population(templates, n):
+    """Distinct result dicts with per-candidate names, contacts and files"""
+    for i in range(n):
+        result = json.loads(json.dumps(templates[i % len(templates)]))
+        result['filename'] = f"resume_{i:07d}.pdf"
+        result['name'] = f"Candidate {i:07d}"
+        result['email'] = f"candidate{i:07d}@example.com"
+        result['phone'] = f"+91 {90000 + i % 10000:05d} {i % 100000:05d}"
+        yield result
+
+
+def measure(build):
+    tracemalloc.start()
+    held = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return held, size
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Compare result dict and CandidateResult memory")
+    arg_parser.add_argument('--candidates', type=int, default=100000)
+    args = arg_parser.parse_args()
+
+    templates = list(screen_iter(sorted(glob.glob(os.path.join(REPO_ROOT, 'sample_resume_*.docx')))))
+    if not templates:
+        print("❌ No sample resumes found; run generate_sample_resumes.py first")
+        sys.exit(1)
+
+    dicts, dict_bytes = measure(lambda: list(population(templates, args.candidates)))
+    del dicts
+    compact, compact_bytes = measure(
+        lambda: [CandidateResult.from_dict(r) for r in population(templates, args.candidates)]
+    )
+
+    mismatches = sum(
+        1 for expected, result in zip(population(templates, 1000), compact) if result.to_dict() != expected
+    )
+
+    n = args.candidates
+    print(f"📦 {n} result dicts:       {dict_bytes / 2**20:8.1f} MiB ({dict_bytes / n:,.0f} B/candidate)")
+    print(f"🗜️  {n} CandidateResults:  {compact_bytes / 2**20:8.1f} MiB ({compact_bytes / n:,.0f} B/candidate)")
+    print(f"📉 reduction: {dict_bytes / compact_bytes:.1f}x")
+    print(f"🔍 round-trip mismatches in the first 1000: {mismatches}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
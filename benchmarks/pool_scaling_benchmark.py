@@ -0,0 +1,105 @@
+"""
+Screening pool scaling benchmark: documents per second by worker count
+
+Screens the same corpus of sample resumes on a ScreeningPool of 1, 2, 4...
+workers and reports docs/s, speedup over one worker and parallel efficiency
+(speedup divided by workers). Pool start-up and model loading happen in
+warm_up() and are not timed. Every run must produce the same results.
+
+Worker counts above the CPU count can only time-slice, so they are reported
+but not held to --min-efficiency.
+
+Usage:
+    python benchmarks/pool_scaling_benchmark.py --documents 400 --workers 1,2,4,8 --min-efficiency 0.7
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from screening_pipeline import NamedBytesIO  # noqa: E402
+from screening_pool import ScreeningPool  # noqa: E402
+
+
+def default_worker_counts():
+    """1, 2, 4... up to the CPU count (and at least 1 and 2)"""
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= max(cpus, 2):
+        counts.append(counts[-1] * 2)
+    if counts[-1] < cpus:
+        counts.append(cpus)
+    return counts
+
+
+def run(workers, sources):
+    """Screen every source on a warm pool; returns (docs/s, results)"""
+    with ScreeningPool(workers=workers) as pool:
+        pool.warm_up()
+        start = time.perf_counter()
+        results = list(pool.imap(NamedBytesIO(data, filename) for filename, data in sources))
+        elapsed = time.perf_counter() - start
+    return len(results) / elapsed, results
+
+
+def summary(results):
+    """What must not depend on the worker count"""
+    return [(r['filename'], r.get('band'), r.get('domain_score'), r.get('error')) for r in results]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark screening pool throughput by worker count")
+    arg_parser.add_argument('--documents', type=int, default=400)
+    arg_parser.add_argument('--workers', default=None,
+                            help="Comma-separated worker counts (default: 1, 2, 4... up to the CPU count)")
+    arg_parser.add_argument('--min-efficiency', type=float, default=None,
+                            help="Fail if speedup / workers drops below this for a count within the CPU count")
+    args = arg_parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(REPO_ROOT, 'sample_resume_*.docx')))
+    if not paths:
+        print("❌ No sample resumes found; run generate_sample_resumes.py first")
+        sys.exit(1)
+    samples = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            samples.append(f.read())
+    sources = [(f"resume_{i:06d}.docx", samples[i % len(samples)]) for i in range(args.documents)]
+
+    counts = [int(n) for n in args.workers.split(',')] if args.workers else default_worker_counts()
+    if 1 not in counts:
+        counts.insert(0, 1)
+    cpus = os.cpu_count() or 1
+
+    rates = {}
+    reference = None
+    mismatched = []
+    for workers in counts:
+        rates[workers], results = run(workers, sources)
+        if reference is None:
+            reference = summary(results)
+        elif summary(results) != reference:
+            mismatched.append(workers)
+
+    print(f"🖥️  {cpus} CPU(s), {args.documents} DOCX resumes")
+    failed = bool(mismatched)
+    for workers, rate in rates.items():
+        speedup = rate / rates[1]
+        efficiency = speedup / workers
+        note = "  (more workers than CPUs)" if workers > cpus else ""
+        print(f"⚙️  {workers:3d} worker(s): {rate:8.1f} docs/s  {speedup:5.2f}x  efficiency {efficiency:4.0%}{note}")
+        if args.min_efficiency is not None and workers <= cpus and efficiency < args.min_efficiency:
+            print(f"❌ efficiency at {workers} workers is {efficiency:.0%} (budget {args.min_efficiency:.0%})")
+            failed = True
+    if mismatched:
+        print(f"❌ results differ from one worker's at {', '.join(map(str, mismatched))} worker(s)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Pathological-input fuzz benchmark for the text extractors
+
+Feeds every extractor (sections, name, email, phone, stated experience,
+work-history dates, role count, keyword and fuzzy matching) generated
+garbage of the kind broken PDFs extract to: one giant line of digits,
+runs of dashes or dots, endless "word year" pairs, '@' storms, digit
+groups that almost look like phone numbers, plus seeded random noise.
+Each extractor is timed per input at several sizes and normalized to
+milliseconds per MB. Any extractor slower than --max-ms-per-mb fails the run,
+so a super-linear regex shows up as a budget failure instead of a hung
+screening worker.
+
+Most extractors only scan a bounded prefix (NAME/CONTACT/EXPERIENCE_SCAN_CHARS),
+and past that cap their ms/MB falls no matter how they scale. The default
+sizes therefore include inputs below every cap. Between the smallest size and
+the largest size an extractor still reads whole, ms/MB must not grow more than
+--max-growth times: a linear extractor stays flat, a quadratic one grows with
+the size ratio.
+
+Usage:
+    python benchmarks/regex_fuzz_benchmark.py --sizes-kb 1,16,48,192,1024 --max-ms-per-mb 2000 --max-growth 4
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from resume_parser import CONTACT_SCAN_CHARS, EXPERIENCE_SCAN_CHARS, NAME_SCAN_CHARS, ResumeParser  # noqa: E402
+from resume_sections import sectionize  # noqa: E402
+from skills_analyzer import SkillsAnalyzer  # noqa: E402
+
+
+# Characters each extractor reads at most (None: the whole input)
+SCAN_CAPS = {
+    'name': NAME_SCAN_CHARS,
+    'email': CONTACT_SCAN_CHARS,
+    'phone': CONTACT_SCAN_CHARS,
+    'experience': EXPERIENCE_SCAN_CHARS,
+    'work history dates': EXPERIENCE_SCAN_CHARS,
+}
+
+# Repeats per measurement; the fastest counts, which filters out scheduler noise
+REPEATS = 3
+
+
+def repeat(unit, size):
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+def pathological_inputs(size, seed):
+    """name -> generated text of about `size` characters"""
+    rng = random.Random(seed)
+    noise = ''.join(rng.choice(string.printable) for _ in range(size))
+    return {
+        'digits': repeat('1', size),
+        'decimal digits': repeat('1.', size),
+        'dashes': 'jan 2020 ' + repeat('-', size),
+        'one word': repeat('a', size),
+        'word year pairs': repeat('a 2020 ', size),
+        'open date ranges': repeat('jan 2020 - ', size),
+        'spaces': 'a' + repeat(' ', size),
+        'years without unit': repeat('12 + ', size),
+        'experience digits': 'experience: ' + repeat('9', size),
+        'at storm': repeat('a@', size),
+        'long local part': repeat('a', size) + '@example',
+        'dotted domain': 'a@' + repeat('a.', size),
+        'phone-ish digits': repeat('12345 ', size),
+        'country codes': repeat('+91-', size),
+        'random noise': noise,
+    }
+
+
+def extractors(parser, analyzer, fuzzy_analyzer):
+    """name -> callable(text)"""
+    return {
+        'sections': sectionize,
+        'name': lambda text: parser._extract_name(text),
+        'email': parser._extract_email,
+        'phone': parser._extract_phone,
+        'experience': parser._extract_experience,
+        'work history dates': parser._calculate_from_dates,
+        'features': analyzer.extract_features,
+        'fuzzy features': fuzzy_analyzer.extract_features,
+    }
+
+
+def ms_per_mb(function, text):
+    """Fastest of REPEATS runs, in milliseconds per MB of input"""
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000 / (len(text.encode('utf-8')) / 2**20)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Time extractors on pathological inputs")
+    arg_parser.add_argument('--sizes-kb', default='1,16,48,192,1024',
+                            help="Comma-separated sizes of the generated inputs")
+    arg_parser.add_argument('--max-ms-per-mb', type=float, default=2000,
+                            help="Fail if any extractor is slower than this on any input")
+    arg_parser.add_argument('--max-growth', type=float, default=4,
+                            help="Fail if ms/MB grows more than this factor over the sizes an extractor reads whole")
+    arg_parser.add_argument('--seed', type=int, default=7)
+    args = arg_parser.parse_args()
+
+    parser = ResumeParser()
+    # spaCy's cost is bounded by its own 500-character window; time the regex fallback
+    parser.nlp = None
+    analyzer = SkillsAnalyzer(fuzzy=False)
+    fuzzy_analyzer = SkillsAnalyzer(fuzzy=True)
+    functions = extractors(parser, analyzer, fuzzy_analyzer)
+    sizes = sorted(int(kb) * 1024 for kb in args.sizes_kb.split(','))
+
+    # (extractor, input) -> {size: ms/MB}
+    timings = {}
+    for size in sizes:
+        for input_name, text in pathological_inputs(size, args.seed).items():
+            for name, function in functions.items():
+                timings.setdefault((name, input_name), {})[size] = ms_per_mb(function, text)
+
+    print(f"{'input':<20}" + ''.join(f"{name:>20}" for name in functions) + f"   (ms/MB at {sizes[-1] // 1024} KB)")
+    for input_name in pathological_inputs(1, args.seed):
+        print(f"{input_name:<20}" + ''.join(f"{timings[name, input_name][sizes[-1]]:>17.0f} ms" for name in functions))
+
+    worst = {}
+    growth = {}
+    for (name, input_name), by_size in timings.items():
+        for size, value in by_size.items():
+            if value > worst.get(name, (0,))[0]:
+                worst[name] = (value, input_name, size)
+        cap = SCAN_CAPS.get(name)
+        whole = [size for size in sizes if cap is None or size <= cap]
+        if len(whole) > 1:
+            factor = by_size[whole[-1]] / by_size[whole[0]]
+            if factor > growth.get(name, (0,))[0]:
+                growth[name] = (factor, input_name, whole[0], whole[-1])
+
+    print()
+    for name, (value, input_name, size) in worst.items():
+        line = f"🐢 {name:<20} worst {value:8.0f} ms/MB on {input_name} ({size // 1024} KB)"
+        if name in growth:
+            factor, growth_input, small, large = growth[name]
+            line += f"; ms/MB x{factor:.1f} from {small // 1024} to {large // 1024} KB on {growth_input}"
+        print(line)
+
+    failed = False
+    for name, (value, input_name, size) in worst.items():
+        if value > args.max_ms_per_mb:
+            print(f"❌ {name} took {value:.0f} ms/MB on {input_name} at {size // 1024} KB "
+                  f"(budget {args.max_ms_per_mb:.0f} ms/MB)")
+            failed = True
+    for name, (factor, input_name, small, large) in growth.items():
+        if factor > args.max_growth:
+            print(f"❌ {name} ms/MB grew x{factor:.1f} from {small // 1024} to {large // 1024} KB on {input_name} "
+                  f"(budget x{args.max_growth:g})")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
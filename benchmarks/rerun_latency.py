@@ -0,0 +1,144 @@
+"""
+Rerun-latency benchmark: how long the app takes to respond to a click
+
+Every widget interaction reruns the whole script (CSS, sidebar, all three
+tabs), so with a large batch in session state the rerun, not the analysis,
+is what users wait on. This loads the app headlessly with Streamlit's
+AppTest at several batch sizes of synthetic results, drives the dashboard
+widgets (band filter, sort order, page, candidate view), and reports the
+median and worst rerun per interaction. Budgets make it usable as a CI gate.
+
+Usage:
+    python benchmarks/rerun_latency.py --sizes 100,1000,10000 --repeats 5 --max-rerun-ms 1500
+"""
+
+import argparse
+import glob
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from candidate_result import CandidateResult  # noqa: E402
+from memory_benchmark import population  # noqa: E402
+from screening_pipeline import screen_iter  # noqa: E402
+
+
+def _widget(widgets, label):
+    return next(widget for widget in widgets if widget.label == label)
+
+
+def _interactions(app_test):
+    """(name, action) pairs; each action changes one widget, rerun separately"""
+    bands = ['4A', '4C']
+    sort_options = _widget(app_test.selectbox, "Sort by").options
+    return [
+        ('filter band', lambda i: _widget(app_test.multiselect, "Filter by Band")
+            .set_value([bands[i % len(bands)]])),
+        ('clear filter', lambda i: _widget(app_test.multiselect, "Filter by Band").set_value([])),
+        ('sort', lambda i: _widget(app_test.selectbox, "Sort by")
+            .set_value(sort_options[(i + 1) % len(sort_options)])),
+        ('next page', lambda i: _widget(app_test.number_input, "Page").set_value(2 + i % 2)),
+        ('history view', lambda i: app_test.radio(key="candidate_view").set_value("All history")),
+        ('batch view', lambda i: app_test.radio(key="candidate_view").set_value("Latest batch")),
+    ]
+
+
+def _timed_run(app_test):
+    start = time.perf_counter()
+    app_test.run()
+    elapsed = (time.perf_counter() - start) * 1000
+    if app_test.exception:
+        raise RuntimeError(f"rerun raised: {[e.value for e in app_test.exception]}")
+    return elapsed
+
+
+def measure(templates, size, repeats):
+    """
+    Rerun latencies for one batch size
+
+    Args:
+        templates (list): Result dicts to clone into the batch
+        size (int): Number of results in session state
+        repeats (int): Reruns per interaction
+
+    Returns:
+        dict: {interaction: [milliseconds per rerun]}
+    """
+    from streamlit.testing.v1 import AppTest
+
+    app_test = AppTest.from_file(os.path.join(REPO_ROOT, 'app.py'), default_timeout=300)
+    app_test.session_state['analyzed_resumes'] = [
+        CandidateResult.from_dict(result) for result in population(templates, size)
+    ]
+    timings = {'first render': [_timed_run(app_test)]}
+    timings['idle rerun'] = [_timed_run(app_test) for _ in range(repeats)]
+    for name, action in _interactions(app_test):
+        timings[name] = []
+        for i in range(repeats):
+            action(i)
+            timings[name].append(_timed_run(app_test))
+    return timings
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Measure Streamlit rerun latency with large batches")
+    arg_parser.add_argument('--sizes', default='100,1000,10000',
+                            help="Comma-separated batch sizes to load into session state")
+    arg_parser.add_argument('--repeats', type=int, default=5)
+    arg_parser.add_argument('--max-rerun-ms', type=float, default=None,
+                            help="Fail if any interaction's median rerun takes longer")
+    arg_parser.add_argument('--max-first-render-ms', type=float, default=None,
+                            help="Fail if the first render with a loaded batch takes longer")
+    arg_parser.add_argument('--json', action='store_true', help="Print the raw JSON report")
+    args = arg_parser.parse_args()
+
+    templates = list(screen_iter(sorted(glob.glob(os.path.join(REPO_ROOT, 'sample_resume_*.docx')))))
+    if not templates:
+        print("❌ No sample resumes found; run generate_sample_resumes.py first")
+        sys.exit(1)
+
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # An empty scratch database and jobs directory, and no background imports skewing the timings
+        os.environ['RESUME_SCREENER_DB'] = os.path.join(tmp_dir, 'benchmark.db')
+        os.environ['RESUME_SCREENER_WARMUP'] = '0'
+        os.environ['RESUME_SCREENER_JOBS'] = os.path.join(tmp_dir, 'screening_jobs')
+        for size in (int(s) for s in args.sizes.split(',')):
+            timings = measure(templates, size, args.repeats)
+            report[size] = {
+                name: {'median_ms': statistics.median(values), 'max_ms': max(values)}
+                for name, values in timings.items()
+            }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for size, interactions in report.items():
+            print(f"🖱️  {size} results in session state")
+            for name, stats in interactions.items():
+                print(f"   ⏱️  {name:<13} median {stats['median_ms']:7.0f} ms   max {stats['max_ms']:7.0f} ms")
+
+    failures = []
+    for size, interactions in report.items():
+        for name, stats in interactions.items():
+            if name == 'first render':
+                budget = args.max_first_render_ms
+            else:
+                budget = args.max_rerun_ms
+            if budget is not None and stats['median_ms'] > budget:
+                failures.append(f"{name} with {size} results took {stats['median_ms']:.0f} ms "
+                                f"(budget {budget:.0f} ms)")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Re-scoring benchmark: vectorized population scoring vs per-candidate scoring
+
+Builds a synthetic population of feature records, re-scores it with
+VectorizedScorer and with SkillsAnalyzer.analyze_features one candidate at a
+time, and checks that both agree on a sample before reporting throughput.
+
+Usage:
+    python benchmarks/rescore_benchmark.py --candidates 100000 --check 2000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from feature_vectors import FeatureMatrix, VectorizedScorer  # noqa: E402
+from skills_analyzer import SkillsAnalyzer  # noqa: E402
+
+
+def synthetic_features(analyzer, n, seed=0):
+    """Random but plausible feature records (about one term in eight matched)"""
+    rng = random.Random(seed)
+    n_terms = len(analyzer.feature_terms)
+    records = []
+    for _ in range(n):
+        hits = 0
+        for i in range(n_terms):
+            if rng.random() < 0.12:
+                hits |= 1 << i
+        records.append({
+            'vocabulary': analyzer.vocabulary_id,
+            'hits': format(hits, 'x'),
+            'experience': rng.choice([0.0, 1.0, 2.0, 3.5, 5.0, 8.0, 12.0, 20.0]),
+            'num_roles': rng.randint(0, 8),
+            'word_count': rng.randint(50, 1500)
+        })
+    return records
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark vectorized re-scoring")
+    arg_parser.add_argument('--candidates', type=int, default=100000)
+    arg_parser.add_argument('--check', type=int, default=2000,
+                            help="Candidates compared against the per-candidate scorer")
+    arg_parser.add_argument('--weights', default=None,
+                            help="Comma-separated overrides, e.g. premium_skill_points=8,premium_skills_max=40")
+    args = arg_parser.parse_args()
+
+    weights = {}
+    if args.weights:
+        for item in args.weights.split(','):
+            key, value = item.split('=')
+            weights[key.strip()] = float(value)
+
+    analyzer = SkillsAnalyzer(weights)
+    scorer = VectorizedScorer(analyzer)
+    records = synthetic_features(analyzer, args.candidates)
+
+    start = time.perf_counter()
+    matrix = FeatureMatrix.from_features(records, analyzer)
+    packed = time.perf_counter()
+    scores = scorer.score(matrix)
+    scored = time.perf_counter()
+
+    sample = records[:args.check]
+    scalar_start = time.perf_counter()
+    expected = [analyzer.analyze_features(record) for record in sample]
+    scalar_seconds = time.perf_counter() - scalar_start
+
+    mismatches = 0
+    for i, analysis in enumerate(expected):
+        actual = scores.result(i)
+        if any(actual[key] != analysis[key] for key in actual):
+            mismatches += 1
+
+    per_candidate_us = scalar_seconds / max(1, len(sample)) * 1e6
+    print(f"📦 packed {len(records)} feature records in {(packed - start) * 1000:.0f} ms")
+    print(f"⚡ vectorized scoring:     {(scored - packed) * 1000:.0f} ms "
+          f"({(scored - packed) / len(records) * 1e6:.2f} µs/candidate)")
+    print(f"🐢 per-candidate scoring:  {per_candidate_us:.1f} µs/candidate "
+          f"(~{per_candidate_us * len(records) / 1000:.0f} ms for the population)")
+    print(f"🔍 checked {len(sample)} candidates: {mismatches} mismatches")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
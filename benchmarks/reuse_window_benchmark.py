@@ -0,0 +1,83 @@
+"""
+Re-upload window benchmark: sources read before screen_iter yields
+
+Feeds screen_iter a batch in which most or all documents are already known
+(a re-uploaded ZIP pack) and counts how many sources it has pulled when the
+first result comes out, and the most it ever reads ahead of what it has
+yielded. Both must stay bounded by MAX_PENDING_REUSED plus the backend's own
+read-ahead, not grow with the batch, or a re-upload gets no progress,
+checkpoints or cancel until the whole archive has been read.
+
+Usage:
+    python benchmarks/reuse_window_benchmark.py --documents 2000 --max-read-ahead 100
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from candidate_identity import content_fingerprint  # noqa: E402
+from screening_pipeline import MAX_PENDING_REUSED, ScreeningPipeline, screen_iter  # noqa: E402
+
+
+def measure(sources, pipeline, known):
+    """(sources read before the first yield, worst read-ahead, seconds to the first yield)"""
+    consumed = 0
+
+    def counted():
+        nonlocal consumed
+        for source in sources:
+            consumed += 1
+            yield source
+
+    start = time.perf_counter()
+    first = first_seconds = None
+    worst = 0
+    for yielded, _ in enumerate(screen_iter(counted(), pipeline=pipeline, known=known), 1):
+        if first is None:
+            first, first_seconds = consumed, time.perf_counter() - start
+        worst = max(worst, consumed - yielded)
+    return first, worst, first_seconds
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Measure screen_iter's read-ahead on re-uploaded batches")
+    arg_parser.add_argument('--documents', type=int, default=2000)
+    arg_parser.add_argument('--max-read-ahead', type=int, default=2 * MAX_PENDING_REUSED,
+                            help="Fail if more sources than this are read ahead of the results")
+    args = arg_parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(REPO_ROOT, 'sample_resume_*.docx')))
+    if not paths:
+        print("❌ No sample resumes found; run generate_sample_resumes.py first")
+        sys.exit(1)
+    samples = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            samples.append(f.read())
+
+    pipeline = ScreeningPipeline()
+    earlier = {content_fingerprint(data): pipeline.screen_text('earlier.docx', 'earlier') for data in samples}
+    # Every sample but the first is known, so one document in len(samples) is screened
+    partly = dict(earlier)
+    del partly[content_fingerprint(samples[0])]
+
+    sources = [(f"resume_{i:06d}.docx", samples[i % len(samples)]) for i in range(args.documents)]
+    failed = False
+    for label, known in (("all known", earlier.get), ("mostly known", partly.get)):
+        first, worst, seconds = measure(sources, pipeline, known)
+        print(f"📦 {label:<13} {args.documents} sources: first result after {first} read "
+              f"({seconds * 1000:.1f} ms), at most {worst} read ahead")
+        if worst > args.max_read_ahead:
+            print(f"❌ {label}: read {worst} sources ahead of the results (budget {args.max_read_ahead})")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
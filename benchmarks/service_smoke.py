@@ -0,0 +1,152 @@
+"""
+Screening service smoke test on localhost
+
+Starts ScreeningService in-process on a free port with a tiny queue and
+connection cap, then checks each behaviour over real sockets:
+/healthz, /readyz once the workers warmed up, /screen and /screen/batch
+with a sample resume, 429 when the queue is full, 413 for a batch that
+could never fit, 400 for a malformed Content-Length, 503 when every
+connection slot is taken, and 408 for a connection that never sends its
+headers. Exits 1 if any check fails.
+
+Usage:
+    python benchmarks/service_smoke.py --ready-timeout 120
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import os
+import sys
+import time
+import uuid
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from screening_service import ScreeningService  # noqa: E402
+
+QUEUE_SIZE = 2
+MAX_CONNECTIONS = 4
+HEADER_TIMEOUT = 1.0
+
+
+async def request(port, method, path, body=b'', headers=None):
+    """Send one raw HTTP request; returns (status, JSON payload)"""
+    headers = dict(headers or {})
+    if method == 'POST' and 'Content-Length' not in headers:
+        headers['Content-Length'] = str(len(body))
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    head = f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+    head += ''.join(f"{key}: {value}\r\n" for key, value in headers.items())
+    writer.write(head.encode('latin-1') + b"\r\n" + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    status_line, _, rest = response.partition(b"\r\n")
+    payload = rest.partition(b"\r\n\r\n")[2]
+    return int(status_line.split()[1]), json.loads(payload or b'null')
+
+
+def multipart(documents):
+    """multipart/form-data body and content type for (filename, bytes) pairs"""
+    boundary = uuid.uuid4().hex
+    body = b''
+    for filename, data in documents:
+        body += (f"--{boundary}\r\nContent-Disposition: form-data; name=\"files\"; filename=\"{filename}\"\r\n"
+                 f"Content-Type: application/octet-stream\r\n\r\n").encode('latin-1') + data + b"\r\n"
+    body += f"--{boundary}--\r\n".encode('latin-1')
+    return body, f"multipart/form-data; boundary={boundary}"
+
+
+async def run_checks(sample, ready_timeout):
+    service = ScreeningService(workers=1, queue_size=QUEUE_SIZE, max_connections=MAX_CONNECTIONS,
+                               header_timeout=HEADER_TIMEOUT)
+    _, port = await service.start('127.0.0.1', 0)
+    server = asyncio.create_task(service.serve_forever())
+    checks = []
+
+    def check(name, ok, detail=''):
+        checks.append(ok)
+        print(f"{'✅' if ok else '❌'} {name}{f' ({detail})' if detail else ''}")
+
+    try:
+        status, _ = await request(port, 'GET', '/healthz')
+        check("healthz answers 200", status == 200, status)
+
+        deadline = time.monotonic() + ready_timeout
+        status = payload = None
+        while time.monotonic() < deadline:
+            status, payload = await request(port, 'GET', '/readyz')
+            if status == 200:
+                break
+            await asyncio.sleep(0.5)
+        check("readyz turns 200 once every worker warmed up",
+              status == 200 and payload.get('workers') == service.workers, payload)
+
+        status, result = await request(port, 'POST', '/screen?filename=resume.docx', sample)
+        check("/screen returns a result", status == 200 and 'band' in (result or {}), status)
+
+        body, content_type = multipart([('a.docx', sample), ('b.docx', sample)])
+        status, result = await request(port, 'POST', '/screen/batch', body, {'Content-Type': content_type})
+        check("/screen/batch returns every result", status == 200 and (result or {}).get('count') == 2, status)
+
+        body, content_type = multipart([(f'{i}.docx', sample) for i in range(QUEUE_SIZE + 1)])
+        status, _ = await request(port, 'POST', '/screen/batch', body, {'Content-Type': content_type})
+        check("a batch larger than the queue gets 413", status == 413, status)
+
+        # Batches that each fill the queue, sent at once: all but the first find it full
+        body, content_type = multipart([(f'{i}.docx', sample) for i in range(QUEUE_SIZE)])
+        responses = await asyncio.gather(*[
+            request(port, 'POST', '/screen/batch', body, {'Content-Type': content_type})
+            for _ in range(MAX_CONNECTIONS - 1)
+        ])
+        statuses = sorted(status for status, _ in responses)
+        check("a full queue gets 429", 200 in statuses and 429 in statuses, statuses)
+
+        for length in ('abc', '-5'):
+            status, _ = await request(port, 'POST', '/screen?filename=a.docx', b'', {'Content-Length': length})
+            check(f"Content-Length {length!r} gets 400", status == 400, status)
+
+        # Idle connections that never send a request hold every slot
+        idle = [await asyncio.open_connection('127.0.0.1', port) for _ in range(MAX_CONNECTIONS)]
+        await asyncio.sleep(0.1)
+        status, _ = await request(port, 'GET', '/healthz')
+        check("connections over the cap get 503", status == 503, status)
+        for _, writer in idle:
+            writer.close()
+        # Let the service see them go before it shuts down
+        await asyncio.sleep(0.2)
+
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        started = time.monotonic()
+        response = await reader.read()
+        writer.close()
+        status = int(response.split()[1]) if response else None
+        check("a connection that sends no headers gets 408", status == 408,
+              f"{status} after {time.monotonic() - started:.1f}s")
+    finally:
+        server.cancel()
+        await service.stop()
+    return all(checks)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Smoke-test the screening service on localhost")
+    arg_parser.add_argument('--ready-timeout', type=float, default=120,
+                            help="Seconds to wait for /readyz")
+    args = arg_parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(REPO_ROOT, 'sample_resume_*.docx')))
+    if not paths:
+        print("❌ No sample resumes found; run generate_sample_resumes.py first")
+        sys.exit(1)
+    with open(paths[0], 'rb') as f:
+        sample = f.read()
+
+    sys.exit(0 if asyncio.run(run_checks(sample, args.ready_timeout)) else 1)
+
+
+if __name__ == "__main__":
+    main()
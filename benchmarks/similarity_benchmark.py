@@ -0,0 +1,105 @@
+"""
+Similarity search benchmark: LSH query latency and recall vs an exact scan
+
+Builds seeded synthetic feature records around a few hundred skill
+profiles (each candidate drops and picks up some terms of its profile),
+indexes them, and times "similar candidates" queries with the LSH buckets
+and with an exact scan of every vector. Recall is the share of the exact
+top k the LSH lookup also returns. With --batch-size the candidates are
+added in batches, as refresh() does while results keep arriving.
+
+Usage:
+    python benchmarks/similarity_benchmark.py --candidates 100000 --max-query-ms 20
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from similarity_index import SimilarityIndex  # noqa: E402
+from skills_analyzer import SkillsAnalyzer  # noqa: E402
+
+
+def synthetic_features(analyzer, n, profiles, seed):
+    """Feature records clustered around `profiles` random skill profiles"""
+    rng = random.Random(seed)
+    n_terms = len(analyzer.feature_terms)
+    centers = [rng.sample(range(n_terms), rng.randint(8, 30)) for _ in range(profiles)]
+    for _ in range(n):
+        terms = {t for t in rng.choice(centers) if rng.random() > 0.2}
+        terms.update(rng.randrange(n_terms) for _ in range(rng.randint(0, 4)))
+        yield {
+            'vocabulary': analyzer.vocabulary_id,
+            'hits': format(sum(1 << t for t in terms), 'x'),
+            'experience': round(rng.uniform(0, 20), 1),
+            'num_roles': rng.randint(1, 6),
+            'word_count': rng.randint(200, 1500)
+        }
+
+
+def timed_queries(index, ids, k, exact):
+    timings, results = [], []
+    for candidate_id in ids:
+        start = time.perf_counter()
+        results.append(index.similar(candidate_id, k=k, exact=exact))
+        timings.append((time.perf_counter() - start) * 1000)
+    return results, timings
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark candidate similarity search")
+    arg_parser.add_argument('--candidates', type=int, default=100000)
+    arg_parser.add_argument('--profiles', type=int, default=300)
+    arg_parser.add_argument('--queries', type=int, default=200)
+    arg_parser.add_argument('-k', type=int, default=10)
+    arg_parser.add_argument('--max-query-ms', type=float, default=None,
+                            help="Fail if the median LSH query takes longer")
+    arg_parser.add_argument('--batch-size', type=int, default=None,
+                            help="Add candidates in batches of this size (default: all at once)")
+    arg_parser.add_argument('--seed', type=int, default=7)
+    args = arg_parser.parse_args()
+
+    analyzer = SkillsAnalyzer()
+    features = list(synthetic_features(analyzer, args.candidates, args.profiles, args.seed))
+    ids = list(range(1, args.candidates + 1))
+
+    index = SimilarityIndex(analyzer=analyzer)
+    start = time.perf_counter()
+    batch = args.batch_size or len(ids)
+    for offset in range(0, len(ids), batch):
+        index.add(ids[offset:offset + batch], features[offset:offset + batch])
+    build_ms = (time.perf_counter() - start) * 1000
+
+    query_ids = random.Random(args.seed).sample(ids, args.queries)
+    approximate, lsh_ms = timed_queries(index, query_ids, args.k, exact=False)
+    reference, exact_ms = timed_queries(index, query_ids, args.k, exact=True)
+
+    # Ties at the k-th similarity make several neighbour sets equally right
+    hits = total = 0
+    for found, expected in zip(approximate, reference):
+        threshold = expected[-1][1] - 1e-6
+        hits += sum(1 for _, similarity in found if similarity >= threshold)
+        total += len(expected)
+    recall = hits / total if total else 1.0
+
+    vector_mb = index.vectors.nbytes / 2**20
+    print(f"🧮 {len(index)} vectors of {index.vectors.shape[1]} terms: {vector_mb:.1f} MiB float32, "
+          f"built in {build_ms:.0f} ms"
+          f"{f' ({-(-len(ids) // batch)} batches)' if args.batch_size else ''}")
+    print(f"⚡ LSH query:   median {statistics.median(lsh_ms):6.2f} ms   max {max(lsh_ms):6.2f} ms")
+    print(f"🐢 exact scan:  median {statistics.median(exact_ms):6.2f} ms   max {max(exact_ms):6.2f} ms")
+    print(f"🎯 recall@{args.k} vs exact: {recall:.1%}")
+
+    if args.max_query_ms is not None and statistics.median(lsh_ms) > args.max_query_ms:
+        print(f"❌ median query took {statistics.median(lsh_ms):.1f} ms (budget {args.max_query_ms:.0f} ms)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Shortlist benchmark: Pareto frontier build and incremental-append cost
+
+Builds a population of CandidateResults from the sample resumes with seeded,
+varied experience, domain scores, premium skills and role fits, then times
+building the shortlist in one go and following the list as it
+grows batch by batch (what the dashboard does while a job streams in). The
+frontier of a sample is checked against an all-pairs comparison.
+
+Usage:
+    python benchmarks/skyline_benchmark.py --candidates 100000 --batch-size 1000 --max-build-ms 1000
+"""
+
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from candidate_result import CandidateResult, FIT_LEVELS  # noqa: E402
+from memory_benchmark import population  # noqa: E402
+from screening_pipeline import screen_iter  # noqa: E402
+from skyline import ResultShortlist, criteria, fit_roles  # noqa: E402
+
+
+def varied(templates, n, seed):
+    """Results whose shortlist criteria spread like a real candidate pool"""
+    rng = random.Random(seed)
+    premium = sorted({skill for t in templates for skill in t['premium_skills']})
+    for result in population(templates, n):
+        result['experience'] = round(max(0.0, result['experience'] + rng.uniform(-2, 2)), 1)
+        result['domain_score'] = max(0, min(100, int(rng.gauss(result['domain_score'], 12))))
+        result['premium_skills'] = sorted(rng.sample(premium, rng.randint(0, len(premium))))
+        for data in result['suitability'].values():
+            data['fit'] = rng.choice(FIT_LEVELS)
+        yield CandidateResult.from_dict(result)
+
+
+def all_pairs(results):
+    """Reference shortlist positions: compare every candidate with every other"""
+    vectors = [(fit_roles(result), criteria(result)) for result in results]
+    return [
+        i for i, (roles, v) in enumerate(vectors)
+        if not any(r == roles and w != v and all(x >= y for x, y in zip(w, v)) for r, w in vectors)
+    ]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark the Pareto shortlist")
+    arg_parser.add_argument('--candidates', type=int, default=100000)
+    arg_parser.add_argument('--batch-size', type=int, default=1000)
+    arg_parser.add_argument('--check', type=int, default=2000,
+                            help="Candidates compared against the all-pairs reference")
+    arg_parser.add_argument('--max-build-ms', type=float, default=None,
+                            help="Fail if building the shortlist takes longer")
+    arg_parser.add_argument('--seed', type=int, default=7)
+    args = arg_parser.parse_args()
+
+    templates = list(screen_iter(sorted(glob.glob(os.path.join(REPO_ROOT, 'sample_resume_*.docx')))))
+    if not templates:
+        print("❌ No sample resumes found; run generate_sample_resumes.py first")
+        sys.exit(1)
+    results = list(varied(templates, args.candidates, args.seed))
+
+    start = time.perf_counter()
+    shortlist = ResultShortlist(results)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    growing = []
+    incremental = ResultShortlist(growing)
+    append_ms = []
+    for i in range(0, len(results), args.batch_size):
+        growing.extend(results[i:i + args.batch_size])
+        start = time.perf_counter()
+        incremental.refresh()
+        append_ms.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    shortlist.page(sort_by="Domain Score", limit=20)
+    page_ms = (time.perf_counter() - start) * 1000
+
+    sample = results[:args.check]
+    correct = ResultShortlist(sample).keys() == all_pairs(sample)
+    consistent = incremental.keys() == shortlist.keys()
+
+    n = args.candidates
+    print(f"⭐ {shortlist.count()} of {n} candidates shortlisted {shortlist.band_counts()}")
+    print(f"🏗️  build:  {build_ms:8.1f} ms")
+    print(f"➕ append: {sum(append_ms) / len(append_ms):8.2f} ms per {args.batch_size} (max {max(append_ms):.2f} ms)")
+    print(f"📄 page:   {page_ms:8.2f} ms")
+    print(f"🔍 matches all-pairs on {len(sample)}: {correct}; incremental equals one-shot: {consistent}")
+
+    failed = not (correct and consistent)
+    if args.max_build_ms is not None and build_ms > args.max_build_ms:
+        print(f"❌ building the shortlist took {build_ms:.0f} ms (budget {args.max_build_ms:.0f} ms)")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
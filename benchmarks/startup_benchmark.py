@@ -0,0 +1,150 @@
+"""
+Startup benchmark: import time and time to first render of the Streamlit app
+
+Every measurement runs in a fresh interpreter so it reflects a container
+cold start. Reports medians over several runs and optionally fails when a
+budget is exceeded, so it can gate CI.
+
+Usage:
+    python benchmarks/startup_benchmark.py --runs 5 --max-import-ms 1500 --max-render-ms 3000
+"""
+
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not be imported just to paint the first page
+HEAVY_MODULES = ['pandas', 'numpy', 'spacy', 'PyPDF2', 'docx']
+
+IMPORT_SNIPPET = """
+import importlib, json, sys, time
+start = time.perf_counter()
+import streamlit
+streamlit_done = time.perf_counter()
+for module in %r:
+    importlib.import_module(module)
+end = time.perf_counter()
+print(json.dumps({
+    'streamlit_ms': (streamlit_done - start) * 1000,
+    'app_modules_ms': (end - streamlit_done) * 1000,
+    'heavy_loaded': [m for m in %r if m in sys.modules]
+}))
+"""
+
+RENDER_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+app_test = AppTest.from_file('app.py', default_timeout=120)
+loaded = time.perf_counter()
+app_test.run()
+end = time.perf_counter()
+print(json.dumps({
+    'first_render_ms': (end - loaded) * 1000,
+    'total_ms': (end - start) * 1000,
+    'exception': [str(e.value) for e in app_test.exception],
+    'heavy_loaded': [m for m in %r if m in sys.modules]
+}))
+""" % HEAVY_MODULES
+
+
+def app_modules():
+    """Modules app.py imports at the top level, other than streamlit, in import order"""
+    with open(os.path.join(REPO_ROOT, 'app.py'), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            names = [node.module]
+        else:
+            continue
+        modules.extend(name for name in names if name != 'streamlit' and name not in modules)
+    return modules
+
+
+def _run_snippet(snippet, env):
+    completed = subprocess.run(
+        [sys.executable, '-c', snippet], cwd=REPO_ROOT, env=env,
+        capture_output=True, text=True, check=True
+    )
+    # Streamlit may log warnings to stdout in bare mode; the JSON is the last line
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run_benchmark(runs=5):
+    """
+    Measure cold import and first-render times
+
+    Returns:
+        dict: Median timings and the heavy modules loaded at startup
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        env = dict(os.environ)
+        env['RESUME_SCREENER_WARMUP'] = '0'
+        env['RESUME_SCREENER_DB'] = os.path.join(tmp_dir, 'benchmark.db')
+        # The first render builds the job manager, which creates its jobs directory
+        env['RESUME_SCREENER_JOBS'] = os.path.join(tmp_dir, 'screening_jobs')
+
+        import_snippet = IMPORT_SNIPPET % (app_modules(), HEAVY_MODULES)
+        imports = [_run_snippet(import_snippet, env) for _ in range(runs)]
+        renders = [_run_snippet(RENDER_SNIPPET, env) for _ in range(runs)]
+
+    return {
+        'runs': runs,
+        'streamlit_import_ms': statistics.median(r['streamlit_ms'] for r in imports),
+        'app_modules_import_ms': statistics.median(r['app_modules_ms'] for r in imports),
+        'first_render_ms': statistics.median(r['first_render_ms'] for r in renders),
+        'cold_start_total_ms': statistics.median(r['total_ms'] for r in renders),
+        'heavy_loaded_on_import': imports[-1]['heavy_loaded'],
+        'heavy_loaded_on_first_render': renders[-1]['heavy_loaded'],
+        'render_exceptions': renders[-1]['exception']
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Measure app import time and time to first render")
+    arg_parser.add_argument('--runs', type=int, default=5)
+    arg_parser.add_argument('--max-import-ms', type=float, default=None,
+                            help="Fail if importing streamlit plus the app modules takes longer")
+    arg_parser.add_argument('--max-render-ms', type=float, default=None,
+                            help="Fail if the cold start (import + first render) takes longer")
+    arg_parser.add_argument('--json', action='store_true', help="Print the raw JSON report")
+    args = arg_parser.parse_args()
+
+    report = run_benchmark(args.runs)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"⏱️  streamlit import:      {report['streamlit_import_ms']:.0f} ms")
+        print(f"⏱️  app modules import:    {report['app_modules_import_ms']:.0f} ms")
+        print(f"⏱️  first render:          {report['first_render_ms']:.0f} ms")
+        print(f"⏱️  cold start total:      {report['cold_start_total_ms']:.0f} ms")
+        print(f"📦 heavy modules at import: {report['heavy_loaded_on_import'] or 'none'}")
+        print(f"📦 heavy modules at render: {report['heavy_loaded_on_first_render'] or 'none'}")
+
+    failures = []
+    if report['render_exceptions']:
+        failures.append(f"first render raised: {report['render_exceptions']}")
+    import_ms = report['streamlit_import_ms'] + report['app_modules_import_ms']
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        failures.append(f"import took {import_ms:.0f} ms (budget {args.max_import_ms:.0f} ms)")
+    if args.max_render_ms is not None and report['cold_start_total_ms'] > args.max_render_ms:
+        failures.append(f"cold start took {report['cold_start_total_ms']:.0f} ms "
+                        f"(budget {args.max_render_ms:.0f} ms)")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Bulk ingestion of pre-extracted resume texts (CSV, JSON Lines or SQLite)
+
+When the ATS can already export resume text, rebuilding a PDF/DOCX only to
+extract the text again wastes most of the pipeline's time. This screens the
+exported rows directly: texts are read in chunks (see TextExportIngest), the
+text-level stages run per document (sections, contact details, experience,
+keyword matching) with spaCy's name recognition batched over the chunk, and
+everything after matching runs once per chunk as array operations: band
+classification, scoring and role fit with VectorizedScorer, and skill names
+through term-to-skill membership matrices.
+
+Results are identical to ScreeningPipeline.screen_text on the same text.
+
+Usage:
+    python bulk_ingest.py export.csv --db candidates.db
+    python bulk_ingest.py export.db --table resumes --id-column id --output results.jsonl
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime
+
+import numpy as np
+
+from band_classifier import BandClassifier
+from feature_vectors import FeatureMatrix, VectorizedScorer
+from ingestion import TextExportIngest
+from resume_parser import ResumeParser
+from skills_analyzer import SkillsAnalyzer
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+class BulkScreener:
+    """
+    Screen chunks of (candidate id, text) rows with per-chunk vectorized scoring
+    """
+
+    def __init__(self, analyzer=None, corpus=None):
+        """
+        Args:
+            analyzer (SkillsAnalyzer): Vocabulary and weights to score with
+            corpus (TextCorpus): Append every text here and record its `corpus_id`
+        """
+        self.corpus = corpus
+        self.parser = ResumeParser()
+        self.analyzer = analyzer or SkillsAnalyzer()
+        self.scorer = VectorizedScorer(self.analyzer)
+
+        # Bands by lower experience bound, as BandClassifier walks them
+        self.bands = BandClassifier().band_mapping
+        self._band_bounds = np.array([info['min_exp'] for info in self.bands[1:]], dtype=np.float64)
+
+        # Skill display names are formatted once per vocabulary, not per candidate
+        terms = {term: i for i, term in enumerate(self.scorer.terms)}
+        procurement = {
+            keyword: self.analyzer._format_skill_name(keyword)
+            for keywords in self.analyzer.procurement_keywords.values() for keyword in keywords
+        }
+        self.procurement_names = sorted(set(procurement.values()))
+        self._procurement_membership = np.zeros((len(terms), len(self.procurement_names)), dtype=np.float32)
+        for keyword, name in procurement.items():
+            self._procurement_membership[terms[keyword], self.procurement_names.index(name)] = 1
+        # premium_membership columns follow premium_skills_keywords; list them by display name
+        categories = [self.analyzer._get_premium_category_name(c) for c in self.analyzer.premium_skills_keywords]
+        self._premium_order = sorted(range(len(categories)), key=categories.__getitem__)
+        self.premium_names = [categories[c] for c in self._premium_order]
+
+    def screen_chunk(self, rows):
+        """
+        Screen one chunk of exported texts
+
+        Args:
+            rows (list): (candidate id, text) pairs; the id becomes the result's filename
+
+        Returns:
+            list: Result dicts in row order, as ScreeningPipeline.screen_text builds them
+        """
+        if not rows:
+            return []
+        texts = [text for _, text in rows]
+        parsed = self.parser.parse_texts(texts)
+        features = [
+            self.analyzer.extract_features(data['text'], data['experience'], sections=data['sections'])
+            for data in parsed
+        ]
+
+        matrix = FeatureMatrix.from_features(features, self.analyzer)
+        scores = self.scorer.score(matrix)
+        band_index = np.searchsorted(self._band_bounds, np.maximum(matrix.experience, 0), side='right')
+        procurement = (matrix.hits.astype(np.float32) @ self._procurement_membership) > 0
+        premium = scores.premium[:, self._premium_order]
+        analysis_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        results = []
+        for i, ((candidate_id, text), data) in enumerate(zip(rows, parsed)):
+            band = self.bands[band_index[i]]
+            analysis = scores.result(i)
+            result = {
+                'filename': candidate_id,
+                'name': data.get('name', 'Unknown'),
+                'email': data.get('email', 'Not found'),
+                'phone': data.get('phone', 'Not found'),
+                'experience': data['experience'],
+                'band': band['band'],
+                'designation': band['designation'],
+                'procurement_skills': [self.procurement_names[j] for j in np.flatnonzero(procurement[i])],
+                'premium_skills': [self.premium_names[j] for j in np.flatnonzero(premium[i])],
+                'domain_score': analysis['domain_score'],
+                'score_breakdown': analysis['score_breakdown'],
+                'suitability': analysis['suitability'],
+                'best_fit_role': analysis['best_fit_role'],
+                'pros': analysis['pros'],
+                'cons': analysis['cons'],
+                'features': features[i],
+                'analysis_date': analysis_date
+            }
+            if self.corpus is not None:
+                result['corpus_id'] = self.corpus.append(text)
+            results.append(result)
+        return results
+
+    def screen_export(self, ingest):
+        """
+        Screen every chunk of an export lazily
+
+        Args:
+            ingest (TextExportIngest): Export to read
+
+        Yields:
+            tuple: (chunk rows, chunk results)
+        """
+        for rows in ingest:
+            yield rows, self.screen_chunk(rows)
+
+
+def main():
+    """Screen an ATS text export into the candidate database and/or a JSONL file"""
+    from candidate_store import CandidateStore
+
+    arg_parser = argparse.ArgumentParser(description="Bulk-screen pre-extracted resume texts")
+    arg_parser.add_argument('export', help="CSV, JSON Lines or SQLite export with candidate ids and texts")
+    arg_parser.add_argument('--format', choices=['csv', 'jsonl', 'sqlite'], default=None,
+                            help="Export format (default: from the file extension)")
+    arg_parser.add_argument('--id-column', default='candidate_id')
+    arg_parser.add_argument('--text-column', default='text')
+    arg_parser.add_argument('--table', default='resumes', help="Table of a SQLite export")
+    arg_parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    arg_parser.add_argument('--db', default=None, help="Store results in this candidate database")
+    arg_parser.add_argument('--output', default=None, help="Write results to this JSONL file")
+    args = arg_parser.parse_args()
+
+    if not args.db and not args.output:
+        arg_parser.error("give --db and/or --output")
+
+    ingest = TextExportIngest(args.export, format=args.format, id_column=args.id_column,
+                              text_column=args.text_column, table=args.table, chunk_size=args.chunk_size)
+    store = CandidateStore(args.db) if args.db else None
+    screener = BulkScreener(corpus=store.corpus if store is not None else None)
+    output = open(args.output, 'w', encoding='utf-8') if args.output else None
+
+    screened = 0
+    start = time.perf_counter()
+    try:
+        for rows, results in screener.screen_export(ingest):
+            if store is not None:
+                # The text is passed along so the store indexes it without re-reading the corpus
+                store.add_many([dict(result, text=text) for result, (_, text) in zip(results, rows)])
+            if output is not None:
+                for result in results:
+                    output.write(json.dumps(result) + '\n')
+            screened += len(results)
+            elapsed = time.perf_counter() - start
+            print(f"📄 {screened} screened ({screened / elapsed:.0f} docs/s)")
+    finally:
+        if output is not None:
+            output.close()
+        if store is not None:
+            store.close()
+
+    for name, reason in ingest.skipped:
+        print(f"⚠️ Skipped {name}: {reason}")
+    print(f"✅ Screened {screened} resume(s) in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Candidate identity keys and document fingerprints
+
+The same person comes back under different filenames, across requisitions.
+Their email address and phone number are normalized (case, punctuation,
+country prefix) and hashed into fixed-size identity keys, which the candidate
+store indexes. Finding a person's earlier screenings is then a primary-key
+lookup per key, whatever the history size. Raw contact details are not needed
+to match.
+
+A document fingerprint (SHA-1 of the file bytes) identifies an unchanged
+resume, so it does not have to be screened again.
+"""
+
+import hashlib
+import re
+
+NOT_FOUND = "Not found"
+
+
+def normalize_email(email):
+    """
+    Args:
+        email (str): Email as extracted from a resume
+
+    Returns:
+        str: Lowercase address, or None if there is none
+    """
+    if not email or email == NOT_FOUND:
+        return None
+    email = email.strip().lower()
+    return email if '@' in email else None
+
+
+def normalize_phone(phone):
+    """
+    Reduce a phone number to its 10 subscriber digits
+
+    "+91 98765 43210", "098765-43210" and "9876543210" all normalize alike.
+
+    Args:
+        phone (str): Phone number as extracted from a resume
+
+    Returns:
+        str: The last 10 digits, or None if there are fewer
+    """
+    if not phone or phone == NOT_FOUND:
+        return None
+    digits = re.sub(r'\D', '', phone)
+    return digits[-10:] if len(digits) >= 10 else None
+
+
+def identity_keys(email, phone):
+    """
+    Hashed identity keys for a candidate's contact details
+
+    Args:
+        email (str): Extracted email
+        phone (str): Extracted phone number
+
+    Returns:
+        list: Hex keys, one per contact detail present
+    """
+    keys = []
+    for kind, value in (('email', normalize_email(email)), ('phone', normalize_phone(phone))):
+        if value:
+            keys.append(hashlib.blake2b(f"{kind}:{value}".encode('utf-8'), digest_size=16).hexdigest())
+    return keys
+
+
+def content_fingerprint(data):
+    """SHA-1 of a document's bytes (the fingerprint the folder watcher also uses)"""
+    return hashlib.sha1(data).hexdigest()
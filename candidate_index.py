@@ -0,0 +1,126 @@
+"""
+Cached filter and sort indices for the analytics dashboard
+
+Streamlit reruns the dashboard on every widget interaction. Instead of
+re-filtering and re-sorting the whole candidate list each time, the
+CandidateIndex keeps one sorted permutation per sort option for every band,
+extended incrementally as results are appended. A page is served by lazily
+merging the permutations of the selected bands, so its cost depends on the
+page position and size, not on the number of candidates.
+"""
+
+import heapq
+from itertools import islice
+
+from aggregate_stats import AggregateStats
+from candidate_result import as_dict
+
+BANDS = ["5A", "5B", "4A", "4B", "4C"]
+
+SORT_OPTIONS = ["Experience (High to Low)", "Experience (Low to High)", "Domain Score", "Name"]
+
+# Sort keys mirror the dashboard's original sorted() calls; the position
+# tie-breaker keeps them stable exactly like sorted(..., reverse=True) was
+SORT_KEYS = {
+    "Experience (High to Low)": lambda r: -r['experience'],
+    "Experience (Low to High)": lambda r: r['experience'],
+    "Domain Score": lambda r: -r['domain_score'],
+    "Name": lambda r: r['name']
+}
+
+
+class CandidateIndex:
+    """
+    Incrementally maintained per-band sort permutations over a result list
+    """
+
+    def __init__(self, results):
+        """
+        Args:
+            results (list): Result dicts or CandidateResults to index; held by
+                reference and picked up incrementally by `refresh()`
+        """
+        self.results = results
+        self._size = 0
+        # band -> sort option -> sorted list of (sort key, position)
+        self._orders = {}
+        self.stats = AggregateStats()
+        self.refresh()
+
+    def __len__(self):
+        return self._size
+
+    def refresh(self):
+        """
+        Index results appended since the last call
+
+        Returns:
+            int: Number of newly indexed results
+        """
+        new_results = self.results[self._size:]
+        if not new_results:
+            return 0
+
+        start = self._size
+        by_band = {}
+        for i, result in enumerate(new_results):
+            by_band.setdefault(result['band'], []).append((start + i, result))
+
+        for band, members in by_band.items():
+            orders = self._orders.setdefault(band, {option: [] for option in SORT_OPTIONS})
+            for option, key in SORT_KEYS.items():
+                order = orders[option]
+                order.extend(sorted((key(r), pos) for pos, r in members))
+                # Two sorted runs: timsort merges them in linear time
+                order.sort()
+
+        self.stats.add_many(new_results)
+        self._size += len(new_results)
+        return len(new_results)
+
+    def _selected(self, bands):
+        return [band for band in self._orders if not bands or band in bands]
+
+    def count(self, bands=None):
+        """
+        Number of candidates in the given bands (all candidates when empty)
+        """
+        return sum(len(self._orders[band][SORT_OPTIONS[0]]) for band in self._selected(bands))
+
+    def band_counts(self):
+        """Candidates per band"""
+        return {band: len(orders[SORT_OPTIONS[0]]) for band, orders in self._orders.items()}
+
+    def summary(self):
+        """
+        Dashboard summary metrics, maintained as results are indexed
+
+        Returns:
+            dict: total, avg_experience, premium_count, band_counts and percentiles
+        """
+        return self.stats.summary()
+
+    def iter_results(self):
+        """Iterate over every indexed result in insertion order, as dicts"""
+        for result in self.results[:self._size]:
+            yield as_dict(result)
+
+    def page(self, bands=None, sort_by=SORT_OPTIONS[0], offset=0, limit=20):
+        """
+        Get one page of filtered, sorted candidates
+
+        Args:
+            bands (list): Bands to keep; empty or None keeps all
+            sort_by (str): One of SORT_OPTIONS
+            offset (int): Candidates to skip in sorted order
+            limit (int): Page size
+
+        Returns:
+            list: Result dicts for the requested page
+        """
+        orders = [self._orders[band][sort_by] for band in self._selected(bands)]
+        if len(orders) == 1:
+            entries = orders[0][offset:offset + limit]
+        else:
+            entries = islice(heapq.merge(*orders), offset, offset + limit)
+        return [as_dict(self.results[pos]) for _, pos in entries]
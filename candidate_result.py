@@ -0,0 +1,283 @@
+"""
+Compact in-memory screening results
+
+A result dict repeats the same skill names, role names, pros/cons sentences
+and nested suitability dicts for every candidate. CandidateResult keeps one
+`__slots__` object per candidate instead: skills become bitmasks over a
+shared interned vocabulary, pros/cons become Finding codes, repeated tuples
+(score breakdown, suitability) are shared between candidates, and the
+analysis date is a float timestamp. `to_dict()` rebuilds the usual dict at
+the UI and export boundary.
+"""
+
+import sys
+from datetime import datetime
+from enum import IntEnum
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+BREAKDOWN_KEYS = ('Base Skills', 'Advanced Concepts', 'Premium Skills', 'Density (Role Keywords)',
+                  'Stability (>2yr Avg)')
+
+FIT_LEVELS = ('Low', 'Medium', 'High')
+
+
+class Finding(IntEnum):
+    """Pros and cons produced by SkillsAnalyzer"""
+    HIGH_SCORE = 1
+    LOW_SCORE = 2
+    PREMIUM_SKILLS = 3
+    NO_PREMIUM_SKILLS = 4
+    STRONG_ACHIEVEMENTS = 5
+    SOME_ACHIEVEMENTS = 6
+    FEW_ACHIEVEMENTS = 7
+    JOB_HOPPING = 8
+    LONG_TENURE = 9
+    STRONG_ALIGNMENT = 10
+    WEAK_ALIGNMENT = 11
+    LOW_DENSITY = 12
+
+
+FINDING_TEXT = {
+    Finding.HIGH_SCORE: "High domain expertise score",
+    Finding.LOW_SCORE: "Low domain expertise score",
+    Finding.PREMIUM_SKILLS: "Possesses premium skills ({premium_count} detected)",
+    Finding.NO_PREMIUM_SKILLS: "No premium skills (Python, PowerBI, etc.) detected",
+    Finding.STRONG_ACHIEVEMENTS: "Strong track record of quantifiable achievements",
+    Finding.SOME_ACHIEVEMENTS: "Mention of result-oriented achievements",
+    Finding.FEW_ACHIEVEMENTS: "Limited mention of quantifiable achievements",
+    Finding.JOB_HOPPING: "Frequent job changes detected (Approx. {num_roles} roles in {experience} years)",
+    Finding.LONG_TENURE: "Demonstrates long-term stability in roles",
+    Finding.STRONG_ALIGNMENT: "Strong alignment with {high_fits} roles",
+    Finding.WEAK_ALIGNMENT: "Weak alignment with core procurement roles",
+    Finding.LOW_DENSITY: "Low keyword density in resume"
+}
+
+
+def render_finding(finding, premium_count=0, num_roles=0, experience=0.0, high_fits=()):
+    """Sentence for a Finding, filled in with the candidate's numbers"""
+    return FINDING_TEXT[finding].format(premium_count=premium_count, num_roles=num_roles,
+                                        experience=experience, high_fits=', '.join(high_fits))
+
+
+class Vocabulary:
+    """
+    Append-only string <-> id table shared by every CandidateResult in the process
+    """
+
+    def __init__(self):
+        self.names = []
+        self.ids = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def id_of(self, name):
+        if name not in self.ids:
+            self.ids[name] = len(self.names)
+            self.names.append(sys.intern(name))
+        return self.ids[name]
+
+    def to_mask(self, names):
+        mask = 0
+        for name in names:
+            mask |= 1 << self.id_of(name)
+        return mask
+
+    def from_mask(self, mask):
+        names = []
+        while mask:
+            low_bit = mask & -mask
+            names.append(self.names[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return names
+
+
+SKILLS = Vocabulary()
+KEYWORDS = Vocabulary()
+
+# Equal tuples are stored once and shared between candidates
+_shared_tuples = {}
+
+
+def _share(value):
+    return _shared_tuples.setdefault(value, value)
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class CandidateResult:
+    """
+    One screening result in compact form
+
+    Supports `result[key]` for any field of the dict shape, so indexes and
+    sort keys work on either representation.
+    """
+
+    __slots__ = ('filename', 'name', 'email', 'phone', 'experience', 'band', 'designation',
+                 'procurement_mask', 'premium_mask', 'domain_score', 'breakdown', 'suitability_codes',
+                 'best_fit_role', 'pro_codes', 'con_codes', 'timestamp', 'feature_codes', 'corpus_id',
+                 'content_sha1', 'candidate_id', 'extra')
+
+    _SCALAR_KEYS = ('filename', 'name', 'email', 'phone', 'experience', 'band', 'designation',
+                    'domain_score', 'best_fit_role')
+    # Field order of ScreeningPipeline results
+    _DICT_KEYS = ('filename', 'name', 'email', 'phone', 'experience', 'band', 'designation',
+                  'procurement_skills', 'premium_skills', 'domain_score', 'score_breakdown',
+                  'suitability', 'best_fit_role', 'pros', 'cons', 'features', 'analysis_date',
+                  'corpus_id', 'content_sha1', 'candidate_id')
+    # Present only when known; omitted from the dict otherwise
+    _OPTIONAL_KEYS = ('features', 'corpus_id', 'content_sha1', 'candidate_id')
+
+    @classmethod
+    def from_dict(cls, result):
+        """
+        Compact a result dict produced by ScreeningPipeline
+
+        Args:
+            result (dict): Screening result
+
+        Returns:
+            CandidateResult: Compact result
+        """
+        self = cls.__new__(cls)
+        self.filename = result['filename']
+        self.name = result.get('name', 'Unknown')
+        self.email = result.get('email', 'Not found')
+        self.phone = result.get('phone', 'Not found')
+        self.experience = result['experience']
+        self.band = _intern(result['band'])
+        self.designation = _intern(result.get('designation'))
+        self.procurement_mask = SKILLS.to_mask(result.get('procurement_skills', []))
+        self.premium_mask = SKILLS.to_mask(result.get('premium_skills', []))
+        self.domain_score = result['domain_score']
+
+        breakdown = result.get('score_breakdown', {})
+        if list(breakdown) == list(BREAKDOWN_KEYS):
+            self.breakdown = _share(tuple(breakdown.values()))
+        else:
+            self.breakdown = _share(tuple(breakdown.items()))
+
+        self.suitability_codes = _share(tuple(
+            (sys.intern(role), FIT_LEVELS.index(data['fit']),
+             _share(tuple(KEYWORDS.id_of(keyword) for keyword in data['matched_keywords'])))
+            for role, data in result.get('suitability', {}).items()
+        ))
+        self.best_fit_role = _intern(result.get('best_fit_role', 'General Procurement'))
+
+        features = result.get('features')
+        self.feature_codes = None if features is None else (
+            sys.intern(features['vocabulary']), int(features['hits'] or '0', 16),
+            features['num_roles'], features['word_count']
+        )
+        self.corpus_id = result.get('corpus_id')
+        self.content_sha1 = result.get('content_sha1')
+        self.candidate_id = result.get('candidate_id')
+
+        analysis_date = result.get('analysis_date')
+        self.timestamp = datetime.strptime(analysis_date, DATE_FORMAT).timestamp() if analysis_date else None
+
+        # Sentences that are not a known Finding (e.g. from older versions) are kept verbatim
+        rendered = {render_finding(finding, **self._finding_params()): finding for finding in Finding}
+        self.pro_codes = _share(tuple(rendered.get(text, _intern(text)) for text in result.get('pros', [])))
+        self.con_codes = _share(tuple(rendered.get(text, _intern(text)) for text in result.get('cons', [])))
+
+        known = cls._DICT_KEYS
+        self.extra = {key: value for key, value in result.items() if key not in known} or None
+        return self
+
+    def _finding_params(self):
+        return {
+            'premium_count': bin(self.premium_mask).count('1'),
+            'num_roles': self.feature_codes[2] if self.feature_codes else 0,
+            'experience': self.experience,
+            'high_fits': [role for role, fit, _ in self.suitability_codes if fit == 2]
+        }
+
+    def _findings(self, codes):
+        params = None
+        texts = []
+        for code in codes:
+            if isinstance(code, Finding):
+                params = params or self._finding_params()
+                texts.append(render_finding(code, **params))
+            else:
+                texts.append(code)
+        return texts
+
+    def _field(self, key):
+        if key == 'procurement_skills':
+            return sorted(SKILLS.from_mask(self.procurement_mask))
+        if key == 'premium_skills':
+            return sorted(SKILLS.from_mask(self.premium_mask))
+        if key == 'score_breakdown':
+            if self.breakdown and isinstance(self.breakdown[0], tuple):
+                return dict(self.breakdown)
+            return dict(zip(BREAKDOWN_KEYS, self.breakdown))
+        if key == 'suitability':
+            return {
+                role: {'fit': FIT_LEVELS[fit], 'matched_keywords': [KEYWORDS.names[i] for i in keywords]}
+                for role, fit, keywords in self.suitability_codes
+            }
+        if key == 'pros':
+            return self._findings(self.pro_codes)
+        if key == 'cons':
+            return self._findings(self.con_codes)
+        if key == 'features':
+            if self.feature_codes is None:
+                return None
+            vocabulary, hits, num_roles, word_count = self.feature_codes
+            return {'vocabulary': vocabulary, 'hits': format(hits, 'x'), 'experience': self.experience,
+                    'num_roles': num_roles, 'word_count': word_count}
+        if key == 'analysis_date':
+            if self.timestamp is None:
+                return None
+            return datetime.fromtimestamp(self.timestamp).strftime(DATE_FORMAT)
+        if key in ('corpus_id', 'content_sha1', 'candidate_id'):
+            return getattr(self, key)
+        if key in self._SCALAR_KEYS:
+            return getattr(self, key)
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __getitem__(self, key):
+        return self._field(key)
+
+    def get(self, key, default=None):
+        try:
+            value = self._field(key)
+        except KeyError:
+            return default
+        return default if value is None else value
+
+    def to_dict(self):
+        """
+        Expand to the dict shape ScreeningPipeline produces
+
+        Returns:
+            dict: Screening result
+        """
+        result = {key: self._field(key) for key in self._DICT_KEYS}
+        for key in self._OPTIONAL_KEYS:
+            if result[key] is None:
+                del result[key]
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+    def __getstate__(self):
+        # Vocabulary ids are only meaningful inside this process
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        compact = CandidateResult.from_dict(state)
+        for slot in self.__slots__:
+            setattr(self, slot, getattr(compact, slot))
+
+
+def as_dict(result):
+    """Expand a CandidateResult; plain dicts pass through"""
+    return result.to_dict() if isinstance(result, CandidateResult) else result
@@ -0,0 +1,847 @@
+"""
+Persistent, indexed candidate database
+
+Screening results are stored in a local SQLite file so they survive Reset,
+server restarts and browser tabs. Columns the dashboard filters or sorts on
+are indexed and skills live in a normalized join table, so the dashboard and
+exports can page through large histories with LIMIT/OFFSET instead of
+holding every result in process memory.
+
+Extracted texts live in a memory-mapped TextCorpus next to the database
+and are referenced by corpus id, with a token -> candidate inverted index,
+so a change to the skills taxonomy can be applied to just the candidates
+whose text mentions the changed keywords (see taxonomy_update.py).
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from aggregate_stats import AggregateStats
+from candidate_identity import identity_keys
+from candidate_index import SORT_OPTIONS
+from candidate_result import FIT_LEVELS
+from skills_analyzer import SkillsAnalyzer
+from text_corpus import TextCorpus
+
+DEFAULT_DB_PATH = os.environ.get('RESUME_SCREENER_DB', 'candidates.db')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    id INTEGER PRIMARY KEY,
+    filename TEXT NOT NULL,
+    name TEXT,
+    email TEXT,
+    phone TEXT,
+    experience REAL NOT NULL,
+    band TEXT NOT NULL,
+    designation TEXT,
+    domain_score INTEGER NOT NULL,
+    best_fit_role TEXT,
+    analysis_date TEXT,
+    details TEXT,
+    features TEXT,
+    content_sha1 TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_candidates_experience ON candidates(experience);
+CREATE INDEX IF NOT EXISTS idx_candidates_domain_score ON candidates(domain_score);
+CREATE INDEX IF NOT EXISTS idx_candidates_name ON candidates(name);
+CREATE INDEX IF NOT EXISTS idx_candidates_best_fit_role ON candidates(best_fit_role);
+CREATE INDEX IF NOT EXISTS idx_candidates_band_experience ON candidates(band, experience);
+CREATE INDEX IF NOT EXISTS idx_candidates_band_domain_score ON candidates(band, domain_score);
+CREATE INDEX IF NOT EXISTS idx_candidates_band_name ON candidates(band, name);
+
+CREATE TABLE IF NOT EXISTS skills (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    UNIQUE (name, kind)
+);
+
+CREATE TABLE IF NOT EXISTS candidate_skills (
+    candidate_id INTEGER NOT NULL REFERENCES candidates(id) ON DELETE CASCADE,
+    skill_id INTEGER NOT NULL REFERENCES skills(id),
+    PRIMARY KEY (candidate_id, skill_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_candidate_skills_skill ON candidate_skills(skill_id);
+
+CREATE TABLE IF NOT EXISTS documents (
+    candidate_id INTEGER PRIMARY KEY REFERENCES candidates(id) ON DELETE CASCADE,
+    corpus_id INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS tokens (
+    id INTEGER PRIMARY KEY,
+    token TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS token_postings (
+    token_id INTEGER NOT NULL REFERENCES tokens(id),
+    candidate_id INTEGER NOT NULL REFERENCES candidates(id) ON DELETE CASCADE,
+    PRIMARY KEY (token_id, candidate_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS identities (
+    key TEXT NOT NULL,
+    candidate_id INTEGER NOT NULL REFERENCES candidates(id) ON DELETE CASCADE,
+    PRIMARY KEY (key, candidate_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS job_documents (
+    job_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    candidate_id INTEGER NOT NULL REFERENCES candidates(id) ON DELETE CASCADE,
+    PRIMARY KEY (job_id, position)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS aggregates (
+    name TEXT PRIMARY KEY,
+    state TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS vocabularies (
+    id TEXT PRIMARY KEY,
+    taxonomy TEXT NOT NULL
+);
+"""
+
+ORDER_BY = {
+    "Experience (High to Low)": "experience DESC, id",
+    "Experience (Low to High)": "experience, id",
+    "Domain Score": "domain_score DESC, id",
+    "Name": "name, id"
+}
+
+# Skill kinds map onto the result fields they come from
+SKILL_KINDS = {'procurement': 'procurement_skills', 'premium': 'premium_skills'}
+
+COLUMNS = ('id', 'filename', 'name', 'email', 'phone', 'experience', 'band', 'designation',
+           'domain_score', 'best_fit_role', 'analysis_date', 'details', 'features', 'content_sha1')
+
+
+class CandidateStore:
+    """
+    SQLite-backed candidate history with the same paging interface as CandidateIndex
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH, corpus_path=None):
+        """
+        Args:
+            path (str): SQLite database file (':memory:' for a throwaway store)
+            corpus_path (str): Text corpus file, defaults to `<db name>.corpus`;
+                a ':memory:' store keeps no texts unless one is given
+        """
+        self.path = path
+        if corpus_path is None and path != ':memory:':
+            corpus_path = os.path.splitext(path)[0] + '.corpus'
+        self.corpus = TextCorpus(corpus_path) if corpus_path else None
+        # Streamlit serves reruns from different threads; all access goes through the lock
+        self._lock = threading.RLock()
+        self._skill_ids = {}
+        self._token_ids = {}
+        self._known_vocabularies = set()
+        # Bumped whenever stored candidates change other than by being appended
+        self._revision = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(SCHEMA)
+            self._migrate()
+
+    def _migrate(self):
+        # Databases created before feature vectors were stored lack the column
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(candidates)")}
+        if 'features' not in columns:
+            self._conn.execute("ALTER TABLE candidates ADD COLUMN features TEXT")
+        if 'content_sha1' not in columns:
+            self._conn.execute("ALTER TABLE candidates ADD COLUMN content_sha1 TEXT")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_candidates_content_sha1 ON candidates(content_sha1)")
+
+        # Index the contact details of candidates stored before identities were
+        if not self._conn.execute("SELECT 1 FROM identities LIMIT 1").fetchone():
+            rows = self._conn.execute("SELECT id, email, phone FROM candidates").fetchall()
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO identities (key, candidate_id) VALUES (?, ?)",
+                    [(key, candidate_id) for candidate_id, email, phone in rows
+                     for key in identity_keys(email, phone)]
+                )
+
+        # Aggregates were added after candidates
+        if not self._conn.execute("SELECT 1 FROM aggregates").fetchone():
+            with self._conn:
+                self._rebuild_aggregates()
+
+        # Texts used to be stored inline; move them into the corpus
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(documents)")}
+        if 'text' in columns:
+            rows = self._conn.execute("SELECT candidate_id, text FROM documents").fetchall()
+            with self._conn:
+                self._conn.execute("DROP TABLE documents")
+                self._conn.executescript(SCHEMA)
+                if self.corpus is not None:
+                    self._conn.executemany(
+                        "INSERT INTO documents (candidate_id, corpus_id) VALUES (?, ?)",
+                        [(candidate_id, self.corpus.append(text)) for candidate_id, text in rows]
+                    )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self):
+        return self.count()
+
+    def version(self):
+        """
+        Token that changes when stored candidates are modified or removed, or
+        when another connection (an offline rescore, a folder watcher) writes
+
+        Appending through this store keeps it, so readers can follow appends
+        incrementally and rebuild only when the token changes.
+        """
+        with self._lock:
+            return self._revision, self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    @contextmanager
+    def _transaction(self):
+        """Write transaction; ids cached during it are forgotten if it rolls back"""
+        with self._lock:
+            try:
+                with self._conn:
+                    yield
+            except BaseException:
+                # Skills, tokens and vocabularies inserted by the transaction no longer exist
+                self._skill_ids.clear()
+                self._token_ids.clear()
+                self._known_vocabularies.clear()
+                raise
+
+    def _skill_id(self, name, kind):
+        key = (name, kind)
+        if key not in self._skill_ids:
+            self._conn.execute("INSERT OR IGNORE INTO skills (name, kind) VALUES (?, ?)", key)
+            row = self._conn.execute("SELECT id FROM skills WHERE name = ? AND kind = ?", key).fetchone()
+            self._skill_ids[key] = row[0]
+        return self._skill_ids[key]
+
+    def _token_id(self, token):
+        if token not in self._token_ids:
+            self._conn.execute("INSERT OR IGNORE INTO tokens (token) VALUES (?)", (token,))
+            row = self._conn.execute("SELECT id FROM tokens WHERE token = ?", (token,)).fetchone()
+            self._token_ids[token] = row[0]
+        return self._token_ids[token]
+
+    def _register_vocabulary(self, vocabulary_id):
+        """Keep the taxonomy a feature vocabulary was built from, for later diffs"""
+        if vocabulary_id in self._known_vocabularies:
+            return
+        exists = self._conn.execute("SELECT 1 FROM vocabularies WHERE id = ?", (vocabulary_id,)).fetchone()
+        if not exists:
+            # Results come from this codebase, so the current taxonomy (in either matching mode) is the one they used
+            for fuzzy in (False, True):
+                analyzer = SkillsAnalyzer(fuzzy=fuzzy)
+                if analyzer.vocabulary_id == vocabulary_id:
+                    self._conn.execute("INSERT INTO vocabularies (id, taxonomy) VALUES (?, ?)",
+                                       (vocabulary_id, json.dumps(analyzer.taxonomy())))
+                    break
+        self._known_vocabularies.add(vocabulary_id)
+
+    def _set_skills(self, candidate_id, result):
+        self._conn.execute("DELETE FROM candidate_skills WHERE candidate_id = ?", (candidate_id,))
+        skill_rows = [
+            (candidate_id, self._skill_id(skill, kind))
+            for kind, field in SKILL_KINDS.items()
+            for skill in result.get(field, [])
+        ]
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO candidate_skills (candidate_id, skill_id) VALUES (?, ?)",
+            skill_rows
+        )
+
+    def _index_text(self, candidate_id, corpus_id, text):
+        self._conn.execute("INSERT OR REPLACE INTO documents (candidate_id, corpus_id) VALUES (?, ?)",
+                           (candidate_id, corpus_id))
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO token_postings (token_id, candidate_id) VALUES (?, ?)",
+            [(self._token_id(token), candidate_id) for token in set(text.lower().split())]
+        )
+
+    def add(self, result):
+        """
+        Store one screening result
+
+        Returns:
+            int: New candidate id
+        """
+        return self.add_many([result])[0]
+
+    def add_many(self, results, job_keys=None):
+        """
+        Store screening results in a single transaction
+
+        Args:
+            results (list): Result dicts as produced by ScreeningPipeline; the
+                text behind a `corpus_id` (or a `text` field, appended to the
+                corpus here) is indexed for taxonomy updates
+            job_keys (list): Replay key per result, (job id, input position) for a
+                background job, (watched path and fingerprint, 0) for the folder
+                watcher or (run and work unit, position) for the distributed
+                coordinator; a result whose key is already stored is not
+                inserted again, so replaying a batch after a crash stores it once
+
+        Returns:
+            list: Candidate ids, in input order
+        """
+        ids = []
+        added = []
+        with self._transaction():
+            for i, result in enumerate(results):
+                job_key = job_keys[i] if job_keys is not None else None
+                if job_key is not None:
+                    row = self._conn.execute(
+                        "SELECT candidate_id FROM job_documents WHERE job_id = ? AND position = ?", job_key
+                    ).fetchone()
+                    if row is not None:
+                        ids.append(row[0])
+                        continue
+                details = {
+                    'score_breakdown': result.get('score_breakdown', {}),
+                    'suitability': result.get('suitability', {}),
+                    'pros': result.get('pros', []),
+                    'cons': result.get('cons', [])
+                }
+                cursor = self._conn.execute(
+                    "INSERT INTO candidates (filename, name, email, phone, experience, band, designation, "
+                    "domain_score, best_fit_role, analysis_date, details, features, content_sha1) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (result['filename'], result.get('name'), result.get('email'), result.get('phone'),
+                     result['experience'], result['band'], result.get('designation'),
+                     result['domain_score'], result.get('best_fit_role'), result.get('analysis_date'),
+                     json.dumps(details), json.dumps(result['features']) if result.get('features') else None,
+                     result.get('content_sha1'))
+                )
+                candidate_id = cursor.lastrowid
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO identities (key, candidate_id) VALUES (?, ?)",
+                    [(key, candidate_id) for key in identity_keys(result.get('email'), result.get('phone'))]
+                )
+                self._set_skills(candidate_id, result)
+                if result.get('features'):
+                    self._register_vocabulary(result['features']['vocabulary'])
+                if self.corpus is not None:
+                    text = result.get('text')
+                    corpus_id = result.get('corpus_id')
+                    if corpus_id is None and text:
+                        corpus_id = self.corpus.append(text)
+                    if corpus_id is not None:
+                        self._index_text(candidate_id, corpus_id, text or self.corpus.get(corpus_id))
+                if job_key is not None:
+                    self._conn.execute(
+                        "INSERT INTO job_documents (job_id, position, candidate_id) VALUES (?, ?, ?)",
+                        (*job_key, candidate_id))
+                ids.append(candidate_id)
+                added.append(result)
+            self._merge_aggregates(AggregateStats().add_many(added))
+        return ids
+
+    def _load_aggregates(self):
+        row = self._conn.execute("SELECT state FROM aggregates WHERE name = 'candidates'").fetchone()
+        return AggregateStats.from_dict(json.loads(row[0])) if row else AggregateStats()
+
+    def _save_aggregates(self, stats):
+        self._conn.execute("INSERT OR REPLACE INTO aggregates (name, state) VALUES ('candidates', ?)",
+                           (json.dumps(stats.to_dict()),))
+
+    def _merge_aggregates(self, stats):
+        # Called inside the write transaction, after its inserts took the write
+        # lock: another process's batch cannot interleave between read and write
+        self._save_aggregates(self._load_aggregates().merge(stats))
+
+    def _rebuild_aggregates(self):
+        """Recompute the aggregates from every row, after scores or skills changed in place"""
+        rows = self._conn.execute(
+            "SELECT c.experience, c.band, c.domain_score, EXISTS ("
+            "SELECT 1 FROM candidate_skills cs JOIN skills s ON s.id = cs.skill_id "
+            "WHERE cs.candidate_id = c.id AND s.kind = 'premium') FROM candidates c"
+        )
+        self._save_aggregates(AggregateStats().add_many(
+            {'experience': experience, 'band': band, 'domain_score': domain_score, 'premium_skills': premium}
+            for experience, band, domain_score, premium in rows
+        ))
+
+    def clear(self):
+        """Delete all stored candidates"""
+        with self._transaction():
+            self._conn.execute("DELETE FROM candidate_skills")
+            self._conn.execute("DELETE FROM token_postings")
+            self._conn.execute("DELETE FROM documents")
+            self._conn.execute("DELETE FROM identities")
+            self._conn.execute("DELETE FROM job_documents")
+            self._conn.execute("DELETE FROM candidates")
+            self._save_aggregates(AggregateStats())
+            self._revision += 1
+
+    @staticmethod
+    def _band_filter(bands):
+        if not bands:
+            return "", []
+        return f"WHERE band IN ({', '.join('?' for _ in bands)})", list(bands)
+
+    def count(self, bands=None):
+        """
+        Number of candidates in the given bands (all candidates when empty)
+        """
+        where, params = self._band_filter(bands)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM candidates {where}", params).fetchone()[0]
+
+    def band_counts(self):
+        """Candidates per band"""
+        with self._lock:
+            return dict(self._conn.execute("SELECT band, COUNT(*) FROM candidates GROUP BY band"))
+
+    def summary(self):
+        """
+        Dashboard summary metrics from the stored aggregates; no row is scanned
+
+        Returns:
+            dict: total, avg_experience, premium_count, band_counts and percentiles
+        """
+        with self._lock:
+            return self._load_aggregates().summary()
+
+    def page(self, bands=None, sort_by=SORT_OPTIONS[0], offset=0, limit=20):
+        """
+        Get one page of filtered, sorted candidates
+
+        Args:
+            bands (list): Bands to keep; empty or None keeps all
+            sort_by (str): One of SORT_OPTIONS
+            offset (int): Candidates to skip in sorted order
+            limit (int): Page size
+
+        Returns:
+            list: Result dicts for the requested page
+        """
+        where, params = self._band_filter(bands)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM candidates {where} "
+                f"ORDER BY {ORDER_BY[sort_by]} LIMIT ? OFFSET ?",
+                params + [limit, offset]
+            ).fetchall()
+            return self._to_results(rows)
+
+    def iter_results(self, chunk_size=1000):
+        """
+        Stream every stored result in insertion order, one chunk per query
+
+        Yields:
+            dict: Stored result
+        """
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT {', '.join(COLUMNS)} FROM candidates WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, chunk_size)
+                ).fetchall()
+                results = self._to_results(rows)
+            if not results:
+                return
+            yield from results
+            last_id = rows[-1][0]
+
+    def load_features(self, vocabulary_id, chunk_size=10000, after_id=0):
+        """
+        Feature records of every candidate scored with the given skill vocabulary
+
+        Args:
+            vocabulary_id (str): SkillsAnalyzer.vocabulary_id the records must match
+            chunk_size (int): Rows fetched per query
+            after_id (int): Only candidates stored after this id
+
+        Returns:
+            tuple: (candidate ids, feature dicts), ids ascending
+        """
+        ids, features = [], []
+        last_id = after_id
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT id, features FROM candidates WHERE id > ? AND features IS NOT NULL "
+                    "ORDER BY id LIMIT ?",
+                    (last_id, chunk_size)
+                ).fetchall()
+            if not rows:
+                return ids, features
+            for candidate_id, record in rows:
+                record = json.loads(record)
+                if record.get('vocabulary') == vocabulary_id:
+                    ids.append(candidate_id)
+                    features.append(record)
+            last_id = rows[-1][0]
+
+    def update_scores(self, ids, analyses):
+        """
+        Overwrite the scoring fields of stored candidates, e.g. after re-scoring
+
+        Args:
+            ids (list): Candidate ids
+            analyses (iterable): Matching dicts with domain_score, score_breakdown,
+                suitability, best_fit_role, pros and cons
+        """
+        rows = []
+        for candidate_id, analysis in zip(ids, analyses):
+            details = {
+                'score_breakdown': analysis['score_breakdown'],
+                'suitability': analysis['suitability'],
+                'pros': analysis['pros'],
+                'cons': analysis['cons']
+            }
+            rows.append((analysis['domain_score'], analysis['best_fit_role'], json.dumps(details), candidate_id))
+        with self._transaction():
+            self._conn.executemany(
+                "UPDATE candidates SET domain_score = ?, best_fit_role = ?, details = ? WHERE id = ?", rows
+            )
+            self._rebuild_aggregates()
+            self._revision += 1
+
+    def vocabulary_taxonomies(self):
+        """
+        Taxonomies that stored feature vectors were built from
+
+        Returns:
+            dict: vocabulary id -> taxonomy snapshot
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT id, taxonomy FROM vocabularies").fetchall()
+        return {vocabulary_id: json.loads(taxonomy) for vocabulary_id, taxonomy in rows}
+
+    def add_vocabulary(self, vocabulary_id, taxonomy):
+        """Record the taxonomy behind a feature vocabulary"""
+        with self._transaction():
+            self._conn.execute("INSERT OR IGNORE INTO vocabularies (id, taxonomy) VALUES (?, ?)",
+                               (vocabulary_id, json.dumps(taxonomy)))
+        self._known_vocabularies.add(vocabulary_id)
+
+    def candidates_mentioning(self, keyword):
+        """
+        Candidates whose stored text may contain `keyword` as a substring
+
+        Answered from the token index: a single word may sit inside any token,
+        and a phrase must end one token, start another and match the tokens in
+        between exactly. The result is a superset; callers verify on the text.
+
+        Args:
+            keyword (str): Lowercase keyword or phrase
+
+        Returns:
+            set: Candidate ids
+        """
+        words = keyword.split()
+        if not words:
+            return set()
+
+        if len(words) == 1:
+            conditions = [("instr(token, ?) > 0", words[0])]
+        else:
+            conditions = [("substr(token, -length(?)) = ?", words[0])]
+            conditions += [("token = ?", word) for word in words[1:-1]]
+            conditions.append(("substr(token, 1, length(?)) = ?", words[-1]))
+
+        candidates = None
+        with self._lock:
+            for condition, word in conditions:
+                params = (word,) * condition.count('?')
+                ids = {row[0] for row in self._conn.execute(
+                    f"SELECT DISTINCT p.candidate_id FROM token_postings p JOIN tokens t ON t.id = p.token_id "
+                    f"WHERE {condition}", params
+                )}
+                candidates = ids if candidates is None else candidates & ids
+                if not candidates:
+                    break
+        return candidates
+
+    def iter_tokens(self, chunk_size=10000):
+        """
+        Every indexed token
+
+        Yields:
+            tuple: (token id, token)
+        """
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute("SELECT id, token FROM tokens WHERE id > ? ORDER BY id LIMIT ?",
+                                          (last_id, chunk_size)).fetchall()
+            if not rows:
+                return
+            yield from rows
+            last_id = rows[-1][0]
+
+    def candidates_with_tokens(self, token_ids, chunk_size=500):
+        """
+        Args:
+            token_ids (iterable): Ids from iter_tokens
+
+        Returns:
+            set: Candidates whose text holds any of the tokens
+        """
+        token_ids = list(token_ids)
+        candidates = set()
+        with self._lock:
+            for start in range(0, len(token_ids), chunk_size):
+                chunk = token_ids[start:start + chunk_size]
+                candidates.update(row[0] for row in self._conn.execute(
+                    f"SELECT DISTINCT candidate_id FROM token_postings "
+                    f"WHERE token_id IN ({', '.join('?' for _ in chunk)})", chunk))
+        return candidates
+
+    def document_ids(self):
+        """Ids of candidates whose extracted text is stored"""
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT candidate_id FROM documents")}
+
+    def iter_documents(self, ids=None, chunk_size=500):
+        """
+        Stream stored texts with the fields re-analysis needs
+
+        Args:
+            ids (iterable): Candidate ids to load (default: every stored text)
+
+        Yields:
+            tuple: (candidate id, text, experience, features dict or None)
+        """
+        query = ("SELECT d.candidate_id, d.corpus_id, c.experience, c.features FROM documents d "
+                 "JOIN candidates c ON c.id = d.candidate_id ")
+        if ids is None:
+            last_id = 0
+            while True:
+                with self._lock:
+                    rows = self._conn.execute(query + "WHERE d.candidate_id > ? ORDER BY d.candidate_id LIMIT ?",
+                                              (last_id, chunk_size)).fetchall()
+                if not rows:
+                    return
+                for candidate_id, corpus_id, experience, features in rows:
+                    yield (candidate_id, self.corpus.get(corpus_id), experience,
+                           json.loads(features) if features else None)
+                last_id = rows[-1][0]
+
+        ids = sorted(ids)
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            with self._lock:
+                rows = self._conn.execute(
+                    query + f"WHERE d.candidate_id IN ({', '.join('?' for _ in chunk)}) ORDER BY d.candidate_id",
+                    chunk
+                ).fetchall()
+            for candidate_id, corpus_id, experience, features in rows:
+                yield (candidate_id, self.corpus.get(corpus_id), experience,
+                       json.loads(features) if features else None)
+
+    def update_analyses(self, updates):
+        """
+        Overwrite the skills, scores and feature vectors of stored candidates
+
+        Args:
+            updates (iterable): (candidate id, analysis) pairs, analysis as
+                returned by SkillsAnalyzer.analyze
+        """
+        with self._transaction():
+            for candidate_id, analysis in updates:
+                details = {
+                    'score_breakdown': analysis['score_breakdown'],
+                    'suitability': analysis['suitability'],
+                    'pros': analysis['pros'],
+                    'cons': analysis['cons']
+                }
+                self._conn.execute(
+                    "UPDATE candidates SET domain_score = ?, best_fit_role = ?, details = ?, features = ? "
+                    "WHERE id = ?",
+                    (analysis['domain_score'], analysis['best_fit_role'], json.dumps(details),
+                     json.dumps(analysis['features']), candidate_id)
+                )
+                self._set_skills(candidate_id, analysis)
+            self._rebuild_aggregates()
+            self._revision += 1
+
+    def update_features(self, updates):
+        """
+        Overwrite stored feature vectors, e.g. re-encoded for a new vocabulary
+
+        Args:
+            updates (iterable): (candidate id, features dict) pairs
+        """
+        with self._transaction():
+            self._conn.executemany(
+                "UPDATE candidates SET features = ? WHERE id = ?",
+                [(json.dumps(features), candidate_id) for candidate_id, features in updates]
+            )
+            self._revision += 1
+
+    def shortlist_criteria(self, after_id=0):
+        """
+        Pareto shortlist inputs of candidates stored after `after_id`
+
+        Yields:
+            tuple: (candidate id, band, fit roles, criteria vector) as skyline.fit_roles
+                and skyline.criteria build them
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT c.id, c.band, c.experience, c.domain_score, c.details, COUNT(s.id) "
+                "FROM candidates c "
+                "LEFT JOIN candidate_skills cs ON cs.candidate_id = c.id "
+                "LEFT JOIN skills s ON s.id = cs.skill_id AND s.kind = 'premium' "
+                "WHERE c.id > ? GROUP BY c.id ORDER BY c.id",
+                (after_id,)
+            ).fetchall()
+        for candidate_id, band, experience, domain_score, details, premium_count in rows:
+            suitability = json.loads(details or '{}').get('suitability', {})
+            roles = tuple(sorted(suitability))
+            fits = tuple(FIT_LEVELS.index(suitability[role]['fit']) for role in roles)
+            yield candidate_id, band, roles, (experience, domain_score, premium_count) + fits
+
+    def fetch(self, ids):
+        """
+        Stored results by candidate id
+
+        Args:
+            ids (list): Candidate ids
+
+        Returns:
+            list: Result dicts in the order of `ids`; unknown ids are left out
+        """
+        results = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT {', '.join(COLUMNS)} FROM candidates WHERE id IN ({', '.join('?' for _ in chunk)})",
+                    chunk
+                ).fetchall()
+                for result in self._to_results(rows):
+                    results[result['candidate_id']] = result
+        return [results[candidate_id] for candidate_id in ids if candidate_id in results]
+
+    def previous_screenings(self, email, phone, before_id=None, limit=5):
+        """
+        Earlier screenings of the same person, matched on hashed email or phone
+
+        Args:
+            email (str): Candidate email as extracted
+            phone (str): Candidate phone as extracted
+            before_id (int): Only screenings stored before this candidate id
+            limit (int): Most recent screenings to return
+
+        Returns:
+            list: Dicts with candidate_id, filename, band, domain_score and
+                analysis_date, newest first
+        """
+        keys = identity_keys(email, phone)
+        if not keys:
+            return []
+        params = list(keys)
+        before = ""
+        if before_id is not None:
+            before = "AND c.id < ?"
+            params.append(before_id)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT DISTINCT c.id, c.filename, c.band, c.domain_score, c.analysis_date "
+                f"FROM identities i JOIN candidates c ON c.id = i.candidate_id "
+                f"WHERE i.key IN ({', '.join('?' for _ in keys)}) {before} "
+                f"ORDER BY c.id DESC LIMIT ?",
+                params + [limit]
+            ).fetchall()
+        return [dict(zip(('candidate_id', 'filename', 'band', 'domain_score', 'analysis_date'), row))
+                for row in rows]
+
+    def find_by_content(self, content_sha1, vocabulary_id=None):
+        """
+        Latest result for a document with exactly these bytes
+
+        Args:
+            content_sha1 (str): Fingerprint from candidate_identity.content_fingerprint
+            vocabulary_id (str): Only accept results whose feature vector uses
+                this vocabulary, so a taxonomy change forces a fresh screening
+
+        Returns:
+            dict: Stored result (with its `corpus_id`), or None
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM candidates WHERE content_sha1 = ? ORDER BY id DESC LIMIT 1",
+                (content_sha1,)
+            ).fetchall()
+            if not rows:
+                return None
+            result = self._to_results(rows)[0]
+            if vocabulary_id is not None and (result['features'] or {}).get('vocabulary') != vocabulary_id:
+                return None
+            document = self._conn.execute("SELECT corpus_id FROM documents WHERE candidate_id = ?",
+                                          (result['candidate_id'],)).fetchone()
+        if document is not None:
+            result['corpus_id'] = document[0]
+        return result
+
+    def stored_fingerprints(self):
+        """
+        Returns:
+            set: content_sha1 of every stored document that has one
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT content_sha1 FROM candidates WHERE content_sha1 IS NOT NULL").fetchall()
+        return {row[0] for row in rows}
+
+    def _to_results(self, rows):
+        """Rebuild result dicts (with their skill lists) for a page of rows"""
+        if not rows:
+            return []
+
+        ids = [row[0] for row in rows]
+        skills = {candidate_id: {field: [] for field in SKILL_KINDS.values()} for candidate_id in ids}
+        skill_rows = self._conn.execute(
+            f"SELECT cs.candidate_id, s.kind, s.name FROM candidate_skills cs "
+            f"JOIN skills s ON s.id = cs.skill_id "
+            f"WHERE cs.candidate_id IN ({', '.join('?' for _ in ids)}) ORDER BY s.name",
+            ids
+        )
+        for candidate_id, kind, name in skill_rows:
+            skills[candidate_id][SKILL_KINDS[kind]].append(name)
+
+        results = []
+        for row in rows:
+            record = dict(zip(COLUMNS, row))
+            details = json.loads(record.pop('details') or '{}')
+            candidate_id = record.pop('id')
+            results.append({
+                'filename': record['filename'],
+                'name': record['name'],
+                'email': record['email'],
+                'phone': record['phone'],
+                'experience': record['experience'],
+                'band': record['band'],
+                'designation': record['designation'],
+                'procurement_skills': skills[candidate_id]['procurement_skills'],
+                'premium_skills': skills[candidate_id]['premium_skills'],
+                'domain_score': record['domain_score'],
+                'score_breakdown': details.get('score_breakdown', {}),
+                'suitability': details.get('suitability', {}),
+                'best_fit_role': record['best_fit_role'],
+                'pros': details.get('pros', []),
+                'cons': details.get('cons', []),
+                'features': json.loads(record['features']) if record['features'] else None,
+                'analysis_date': record['analysis_date'],
+                'content_sha1': record['content_sha1'],
+                'candidate_id': candidate_id
+            })
+        return results
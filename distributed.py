@@ -0,0 +1,712 @@
+"""
+Distributed screening: a coordinator leasing work units to workers over HTTP
+
+The coordinator fingerprints every resume in a corpus (SHA-1 of the bytes),
+drops duplicate content and content the candidate store already holds, and
+shards the rest by fingerprint: documents sorted by hash are cut into work
+units of a fixed size, so the same corpus always yields the same units.
+Workers lease one unit at a time, download its documents by hash, screen
+them and post the results back, which the coordinator merges into its
+CandidateStore. A worker heartbeats while it screens; a lease that is not
+renewed in time (the worker crashed or lost its network) expires and the
+unit is handed to the next worker, up to a maximum number of attempts.
+Results of a unit are merged once, so a late duplicate completion is ignored;
+the store also keys every merged row by run, unit and position, so a
+completion replayed after a failed or lost response is not stored twice.
+A worker that cannot reach the coordinator (network errors, timeouts, 5xx)
+backs off and tries again instead of exiting; a unit it cannot finish is
+abandoned and its lease expires like a crashed worker's.
+
+Workers only talk HTTP to the coordinator, so the same commands run several
+local processes on one box or workers spread over several hosts. Every request
+carries a shared token (Authorization: Bearer), and a document is only served
+to the holder of an active lease on its unit, so a coordinator listening on
+the network does not hand the corpus to anyone who asks. Request bodies over
+MAX_BODY_BYTES are refused with 413 before they are read.
+
+Protocol (JSON over HTTP):
+    POST /lease              {"worker": id} -> a unit with its lease and documents,
+                             {"wait": seconds} while units are leased elsewhere, or {"done": true}
+    GET  /documents/<sha1>?lease=<id>
+                             Raw bytes of one document of the leased unit, 409 once the lease is lost
+    POST /heartbeat          {"lease": id} -> 200, or 409 once the lease is lost
+    POST /complete           {"lease": id, "results": [...]} -> 200, or 409 once the lease is lost
+    GET  /status             Progress counts
+
+Usage:
+    python distributed.py local /shared/resumes --workers 4 --db candidates.db
+    export RESUME_SCREENER_COORDINATOR_TOKEN=<shared secret>
+    python distributed.py coordinator /shared/resumes --host 0.0.0.0 --port 8700 --db candidates.db
+    python distributed.py worker --coordinator http://screening-01:8700
+"""
+
+import argparse
+import heapq
+import hmac
+import http.client
+import json
+import multiprocessing
+import os
+import secrets
+import socket
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from candidate_identity import content_fingerprint
+from screening_pipeline import NamedBytesIO, ScreeningPipeline
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+DEFAULT_PORT = 8700
+
+# Shared secret between the coordinator and its workers
+TOKEN_ENV = 'RESUME_SCREENER_COORDINATOR_TOKEN'
+
+LOOPBACK_HOSTS = ('127.0.0.1', 'localhost', '::1')
+
+# Largest request body the coordinator reads; a unit's results are far smaller
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+# Documents per work unit
+UNIT_SIZE = 16
+
+# A lease not renewed within this many seconds goes back to the queue
+LEASE_SECONDS = 60.0
+
+# Leases of one unit before it is given up as failed
+MAX_ATTEMPTS = 3
+
+# Tries of a request made under a lease before the unit is abandoned
+REQUEST_ATTEMPTS = 3
+
+# Back-off while the coordinator is unreachable: first delay and cap (seconds)
+RETRY_BACKOFF = 1.0
+MAX_RETRY_BACKOFF = 30.0
+
+# A worker gives up after the coordinator was unreachable this long
+RETRY_SECONDS = 300.0
+
+
+def corpus_files(folder):
+    """PDF/DOCX files under `folder`, in a stable order"""
+    paths = []
+    for root, dirs, files in os.walk(folder):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        for name in sorted(files):
+            if not name.startswith('.') and name.lower().endswith(SUPPORTED_EXTENSIONS):
+                paths.append(os.path.join(root, name))
+    return paths
+
+
+class WorkUnit:
+    """
+    One shard of the corpus and the state of its lease
+    """
+
+    def __init__(self, unit_id, documents):
+        self.unit_id = unit_id
+        # (filename, sha1) pairs
+        self.documents = documents
+        self.status = 'pending'
+        self.attempts = 0
+        self.lease_id = None
+        self.worker = None
+        self.expires = 0.0
+
+
+class Coordinator:
+    """
+    Shard a corpus into work units, lease them out and merge the results
+    """
+
+    def __init__(self, paths, store=None, unit_size=UNIT_SIZE, lease_seconds=LEASE_SECONDS,
+                 max_attempts=MAX_ATTEMPTS, skip_stored=True):
+        """
+        Args:
+            paths (list): Resume files to screen
+            store (CandidateStore): Results are merged here
+            unit_size (int): Documents per work unit
+            lease_seconds (float): Lease lifetime without a heartbeat
+            max_attempts (int): Leases of a unit before it is marked failed
+            skip_stored (bool): Leave out documents whose exact bytes the store already holds
+        """
+        self.store = store
+        # Replay keys of merged results are scoped to this run, so --rescreen stores a corpus again
+        self.run_id = uuid.uuid4().hex
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self.duplicates = 0
+        self.already_stored = 0
+        self.screened = 0
+        self.failed = 0
+
+        stored = store.stored_fingerprints() if store is not None and skip_stored else set()
+        # sha1 -> (filename, path); the first file with given content wins
+        self._documents = {}
+        for path in paths:
+            with open(path, 'rb') as f:
+                digest = content_fingerprint(f.read())
+            if digest in self._documents:
+                self.duplicates += 1
+            elif digest in stored:
+                self.already_stored += 1
+            else:
+                self._documents[digest] = (os.path.basename(path), path)
+
+        hashes = sorted(self._documents)
+        self.units = {}
+        for start in range(0, len(hashes), unit_size):
+            shard = hashes[start:start + unit_size]
+            unit_id = f"{start // unit_size:05d}-{shard[0][:8]}"
+            self.units[unit_id] = WorkUnit(unit_id, [(self._documents[h][0], h) for h in shard])
+        self._leases = {}
+        # Units waiting for a worker, in lease order
+        self._pending = deque(self.units.values())
+        # (expires, lease_id) heap; a renewed or finished lease leaves a stale entry that is skipped
+        self._expiries = []
+        # Units not yet done or failed
+        self._open = len(self.units)
+
+    @property
+    def done(self):
+        with self._lock:
+            return self._open == 0
+
+    def _release(self, unit):
+        """Queue a unit that lost its lease again, or give it up (caller holds the lock)"""
+        unit.lease_id = unit.worker = None
+        if unit.attempts < self.max_attempts:
+            unit.status = 'pending'
+            self._pending.append(unit)
+        else:
+            unit.status = 'failed'
+            self.failed += len(unit.documents)
+            self._open -= 1
+
+    def _expire(self, now):
+        """Return units whose lease ran out to the queue (caller holds the lock)"""
+        while self._expiries and self._expiries[0][0] < now:
+            expires, lease_id = heapq.heappop(self._expiries)
+            unit = self._leases.get(lease_id)
+            if unit is None or unit.expires != expires:
+                continue
+            del self._leases[lease_id]
+            self._release(unit)
+
+    def lease(self, worker):
+        """
+        Lease the next pending unit to a worker
+
+        Returns:
+            dict: {'lease', 'unit', 'lease_seconds', 'documents'}, {'wait': seconds}
+                or {'done': True}
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            if not self._pending:
+                if self._open == 0:
+                    return {'done': True}
+                return {'wait': min(1.0, self.lease_seconds / 4)}
+            unit = self._pending.popleft()
+            unit.status = 'leased'
+            unit.attempts += 1
+            unit.worker = worker
+            unit.lease_id = uuid.uuid4().hex
+            unit.expires = now + self.lease_seconds
+            self._leases[unit.lease_id] = unit
+            heapq.heappush(self._expiries, (unit.expires, unit.lease_id))
+            return {
+                'lease': unit.lease_id,
+                'unit': unit.unit_id,
+                'lease_seconds': self.lease_seconds,
+                'documents': [{'filename': filename, 'sha1': digest} for filename, digest in unit.documents]
+            }
+
+    def heartbeat(self, lease_id):
+        """
+        Renew a lease
+
+        Returns:
+            bool: False if the lease expired and the unit went to another worker
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            unit = self._leases.get(lease_id)
+            if unit is None:
+                return False
+            unit.expires = now + self.lease_seconds
+            heapq.heappush(self._expiries, (unit.expires, lease_id))
+            return True
+
+    def leased_documents(self, lease_id):
+        """
+        Documents a lease may download
+
+        Returns:
+            dict: sha1 -> path for the lease's unit, or None if the lease is not active
+        """
+        with self._lock:
+            self._expire(time.monotonic())
+            unit = self._leases.get(lease_id)
+            if unit is None:
+                return None
+            return {digest: self._documents[digest][1] for _, digest in unit.documents}
+
+    def complete(self, lease_id, results):
+        """
+        Merge a unit's results into the store
+
+        Args:
+            lease_id (str): Lease the results were produced under
+            results (list): Result dicts, failed documents carrying `error`
+
+        Returns:
+            bool: False if the lease was lost (the results are dropped)
+        """
+        with self._lock:
+            self._expire(time.monotonic())
+            unit = self._leases.pop(lease_id, None)
+            if unit is None:
+                return False
+            # Nobody else can lease or complete the unit while it is merged
+            unit.status = 'merging'
+        try:
+            if self.store is not None:
+                stored = [(position, result) for position, result in enumerate(results) if not result.get('error')]
+                self.store.add_many([result for _, result in stored],
+                                    job_keys=[(f"distributed:{self.run_id}:{unit.unit_id}", position)
+                                              for position, _ in stored])
+        except Exception:
+            with self._lock:
+                self._release(unit)
+            raise
+        with self._lock:
+            unit.status = 'done'
+            unit.lease_id = unit.worker = None
+            self._open -= 1
+            self.screened += sum(1 for result in results if not result.get('error'))
+            self.failed += sum(1 for result in results if result.get('error'))
+        return True
+
+    def status(self):
+        """Progress counts"""
+        with self._lock:
+            self._expire(time.monotonic())
+            units = {}
+            for unit in self.units.values():
+                units[unit.status] = units.get(unit.status, 0) + 1
+            return {
+                'documents': len(self._documents),
+                'duplicates': self.duplicates,
+                'already_stored': self.already_stored,
+                'screened': self.screened,
+                'failed': self.failed,
+                'units': units,
+                'workers': sorted({u.worker for u in self.units.values() if u.worker})
+            }
+
+    def serve(self, host='127.0.0.1', port=DEFAULT_PORT, token=None):
+        """
+        Serve the protocol on a background thread
+
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind (0 picks a free one)
+            token (str): Shared secret every request must present (None accepts anyone)
+
+        Returns:
+            ThreadingHTTPServer: Running server; `server_address` holds the bound port
+        """
+        server = ThreadingHTTPServer((host, port), _handler_for(self, token))
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="screening-coordinator", daemon=True).start()
+        return server
+
+
+def _handler_for(coordinator, token=None):
+    """HTTP request handler bound to a coordinator"""
+    expected = f"Bearer {token}".encode('utf-8') if token else None
+
+    class CoordinatorHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status, payload=None, body=None, content_type='application/json'):
+            if body is None:
+                body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _payload(self, length):
+            return json.loads(self.rfile.read(length) or b'{}')
+
+        def _authorized(self):
+            if expected is None:
+                return True
+            presented = self.headers.get('Authorization', '').encode('utf-8')
+            if hmac.compare_digest(presented, expected):
+                return True
+            self._send(401, {'error': "Missing or wrong coordinator token"})
+            return False
+
+        def do_GET(self):
+            if not self._authorized():
+                return
+            url = urlsplit(self.path)
+            if url.path == '/status':
+                self._send(200, coordinator.status())
+            elif url.path.startswith('/documents/'):
+                lease_id = parse_qs(url.query).get('lease', [None])[0]
+                documents = coordinator.leased_documents(lease_id)
+                if documents is None:
+                    self._send(409, {'error': "Lease lost"})
+                    return
+                path = documents.get(url.path[len('/documents/'):])
+                if path is None:
+                    self._send(404, {'error': "Document is not part of the leased unit"})
+                    return
+                with open(path, 'rb') as f:
+                    self._send(200, body=f.read(), content_type='application/octet-stream')
+            else:
+                self._send(404, {'error': f"Unknown path {self.path}"})
+
+        def do_POST(self):
+            if not self._authorized():
+                return
+            length = self.headers.get('Content-Length') or '0'
+            if not (length.isascii() and length.isdigit()):
+                self._send(400, {'error': "Content-Length must be a non-negative integer"})
+                return
+            if int(length) > MAX_BODY_BYTES:
+                # The body is never read, so the connection cannot be reused
+                self.close_connection = True
+                self._send(413, {'error': f"Request body exceeds {MAX_BODY_BYTES} bytes"})
+                return
+            try:
+                payload = self._payload(int(length))
+            except ValueError:
+                self._send(400, {'error': "Body must be JSON"})
+                return
+            if self.path == '/lease':
+                self._send(200, coordinator.lease(payload.get('worker', 'unknown')))
+            elif self.path == '/heartbeat':
+                if coordinator.heartbeat(payload.get('lease')):
+                    self._send(200, {'status': 'ok'})
+                else:
+                    self._send(409, {'error': "Lease lost"})
+            elif self.path == '/complete':
+                try:
+                    merged = coordinator.complete(payload.get('lease'), payload.get('results', []))
+                except Exception as e:
+                    self._send(500, {'error': str(e)})
+                    return
+                if merged:
+                    self._send(200, {'status': 'merged'})
+                else:
+                    self._send(409, {'error': "Lease lost"})
+            else:
+                self._send(404, {'error': f"Unknown path {self.path}"})
+
+    return CoordinatorHandler
+
+
+class LeaseLost(Exception):
+    """
+    The coordinator gave a worker's unit to someone else
+    """
+
+
+class CoordinatorUnavailable(Exception):
+    """
+    The coordinator could not be reached or answered with a server error
+    """
+
+
+class Worker:
+    """
+    Lease units from a coordinator, screen them and post the results back
+    """
+
+    def __init__(self, coordinator_url, worker_id=None, timeout=60.0, retry_seconds=RETRY_SECONDS, token=None):
+        """
+        Args:
+            coordinator_url (str): Base URL, e.g. http://screening-01:8700
+            worker_id (str): Name reported to the coordinator (default host:pid)
+            timeout (float): Seconds to wait for any single request
+            retry_seconds (float): How long to keep retrying an unreachable coordinator
+            token (str): Shared secret of the coordinator
+        """
+        self.coordinator_url = coordinator_url.rstrip('/')
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.token = token
+        self.timeout = timeout
+        self.retry_seconds = retry_seconds
+        self.pipeline = None
+        self.units_done = 0
+
+    def _request(self, path, payload=None):
+        data = json.dumps(payload).encode('utf-8') if payload is not None else None
+        headers = {'Content-Type': 'application/json'}
+        if self.token:
+            headers['Authorization'] = f"Bearer {self.token}"
+        request = urllib.request.Request(self.coordinator_url + path, data=data, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = response.read()
+                if response.headers.get('Content-Type') == 'application/json':
+                    return json.loads(body)
+                return body
+        except urllib.error.HTTPError as e:
+            if e.code == 409:
+                raise LeaseLost(path) from e
+            if e.code >= 500:
+                raise CoordinatorUnavailable(f"{path}: HTTP {e.code}") from e
+            raise
+        except (OSError, http.client.HTTPException) as e:
+            # Refused or reset connections, DNS failures and timeouts
+            raise CoordinatorUnavailable(f"{path}: {e}") from e
+
+    def _request_in_lease(self, path, payload=None):
+        """A request made while holding a lease, retried a few times before giving up"""
+        delay = RETRY_BACKOFF
+        for attempt in range(REQUEST_ATTEMPTS):
+            try:
+                return self._request(path, payload)
+            except CoordinatorUnavailable:
+                if attempt == REQUEST_ATTEMPTS - 1:
+                    raise
+                time.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_BACKOFF)
+
+    def _heartbeat(self, lease_id, interval, stop, lost):
+        while not stop.wait(interval):
+            try:
+                self._request('/heartbeat', {'lease': lease_id})
+            except LeaseLost:
+                lost.set()
+                return
+            except CoordinatorUnavailable:
+                # Transient trouble; the lease survives until it expires
+                continue
+
+    def _screen(self, lease, lost):
+        if self.pipeline is None:
+            self.pipeline = ScreeningPipeline()
+        results = []
+        for document in lease['documents']:
+            if lost.is_set():
+                raise LeaseLost(lease['unit'])
+            filename = document['filename']
+            data = self._request_in_lease(f"/documents/{document['sha1']}?lease={lease['lease']}")
+            try:
+                text = self.pipeline.parser.extract_text(NamedBytesIO(data, filename))
+                result = self.pipeline.screen_text(filename, text)
+                # The coordinator's store keeps the text in its corpus
+                result['text'] = text
+            except Exception as e:
+                result = self.pipeline.failed_result(filename, f"screening failed: {e}")
+            result['content_sha1'] = document['sha1']
+            results.append(result)
+        return results
+
+    def run_unit(self):
+        """
+        Lease, screen and complete one unit
+
+        Returns:
+            str: 'done' (nothing left), 'wait', 'completed', 'lost' or 'abandoned'
+                (the coordinator stopped answering mid-unit)
+
+        Raises:
+            CoordinatorUnavailable: No unit could be leased
+        """
+        lease = self._request('/lease', {'worker': self.worker_id})
+        if lease.get('done'):
+            return 'done'
+        if 'wait' in lease:
+            time.sleep(lease['wait'])
+            return 'wait'
+
+        stop, lost = threading.Event(), threading.Event()
+        beat = threading.Thread(target=self._heartbeat, args=(lease['lease'], lease['lease_seconds'] / 3, stop, lost),
+                                daemon=True)
+        beat.start()
+        try:
+            results = self._screen(lease, lost)
+            self._request_in_lease('/complete', {'lease': lease['lease'], 'results': results})
+        except LeaseLost:
+            return 'lost'
+        except CoordinatorUnavailable:
+            # The lease expires and the unit goes to whichever worker asks next
+            return 'abandoned'
+        finally:
+            stop.set()
+        self.units_done += 1
+        return 'completed'
+
+    def run(self):
+        """
+        Work until the coordinator has nothing left
+
+        Raises:
+            CoordinatorUnavailable: The coordinator stayed unreachable for `retry_seconds`
+        """
+        delay = RETRY_BACKOFF
+        unreachable_since = None
+        while True:
+            try:
+                outcome = self.run_unit()
+            except CoordinatorUnavailable:
+                outcome = 'unavailable'
+            if outcome == 'done':
+                return
+            if outcome not in ('unavailable', 'abandoned'):
+                delay, unreachable_since = RETRY_BACKOFF, None
+                continue
+
+            now = time.monotonic()
+            unreachable_since = unreachable_since or now
+            if now - unreachable_since >= self.retry_seconds:
+                raise CoordinatorUnavailable(f"no answer from {self.coordinator_url} for {self.retry_seconds:.0f}s")
+            time.sleep(delay)
+            delay = min(delay * 2, MAX_RETRY_BACKOFF)
+
+
+def run_worker(coordinator_url, worker_id=None, token=None):
+    """Entry point of a worker process"""
+    Worker(coordinator_url, worker_id, token=token).run()
+
+
+def run_local(paths, workers=2, store=None, **options):
+    """
+    Screen a corpus with a coordinator and local worker processes
+
+    Args:
+        paths (list): Resume files
+        workers (int): Worker processes to start
+        store (CandidateStore): Where results are merged
+        **options: Coordinator options (unit_size, lease_seconds, ...)
+
+    Returns:
+        dict: Final coordinator status
+    """
+    coordinator = Coordinator(paths, store=store, **options)
+    # Other users of the machine can reach the loopback port too
+    token = secrets.token_urlsafe(32)
+    server = coordinator.serve('127.0.0.1', 0, token=token)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    processes = [
+        multiprocessing.Process(target=run_worker, args=(url, f"local-{i}", token), daemon=True)
+        for i in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        while not coordinator.done:
+            time.sleep(0.2)
+            # Workers that died are replaced; their leases expire and are retried
+            for i, process in enumerate(processes):
+                if not process.is_alive() and process.exitcode not in (0, None) and not coordinator.done:
+                    processes[i] = multiprocessing.Process(target=run_worker, args=(url, f"local-{i}", token),
+                                                           daemon=True)
+                    processes[i].start()
+        for process in processes:
+            process.join(timeout=10)
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        server.shutdown()
+    return coordinator.status()
+
+
+def main():
+    """Run a coordinator, a worker, or both on one machine"""
+    from candidate_store import CandidateStore
+
+    arg_parser = argparse.ArgumentParser(description="Distributed resume screening")
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+
+    def corpus_options(command):
+        command.add_argument('folder', help="Folder of PDF/DOCX resumes")
+        command.add_argument('--db', default='candidates.db', help="Candidate database results are merged into")
+        command.add_argument('--unit-size', type=int, default=UNIT_SIZE)
+        command.add_argument('--lease-seconds', type=float, default=LEASE_SECONDS)
+        command.add_argument('--max-attempts', type=int, default=MAX_ATTEMPTS)
+        command.add_argument('--rescreen', action='store_true',
+                             help="Also screen documents the database already holds")
+
+    local = commands.add_parser('local', help="Coordinator plus local worker processes")
+    corpus_options(local)
+    local.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+
+    coordinator_command = commands.add_parser('coordinator', help="Serve work units to remote workers")
+    corpus_options(coordinator_command)
+    coordinator_command.add_argument('--host', default='127.0.0.1')
+    coordinator_command.add_argument('--port', type=int, default=DEFAULT_PORT)
+
+    worker_command = commands.add_parser('worker', help="Screen units leased from a coordinator")
+    worker_command.add_argument('--coordinator', required=True, help="Coordinator URL")
+    worker_command.add_argument('--processes', type=int, default=1, help="Worker processes on this host")
+
+    args = arg_parser.parse_args()
+    token = os.environ.get(TOKEN_ENV) or None
+
+    if args.command == 'worker':
+        processes = [multiprocessing.Process(target=run_worker, args=(args.coordinator, None, token))
+                     for _ in range(args.processes)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        return
+
+    if args.command == 'coordinator' and token is None and args.host not in LOOPBACK_HOSTS:
+        print(f"❌ Set {TOKEN_ENV} to a shared secret before listening on {args.host}")
+        sys.exit(1)
+
+    store = CandidateStore(args.db)
+    options = {'unit_size': args.unit_size, 'lease_seconds': args.lease_seconds,
+               'max_attempts': args.max_attempts, 'skip_stored': not args.rescreen}
+    paths = corpus_files(args.folder)
+    start = time.perf_counter()
+
+    if args.command == 'local':
+        status = run_local(paths, workers=args.workers, store=store, **options)
+    else:
+        coordinator = Coordinator(paths, store=store, **options)
+        server = coordinator.serve(args.host, args.port, token=token)
+        print(f"🛰️  Coordinator on http://{args.host}:{server.server_address[1]}: "
+              f"{len(coordinator.units)} work unit(s) of up to {args.unit_size} resume(s)")
+        try:
+            while not coordinator.done:
+                time.sleep(5)
+                status = coordinator.status()
+                print(f"📄 {status['screened']} screened, {status['failed']} failed, units {status['units']}")
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.shutdown()
+        status = coordinator.status()
+
+    store.close()
+    print(f"✅ Screened {status['screened']} resume(s) in {time.perf_counter() - start:.1f}s; "
+          f"{status['failed']} failed, {status['duplicates']} duplicate(s), "
+          f"{status['already_stored']} already in the database")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+Vectorized re-scoring of stored feature vectors
+
+Every screening result carries a compact `features` record (see
+SkillsAnalyzer.extract_features): one bit per skill/role/achievement term,
+plus experience, the number of roles and the word count. That is all the
+domain score, breakdown, role suitability and pros/cons depend on, so a whole
+population can be re-scored under new weights as NumPy array operations,
+without re-reading or re-parsing a single document.
+
+Usage:
+    python feature_vectors.py --db candidates.db --weights weights.json [--apply]
+"""
+
+import argparse
+import json
+
+import numpy as np
+
+from candidate_result import BREAKDOWN_KEYS, FIT_LEVELS, Finding, render_finding
+from skills_analyzer import SkillsAnalyzer
+
+
+class FeatureMatrix:
+    """
+    Feature records of a population, packed column-wise
+    """
+
+    def __init__(self, hits, experience, num_roles, word_count):
+        """
+        Args:
+            hits (np.ndarray): (n, terms) bool matrix of matched terms
+            experience (np.ndarray): Years of experience
+            num_roles (np.ndarray): Roles found in the work history
+            word_count (np.ndarray): Words in the resume text
+        """
+        self.hits = hits
+        self.experience = experience
+        self.num_roles = num_roles
+        self.word_count = word_count
+
+    def __len__(self):
+        return len(self.experience)
+
+    @classmethod
+    def from_features(cls, features, analyzer):
+        """
+        Pack feature records produced by `analyzer`
+
+        Args:
+            features (list): Feature dicts
+            analyzer (SkillsAnalyzer): Analyzer whose vocabulary the records use
+
+        Returns:
+            FeatureMatrix: Packed features
+        """
+        n_terms = len(analyzer.feature_terms)
+        n_bytes = (n_terms + 7) // 8
+        packed = bytearray()
+        for record in features:
+            if record['vocabulary'] != analyzer.vocabulary_id:
+                raise ValueError("Feature record was built with a different skill vocabulary")
+            packed += int(record['hits'] or '0', 16).to_bytes(n_bytes, 'little')
+
+        bits = np.frombuffer(bytes(packed), dtype=np.uint8).reshape(len(features), n_bytes)
+        hits = np.unpackbits(bits, axis=1, bitorder='little')[:, :n_terms].astype(bool)
+        return cls(
+            hits,
+            np.array([record['experience'] for record in features], dtype=np.float64),
+            np.array([record['num_roles'] for record in features], dtype=np.int32),
+            np.array([record['word_count'] for record in features], dtype=np.int32)
+        )
+
+
+class PopulationScores:
+    """
+    Scores of a whole population, as arrays
+
+    `result(i)` materializes row i in the same shape as SkillsAnalyzer.analyze.
+    """
+
+    def __init__(self, scorer, matrix, domain_score, breakdown, fit, premium, pros, cons):
+        self.scorer = scorer
+        self.matrix = matrix
+        self.domain_score = domain_score
+        # (n, 5) component scores in BREAKDOWN_KEYS order
+        self.breakdown = breakdown
+        # (n, roles) index into FIT_LEVELS
+        self.fit = fit
+        # (n, premium categories) bool
+        self.premium = premium
+        # Finding name (lowercase) -> bool array, e.g. to count how many candidates a weight change flips
+        self.pros = pros
+        self.cons = cons
+
+    def __len__(self):
+        return len(self.domain_score)
+
+    def result(self, i):
+        """
+        Analysis fields of one candidate
+
+        Returns:
+            dict: domain_score, score_breakdown, suitability, best_fit_role, pros and cons
+        """
+        scorer = self.scorer
+        hits = self.matrix.hits[i]
+        suitability = {}
+        for r, role in enumerate(scorer.roles):
+            suitability[role] = {
+                'fit': FIT_LEVELS[self.fit[i, r]],
+                'matched_keywords': [scorer.terms[t] for t in scorer.role_terms[r] if hits[t]]
+            }
+
+        counts = [len(data['matched_keywords']) for data in suitability.values()]
+        best = [role for role, count in zip(scorer.roles, counts) if count == max(counts) and count > 0]
+
+        params = {
+            'premium_count': int(self.premium[i].sum()),
+            'num_roles': int(self.matrix.num_roles[i]),
+            'experience': self.matrix.experience[i].item(),
+            'high_fits': [role for r, role in enumerate(scorer.roles) if self.fit[i, r] == 2]
+        }
+
+        return {
+            'domain_score': int(self.domain_score[i]),
+            'score_breakdown': {key: int(value) for key, value in zip(BREAKDOWN_KEYS, self.breakdown[i])},
+            'suitability': suitability,
+            'best_fit_role': ' / '.join(best) if best else "General Procurement",
+            'pros': [render_finding(Finding[rule.upper()], **params) for rule, flags in self.pros.items() if flags[i]],
+            'cons': [render_finding(Finding[rule.upper()], **params) for rule, flags in self.cons.items() if flags[i]]
+        }
+
+
+class VectorizedScorer:
+    """
+    NumPy re-implementation of SkillsAnalyzer's scoring over a FeatureMatrix
+    """
+
+    def __init__(self, analyzer=None):
+        """
+        Args:
+            analyzer (SkillsAnalyzer): Provides the vocabulary and term groups
+        """
+        self.analyzer = analyzer or SkillsAnalyzer()
+        self.terms = self.analyzer.feature_terms
+        index = {term: i for i, term in enumerate(self.terms)}
+
+        # Base skills count distinct first words of the formatted skill names
+        procurement = list(dict.fromkeys(
+            keyword for keywords in self.analyzer.procurement_keywords.values() for keyword in keywords
+        ))
+        roots = sorted({self.analyzer._format_skill_name(k).split()[0].lower() for k in procurement})
+        self.root_membership = np.zeros((len(self.terms), len(roots)), dtype=np.float32)
+        for keyword in procurement:
+            root = self.analyzer._format_skill_name(keyword).split()[0].lower()
+            self.root_membership[index[keyword], roots.index(root)] = 1
+
+        categories = list(self.analyzer.premium_skills_keywords.values())
+        self.premium_membership = np.zeros((len(self.terms), len(categories)), dtype=np.float32)
+        for c, keywords in enumerate(categories):
+            for keyword in keywords:
+                self.premium_membership[index[keyword], c] = 1
+
+        self.concept_terms = np.array([index[t] for t in self.analyzer.scoring_concepts])
+        # Keeps duplicates, which count once per listing
+        self.density_terms = np.array([index[t] for t in self.analyzer.density_keywords])
+        self.achievement_terms = np.array([index[t] for t in self.analyzer.achievement_keywords])
+
+        self.roles = list(self.analyzer.role_keywords)
+        self.role_terms = [
+            [index[t] for t in dict.fromkeys(keywords)] for keywords in self.analyzer.role_keywords.values()
+        ]
+
+    def score(self, matrix, weights=None):
+        """
+        Score every candidate in `matrix`
+
+        Args:
+            matrix (FeatureMatrix): Packed features
+            weights (dict): Overrides for the analyzer's weights
+
+        Returns:
+            PopulationScores: Scores, breakdown, suitability and pros/cons flags
+        """
+        w = {**self.analyzer.weights, **(weights or {})}
+        hits = matrix.hits
+        # float32 so the group sums below run as BLAS matrix products
+        hit_counts = hits.astype(np.float32)
+        experience = matrix.experience
+        num_roles = matrix.num_roles
+
+        base_categories = ((hit_counts @ self.root_membership) > 0).sum(axis=1)
+        base = np.minimum(w['base_skills_max'], base_categories * w['base_skill_points'])
+
+        concepts = hits[:, self.concept_terms].sum(axis=1)
+        advanced = np.minimum(w['advanced_concepts_max'], concepts * w['advanced_concept_points'])
+
+        premium = (hit_counts @ self.premium_membership) > 0
+        n_premium = premium.sum(axis=1)
+        premium_score = np.minimum(w['premium_skills_max'], n_premium * w['premium_skill_points'])
+
+        density = np.minimum(w['density_max'], hits[:, self.density_terms].sum(axis=1) * w['density_keyword_points'])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_tenure = np.where(num_roles > 0, experience / np.maximum(num_roles, 1), 0.0)
+        stable = (num_roles > 0) & (avg_tenure >= w['stability_min_avg_tenure'])
+        stability = np.select(
+            [experience > 2, experience == 0],
+            [np.where(stable, w['stability_points'], 0),
+             np.where(matrix.word_count > 100, w['stability_unknown_points'], 0)],
+            default=w['stability_points']
+        )
+
+        breakdown = np.stack([base, advanced, premium_score, density, stability], axis=1)
+        domain_score = np.minimum(100, np.round(breakdown.sum(axis=1))).astype(np.int32)
+
+        role_counts = np.stack([hits[:, terms].sum(axis=1) for terms in self.role_terms], axis=1)
+        fit = np.where(role_counts >= 2, 2, np.where(role_counts > 0, 1, 0)).astype(np.int8)
+
+        achievements = hits[:, self.achievement_terms].sum(axis=1)
+        has_history = (experience > 0) & (num_roles > 0)
+        any_high = (fit == 2).any(axis=1)
+        any_medium = (fit == 1).any(axis=1)
+
+        pros = {
+            'high_score': domain_score >= 70,
+            'premium_skills': n_premium > 0,
+            'strong_achievements': achievements >= 5,
+            'some_achievements': (achievements >= 2) & (achievements < 5),
+            'long_tenure': has_history & (experience > 5) & (avg_tenure > 3.0),
+            'strong_alignment': any_high
+        }
+        cons = {
+            'low_score': domain_score < 40,
+            'no_premium_skills': n_premium == 0,
+            'few_achievements': achievements < 2,
+            'job_hopping': has_history & (experience > 2) & (avg_tenure < 1.0),
+            'weak_alignment': ~any_high & ~any_medium,
+            'low_density': density < 3
+        }
+
+        return PopulationScores(self, matrix, domain_score, breakdown, fit, premium, pros, cons)
+
+
+def main():
+    """Re-score stored candidates under new weights from the command line"""
+    from candidate_store import CandidateStore
+
+    arg_parser = argparse.ArgumentParser(description="Re-score stored candidates without re-parsing")
+    arg_parser.add_argument('--db', default='candidates.db', help="Candidate database")
+    arg_parser.add_argument('--weights', default=None, help="JSON file overriding DEFAULT_WEIGHTS")
+    arg_parser.add_argument('--apply', action='store_true', help="Write the new scores back to the database")
+    args = arg_parser.parse_args()
+
+    weights = {}
+    if args.weights:
+        with open(args.weights, 'r', encoding='utf-8') as f:
+            weights = json.load(f)
+
+    store = CandidateStore(args.db)
+    scorer = VectorizedScorer(SkillsAnalyzer(weights))
+    ids, features = store.load_features(scorer.analyzer.vocabulary_id)
+    if not ids:
+        print("📭 No candidates with stored features for the current skill vocabulary")
+        return
+
+    scores = scorer.score(FeatureMatrix.from_features(features, scorer.analyzer))
+    print(f"📊 Re-scored {len(ids)} candidates: mean domain score {scores.domain_score.mean():.1f}, "
+          f"{int(scores.pros['high_score'].sum())} high, {int(scores.cons['low_score'].sum())} low")
+
+    if args.apply:
+        store.update_scores(ids, (scores.result(i) for i in range(len(ids))))
+        print("✅ Scores written back to the database")
+
+
+if __name__ == "__main__":
+    main()
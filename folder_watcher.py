@@ -0,0 +1,205 @@
+"""
+Watched-folder continuous ingestion
+
+Polls a directory for new or changed PDF/DOCX resumes, screens only those
+with the existing pipeline and appends the results to a JSON Lines store.
+A checkpoint of file fingerprints survives restarts, so a restarted watcher
+picks up where it stopped instead of rescanning the whole folder.
+
+Each batch is committed to the candidate database first, then appended to
+the JSON Lines file, then checkpointed. A crash in between replays the batch
+on restart. The database keys every result by file path and content
+fingerprint, so it stores a replayed batch once. The JSON Lines file may
+repeat the lines written after the commit.
+
+Usage:
+    python folder_watcher.py /shared/resumes --results screening_results.jsonl
+"""
+
+import argparse
+import json
+import os
+import time
+
+from candidate_identity import content_fingerprint
+from candidate_store import CandidateStore
+from screening_pipeline import ScreeningPipeline, screen_iter
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+
+class FolderWatcher:
+    """
+    Screen resumes dropped into a folder, once per distinct file content
+    """
+
+    def __init__(self, folder, results_path='screening_results.jsonl', checkpoint_path=None,
+                 poll_interval=1.0, settle_seconds=0.5, batch_size=16, store=None):
+        """
+        Args:
+            folder (str): Directory to watch (recursively)
+            results_path (str): JSON Lines file results are appended to
+            checkpoint_path (str): Fingerprint checkpoint, defaults to a hidden file in `folder`
+            poll_interval (float): Seconds between scans when the folder is idle
+            settle_seconds (float): Minimum age of a file's last write before it is read,
+                so half-copied files are not screened
+            batch_size (int): Files screened between checkpoint writes; keeps
+                drop-to-result latency bounded during bursts
+            store (CandidateStore): Also record results in the candidate database
+        """
+        self.folder = os.path.abspath(folder)
+        self.results_path = results_path
+        self.checkpoint_path = checkpoint_path or os.path.join(self.folder, '.screening_checkpoint.json')
+        self.poll_interval = poll_interval
+        self.settle_seconds = settle_seconds
+        self.batch_size = batch_size
+        self.store = store
+        self.pipeline = None
+        self.checkpoint = self._load_checkpoint()
+
+    def _load_checkpoint(self):
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_checkpoint(self):
+        # Write-then-rename so a crash never leaves a truncated checkpoint
+        tmp_path = self.checkpoint_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _scan(self):
+        """
+        Find files whose size or modification time differs from the checkpoint
+
+        Returns:
+            list: (relative_path, stat_result) pairs, oldest first
+        """
+        changed = []
+        now = time.time()
+        for root, dirs, files in os.walk(self.folder):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            for filename in files:
+                if filename.startswith('.') or not filename.lower().endswith(SUPPORTED_EXTENSIONS):
+                    continue
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if now - stat.st_mtime < self.settle_seconds:
+                    continue
+
+                rel_path = os.path.relpath(path, self.folder)
+                previous = self.checkpoint.get(rel_path)
+                if previous and previous['size'] == stat.st_size and previous['mtime_ns'] == stat.st_mtime_ns:
+                    continue
+                changed.append((rel_path, stat))
+
+        changed.sort(key=lambda item: item[1].st_mtime)
+        return changed
+
+    def _fingerprint_batch(self, batch):
+        """
+        Read and hash a batch of changed files, dropping ones whose content is unchanged
+
+        Returns:
+            list: (relative_path, sha1, bytes) for files that need screening
+        """
+        documents = []
+        for rel_path, stat in batch:
+            try:
+                with open(os.path.join(self.folder, rel_path), 'rb') as f:
+                    data = f.read()
+            except OSError:
+                continue
+
+            digest = content_fingerprint(data)
+            previous = self.checkpoint.get(rel_path)
+            self.checkpoint[rel_path] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha1': digest}
+            if previous and previous.get('sha1') == digest:
+                # Touched or copied over with identical content
+                continue
+            documents.append((rel_path, digest, data))
+        return documents
+
+    def _store_key(self, result):
+        """Replay key of a result in the candidate database: one row per path and content"""
+        return f"watch:{os.path.join(self.folder, result['path'])}:{result['content_sha1']}", 0
+
+    def poll_once(self):
+        """
+        Screen every new or changed file currently in the folder
+
+        Returns:
+            int: Number of resumes screened
+        """
+        changed = self._scan()
+        screened = 0
+
+        for start in range(0, len(changed), self.batch_size):
+            documents = self._fingerprint_batch(changed[start:start + self.batch_size])
+            if documents:
+                if self.pipeline is None:
+                    self.pipeline = ScreeningPipeline(corpus=self.store.corpus if self.store else None)
+
+                sources = [(os.path.basename(rel_path), data) for rel_path, _, data in documents]
+                results = list(screen_iter(sources, self.pipeline))
+                for (rel_path, _, _), result in zip(documents, results):
+                    result['path'] = rel_path
+
+                if self.store is not None:
+                    stored = [result for result in results if not result.get('error')]
+                    self.store.add_many(stored, job_keys=[self._store_key(result) for result in stored])
+                with open(self.results_path, 'a', encoding='utf-8') as out:
+                    for result in results:
+                        out.write(json.dumps(result) + '\n')
+                screened += len(results)
+            self._save_checkpoint()
+
+        return screened
+
+    def run_forever(self):
+        """Poll until interrupted, rescanning immediately while work keeps arriving"""
+        print(f"👀 Watching {self.folder} (results -> {self.results_path})")
+        while True:
+            screened = self.poll_once()
+            if screened:
+                print(f"✅ Screened {screened} resume(s)")
+            else:
+                time.sleep(self.poll_interval)
+
+
+def main():
+    """Run the folder watcher from the command line"""
+    arg_parser = argparse.ArgumentParser(description="Screen resumes dropped into a folder")
+    arg_parser.add_argument('folder')
+    arg_parser.add_argument('--results', default='screening_results.jsonl',
+                            help="JSON Lines file results are appended to")
+    arg_parser.add_argument('--checkpoint', default=None,
+                            help="Fingerprint checkpoint file (default: inside the watched folder)")
+    arg_parser.add_argument('--interval', type=float, default=1.0, help="Idle poll interval in seconds")
+    arg_parser.add_argument('--batch-size', type=int, default=16)
+    arg_parser.add_argument('--db', default=None,
+                            help="Also store results in this candidate database (e.g. candidates.db)")
+    arg_parser.add_argument('--once', action='store_true', help="Screen pending files and exit")
+    args = arg_parser.parse_args()
+
+    store = CandidateStore(args.db) if args.db else None
+    watcher = FolderWatcher(args.folder, results_path=args.results, checkpoint_path=args.checkpoint,
+                            poll_interval=args.interval, batch_size=args.batch_size, store=store)
+    if args.once:
+        print(f"✅ Screened {watcher.poll_once()} resume(s)")
+        return
+
+    try:
+        watcher.run_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Typo-tolerant keyword matching with a SymSpell deletion index
+
+Resumes misspell skills ("procurment", "negotations") and vary their
+punctuation ("Power-BI", "SAP-MM"). Instead of computing edit distances
+against every keyword word for every token, the matcher precomputes all
+deletion variants of the keyword words once. A resume token then only needs
+its own deletion variants looked up in that index, and the few candidates
+found are verified with a bounded edit distance. Each distinct token is
+resolved once and cached, so steady-state cost stays close to exact matching.
+"""
+
+import re
+from itertools import combinations
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9%&+#]+")
+
+
+def _deletes(word, distance):
+    """All strings obtained by deleting up to `distance` characters from `word`"""
+    variants = {word}
+    for n in range(1, min(distance, len(word)) + 1):
+        for positions in combinations(range(len(word)), n):
+            variants.add(''.join(c for i, c in enumerate(word) if i not in positions))
+    return variants
+
+
+def edit_distance(a, b, limit):
+    """
+    Optimal string alignment distance (adjacent swaps count as one edit)
+
+    Returns:
+        int: The distance, or limit + 1 once it is known to exceed `limit`
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if previous2 is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class FuzzyMatcher:
+    """
+    Match keyword phrases in text, tolerating small misspellings per word
+    """
+
+    def __init__(self, terms, max_edit_distance=1, min_word_length=5):
+        """
+        Args:
+            terms (list): Keyword phrases to find
+            max_edit_distance (int): Edits tolerated per word; words of 9+
+                characters get the full budget, shorter ones at most 1
+            min_word_length (int): Shorter words (sap, rfq, bi, ...) only match exactly;
+                one edit turns them into too many ordinary words
+        """
+        self.max_edit_distance = max_edit_distance
+        self.min_word_length = min_word_length
+        # Phrases in token form, so "power-bi" and "power bi" look the same
+        self.terms = {term: ' '.join(TOKEN_PATTERN.findall(term)) for term in terms}
+        self.words = {word for phrase in self.terms.values() for word in phrase.split()}
+        # Longer tokens (plus a plural "s") are more edits away than any budget allows
+        self.max_word_length = max((len(word) for word in self.words), default=0)
+
+        self.deletes = {}
+        for word in self.words:
+            if len(word) >= min_word_length:
+                for variant in _deletes(word, self._budget(word)):
+                    self.deletes.setdefault(variant, set()).add(word)
+        self._cache = {}
+
+    def _budget(self, word):
+        return self.max_edit_distance if len(word) >= 9 else min(1, self.max_edit_distance)
+
+    def correct(self, token):
+        """
+        Closest keyword word within the edit budget, or the token itself
+
+        Args:
+            token (str): Lowercase word from a resume
+
+        Returns:
+            str: Corrected word
+        """
+        if (token in self.words or len(token) < self.min_word_length
+                or len(token) > self.max_word_length + self.max_edit_distance + 1):
+            return token
+        cached = self._cache.get(token)
+        if cached is not None:
+            return cached
+
+        best, best_distance = token, None
+        # A trailing plural "s" is not a typo: "negotations" should reach "negotiation"
+        forms = (token, token[:-1]) if token.endswith('s') and len(token) > self.min_word_length else (token,)
+        for form in forms:
+            budget = self._budget(form)
+            candidates = set()
+            for variant in _deletes(form, budget):
+                candidates |= self.deletes.get(variant, set())
+            for word in sorted(candidates):
+                limit = min(budget, self._budget(word))
+                distance = edit_distance(form, word, limit)
+                if distance <= limit and (best_distance is None or distance < best_distance):
+                    best, best_distance = word, distance
+
+        if len(self._cache) > 100000:
+            self._cache.clear()
+        self._cache[token] = best
+        return best
+
+    def normalize(self, text):
+        """Lowercase text as space-separated, spelling-corrected tokens"""
+        return ' '.join(self.correct(token) for token in TOKEN_PATTERN.findall(text.lower()))
+
+    def match(self, text):
+        """
+        Keyword phrases present in text after normalization
+
+        Args:
+            text (str): Resume text
+
+        Returns:
+            set: Matched terms (in their original spelling)
+        """
+        normalized = self.normalize(text)
+        return {term for term, phrase in self.terms.items() if phrase and phrase in normalized}
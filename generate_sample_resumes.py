@@ -1,16 +1,38 @@
 """
 Sample Resume Generator for Testing the AI Resume Screener
-Creates realistic sample resumes in DOCX format for different experience levels
+Creates realistic sample resumes in DOCX format for different experience levels,
+or, with --corpus, a seeded synthetic corpus of DOCX and PDF resumes with a
+ground-truth manifest for load and accuracy testing
 """
 
+import argparse
+import json
+import os
+import random
+import re
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from io import BytesIO
+
 from docx import Document
-from docx.shared import Pt, RGBColor, Inches
+from docx.enum.section import WD_SECTION
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-import random
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Pt, RGBColor, Inches
+
+from band_classifier import BandClassifier
 
 class SampleResumeGenerator:
     
-    def __init__(self):
+    def __init__(self, seed=None):
+        """
+        Args:
+            seed (int): Seed for reproducible resumes; None draws a fresh one
+        """
+        self.rng = random.Random(seed)
         self.sample_names = [
             "Rajesh Kumar", "Priya Sharma", "Amit Patel", "Sneha Reddy", "Vikram Singh",
             "Anjali Gupta", "Karthik Iyer", "Divya Nair", "Rohan Mehta", "Kavita Joshi"
@@ -81,7 +103,7 @@ class SampleResumeGenerator:
             section.right_margin = Inches(0.75)
         
         # Name
-        name = random.choice(self.sample_names)
+        name = self.rng.choice(self.sample_names)
         name_para = doc.add_paragraph()
         name_run = name_para.add_run(name)
         name_run.font.size = Pt(20)
@@ -90,7 +112,7 @@ class SampleResumeGenerator:
         
         # Contact Info
         email = f"{name.lower().replace(' ', '.')}@email.com"
-        phone = f"+91 {random.randint(70000, 99999)} {random.randint(10000, 99999)}"
+        phone = f"+91 {self.rng.randint(70000, 99999)} {self.rng.randint(10000, 99999)}"
         contact_para = doc.add_paragraph()
         contact_run = contact_para.add_run(f"{email} | {phone}")
         contact_run.font.size = Pt(11)
@@ -106,12 +128,12 @@ class SampleResumeGenerator:
         # Core Competencies
         self._add_heading(doc, "CORE COMPETENCIES")
         num_skills = min(8 + (experience_years // 2), len(self.procurement_skills_pool))
-        skills = random.sample(self.procurement_skills_pool, num_skills)
+        skills = self.rng.sample(self.procurement_skills_pool, num_skills)
         
         # Add premium skills for senior roles
         if experience_years >= 2:
             num_premium = min(1 + (experience_years // 4), 3)
-            premium_skills = random.sample(self.premium_skills_pool, num_premium)
+            premium_skills = self.rng.sample(self.premium_skills_pool, num_premium)
             skills.extend(premium_skills)
         
         skills_text = " • ".join(skills)
@@ -126,7 +148,7 @@ class SampleResumeGenerator:
         job_count = 0
         
         while remaining_years > 0 and job_count < 4:
-            years_in_role = min(random.randint(2, 4), remaining_years)
+            years_in_role = min(self.rng.randint(2, 4), remaining_years)
             if years_in_role == 0:
                 years_in_role = 1
             
@@ -135,17 +157,17 @@ class SampleResumeGenerator:
             
             # Determine appropriate job title
             if remaining_years >= 12:
-                title = random.choice(self.job_titles['4C'])
+                title = self.rng.choice(self.job_titles['4C'])
             elif remaining_years >= 8:
-                title = random.choice(self.job_titles['4B'])
+                title = self.rng.choice(self.job_titles['4B'])
             elif remaining_years >= 4:
-                title = random.choice(self.job_titles['4A'])
+                title = self.rng.choice(self.job_titles['4A'])
             elif remaining_years >= 2:
-                title = random.choice(self.job_titles['5B'])
+                title = self.rng.choice(self.job_titles['5B'])
             else:
-                title = random.choice(self.job_titles['5A'])
+                title = self.rng.choice(self.job_titles['5A'])
             
-            company = random.choice(self.companies)
+            company = self.rng.choice(self.companies)
             
             # Job header
             job_para = doc.add_paragraph()
@@ -191,7 +213,8 @@ class SampleResumeGenerator:
         doc.save(filename)
         print(f"✅ Generated resume: {filename} (Band: {band}, Experience: {experience_years} years)")
     
-    def _add_heading(self, doc, text):
+    @staticmethod
+    def _add_heading(doc, text):
         """Add a formatted heading"""
         para = doc.add_paragraph()
         run = para.add_run(text)
@@ -225,15 +248,614 @@ class SampleResumeGenerator:
         responsibilities = base_responsibilities[:3]
         
         if experience_level >= 3:
-            responsibilities.extend(random.sample(intermediate_responsibilities, 2))
+            responsibilities.extend(self.rng.sample(intermediate_responsibilities, 2))
         
         if experience_level >= 8:
-            responsibilities.extend(random.sample(advanced_responsibilities, 2))
+            responsibilities.extend(self.rng.sample(advanced_responsibilities, 2))
         
         return responsibilities
 
+MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+FIRST_NAMES = [
+    "Aarav", "Aditi", "Amit", "Ananya", "Anjali", "Arjun", "Deepak", "Divya", "Gaurav", "Ishita",
+    "Karthik", "Kavita", "Lakshmi", "Manish", "Meera", "Neha", "Nikhil", "Pooja", "Prakash", "Priya",
+    "Rahul", "Rajesh", "Ritu", "Rohan", "Sanjay", "Shreya", "Sneha", "Suresh", "Varun", "Vikram"
+]
+
+LAST_NAMES = [
+    "Agarwal", "Banerjee", "Bhat", "Chopra", "Das", "Desai", "Ghosh", "Gupta", "Iyer", "Jain",
+    "Joshi", "Kapoor", "Khan", "Kulkarni", "Kumar", "Malhotra", "Mehta", "Menon", "Mishra", "Nair",
+    "Patel", "Pillai", "Rao", "Reddy", "Saxena", "Shah", "Sharma", "Singh", "Srinivasan", "Verma"
+]
+
+PROJECT_CATEGORIES = (
+    "packaging", "logistics", "IT hardware", "facilities", "raw materials", "MRO", "marketing services",
+    "professional services", "travel", "electronic components"
+)
+
+PROJECT_TEMPLATES = (
+    "Ran a {category} sourcing event across {n} suppliers, cutting landed cost by {pct}%",
+    "Renegotiated {category} contracts worth ${value}M and extended payment terms to {days} days",
+    "Consolidated the {category} supplier base from {n} to {m} vendors with a quarterly scorecard",
+    "Built a spend analysis of {category} purchases that identified ${value}M of savings",
+    "Introduced should-cost models for {category}, reducing quoted prices by {pct}%",
+)
+
+# Layout and content quirks that real resumes have and extractors trip over
+EDGE_CASES = (
+    'table',              # skills and work history in tables
+    'columns',            # two-column body
+    'attachment',         # large embedded scan after the resume
+    'overlapping_dates',  # a concurrent role overlapping the main history
+    'dates_only',         # no stated "N years of experience"; dates are the only source
+)
+
+FILES_PER_DIRECTORY = 1000
+LINES_PER_PAGE = 48
+
+
+def misspell(word, rng):
+    """Drop, swap or replace one inner letter"""
+    i = rng.randrange(1, len(word) - 1)
+    edit = rng.choice(('drop', 'swap', 'replace'))
+    if edit == 'drop':
+        return word[:i] + word[i + 1:]
+    if edit == 'swap':
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word[:i] + rng.choice('aeiourst') + word[i + 1:]
+
+
+def _noise(rng, width, n_bytes):
+    """Incompressible grayscale pixels, roughly n_bytes of them"""
+    height = max(1, n_bytes // width)
+    return width, height, rng.randbytes(width * height)
+
+
+def _png(width, height, pixels):
+    """8-bit grayscale PNG from raw pixels"""
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    rows = b''.join(b'\x00' + pixels[y * width:(y + 1) * width] for y in range(height))
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 0, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(rows, 1))
+            + chunk(b'IEND', b''))
+
+
+class MinimalPDF:
+    """
+    Just enough PDF 1.4 for synthetic resumes: Helvetica text, rules and
+    grayscale images, written without a PDF library
+    """
+
+    WIDTH, HEIGHT = 612, 792
+
+    def __init__(self):
+        self.pages = []
+
+    def add_page(self, content, image=None):
+        """
+        Args:
+            content (bytes): Page content stream (fonts /F1 regular, /F2 bold)
+            image (tuple): Optional (width, height, gray pixels) drawn as /Im1
+        """
+        self.pages.append((content, image))
+
+    def to_bytes(self):
+        objects = [None, None]
+
+        def add(body):
+            objects.append(body)
+            return len(objects)
+
+        def stream(entries, data):
+            return b'<< ' + entries.encode() + b' /Length %d >>\nstream\n' % len(data) + data + b'\nendstream'
+
+        regular = add(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>')
+        bold = add(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>')
+        kids = []
+        for content, image in self.pages:
+            resources = f"/Font << /F1 {regular} 0 R /F2 {bold} 0 R >>"
+            if image:
+                width, height, pixels = image
+                image_id = add(stream(f"/Type /XObject /Subtype /Image /Width {width} /Height {height} "
+                                      f"/ColorSpace /DeviceGray /BitsPerComponent 8", pixels))
+                resources += f" /XObject << /Im1 {image_id} 0 R >>"
+            content_id = add(stream('', content))
+            kids.append(add(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {self.WIDTH} {self.HEIGHT}] "
+                            f"/Resources << {resources} >> /Contents {content_id} 0 R >>".encode()))
+        objects[0] = b'<< /Type /Catalog /Pages 2 0 R >>'
+        objects[1] = f"<< /Type /Pages /Kids [{' '.join(f'{kid} 0 R' for kid in kids)}] /Count {len(kids)} >>".encode()
+
+        out = bytearray(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        offsets = []
+        for number, body in enumerate(objects, 1):
+            offsets.append(len(out))
+            out += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+        xref = len(out)
+        out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+        for offset in offsets:
+            out += b'%010d 00000 n \n' % offset
+        out += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+        return bytes(out)
+
+
+class PDFLayout:
+    """
+    Flow resume blocks onto MinimalPDF pages, in one or two columns
+    """
+
+    MARGIN = 54
+    GUTTER = 24
+    STYLES = {
+        'title': (18, True), 'contact': (10, False), 'heading': (12, True),
+        'text': (10, False), 'bullet': (10, False), 'job': (10, True)
+    }
+
+    def __init__(self, columns=1):
+        self.pdf = MinimalPDF()
+        self.columns = columns
+        self.ops = []
+        self.image = None
+        self.full_width = True
+        self.column = 0
+        self.top = self.y = MinimalPDF.HEIGHT - self.MARGIN
+
+    def _frame(self):
+        """(x, width) of the area text currently flows into"""
+        usable = MinimalPDF.WIDTH - 2 * self.MARGIN
+        if self.full_width or self.columns == 1:
+            return self.MARGIN, usable
+        width = (usable - self.GUTTER * (self.columns - 1)) / self.columns
+        return self.MARGIN + self.column * (width + self.GUTTER), width
+
+    def start_columns(self):
+        self.full_width = False
+        self.top = self.y
+
+    def new_page(self):
+        self.pdf.add_page(b''.join(self.ops), self.image)
+        self.ops, self.image = [], None
+        self.column = 0
+        self.top = self.y = MinimalPDF.HEIGHT - self.MARGIN
+
+    def _advance(self, height):
+        if self.y - height < self.MARGIN:
+            if not self.full_width and self.column + 1 < self.columns:
+                self.column += 1
+                self.y = self.top
+            else:
+                self.new_page()
+        self.y -= height
+
+    @staticmethod
+    def _wrap(text, width, size):
+        chars = max(10, int(width / (size * 0.5)))
+        lines, line = [], ''
+        for word in text.split():
+            if line and len(line) + 1 + len(word) > chars:
+                lines.append(line)
+                line = word
+            else:
+                line = f"{line} {word}" if line else word
+        return lines + [line] if line else lines
+
+    def _show(self, text, x, size, bold):
+        escaped = (text.encode('cp1252', 'replace')
+                   .replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)'))
+        self.ops.append(b'BT /%s %d Tf %.1f %.1f Td (' % (b'F2' if bold else b'F1', size, x, self.y)
+                        + escaped + b') Tj ET\n')
+
+    def text(self, kind, text):
+        size, bold = self.STYLES[kind]
+        x, width = self._frame()
+        indent = 12 if kind == 'bullet' else 0
+        for i, line in enumerate(self._wrap(text, width - indent, size)):
+            self._advance(size * 1.35)
+            if kind == 'bullet' and i == 0:
+                self._show('•', x, size, bold)
+            self._show(line, x + indent, size, bold)
+        if kind == 'heading':
+            self._advance(2)
+
+    def table(self, rows):
+        x, width = self._frame()
+        cell_width = width / max(len(row) for row in rows)
+        for r, row in enumerate(rows):
+            bold = r == 0
+            cells = [self._wrap(cell, cell_width - 6, 9) for cell in row]
+            for n in range(max(len(lines) for lines in cells)):
+                self._advance(12)
+                for c, lines in enumerate(cells):
+                    if n < len(lines):
+                        self._show(lines[n], x + c * cell_width + 3, 9, bold)
+            self._advance(4)
+            self.ops.append(b'%.1f %.1f m %.1f %.1f l S\n' % (x, self.y + 2, x + width, self.y + 2))
+
+    def picture(self, image):
+        """Draw an image filling the rest of the page (it is a page resource)"""
+        if self.image is not None:
+            self.new_page()
+        x, width = self.MARGIN, MinimalPDF.WIDTH - 2 * self.MARGIN
+        image_width, image_height, _ = image
+        height = min(self.y - self.MARGIN, width * image_height / image_width)
+        self.ops.append(b'q %.1f 0 0 %.1f %.1f %.1f cm /Im1 Do Q\n' % (width, height, x, self.y - height))
+        self.image = image
+        self.y -= height
+
+    def to_bytes(self):
+        if self.ops or not self.pdf.pages:
+            self.new_page()
+        return self.pdf.to_bytes()
+
+
+class CorpusResumeGenerator(SampleResumeGenerator):
+    """
+    Deterministic synthetic resumes with ground truth, for load tests
+
+    Resume `index` of corpus `seed` is always the same document whichever
+    process builds it, so a corpus can be generated in parallel, in any
+    order, and regenerated exactly.
+    """
+
+    def __init__(self, seed=0, formats=('docx', 'pdf'), as_of=(2026, 1), pages=1, skill_density=0.5,
+                 typo_rate=0.0, edge_case_rate=0.1, attachment_mb=5.0):
+        """
+        Args:
+            seed (int): Corpus seed
+            formats (tuple): File formats to draw from ('docx', 'pdf')
+            as_of (tuple): (year, month) that "Present" stands for; expected
+                experience is computed as of this month
+            pages (int): Approximate length of each resume in pages
+            skill_density (float): Share of the skill pools a resume lists (0-1)
+            typo_rate (float): Share of content words (5+ letters) misspelled
+            edge_case_rate (float): Probability of each edge case per resume
+            attachment_mb (float): Size of the embedded scan in 'attachment' resumes
+        """
+        super().__init__(seed)
+        self.seed = seed
+        self.formats = tuple(formats)
+        self.as_of = as_of
+        self.now = as_of[0] * 12 + as_of[1] - 1
+        self.pages = pages
+        self.skill_density = skill_density
+        self.typo_rate = typo_rate
+        self.edge_case_rate = edge_case_rate
+        self.attachment_mb = attachment_mb
+        self.band_classifier = BandClassifier()
+        self.typos = 0
+
+    def _typo(self, text):
+        """Misspell roughly typo_rate of the words with 5+ letters"""
+        def replace(match):
+            if self.rng.random() < self.typo_rate:
+                self.typos += 1
+                return misspell(match.group(0), self.rng)
+            return match.group(0)
+        return re.sub(r'[A-Za-z]{5,}', replace, text) if self.typo_rate else text
+
+    @staticmethod
+    def _month(month):
+        return f"{MONTHS[month % 12]} {month // 12}"
+
+    def _work_history(self, total_months, overlapping):
+        """
+        Consecutive roles covering `total_months` up to the as-of month
+
+        Returns:
+            list: (title, company, start month, end month or None for Present)
+        """
+        now = self.now
+        roles = []
+        end, remaining = now, total_months
+        while remaining > 0:
+            length = min(self.rng.randint(12, 48), remaining)
+            if remaining - length < 6:
+                length = remaining
+            years_at_end = (total_months - (now - end)) / 12
+            band = self.band_classifier.classify(years_at_end)['band']
+            roles.append((self.rng.choice(self.job_titles[band]), self.rng.choice(self.companies),
+                          end - length, None if end == now else end))
+            end -= length
+            remaining -= length
+
+        if overlapping:
+            # A side role inside the main history: total experience is unchanged
+            length = self.rng.randint(6, min(24, total_months))
+            start = self.rng.randint(now - total_months, now - length)
+            roles.insert(self.rng.randrange(1, len(roles) + 1),
+                         ("Freelance Procurement Consultant", "Self-employed", start, start + length))
+        return roles
+
+    def _projects(self):
+        return self._typo(self.rng.choice(PROJECT_TEMPLATES).format(
+            category=self.rng.choice(PROJECT_CATEGORIES), n=self.rng.randint(6, 40),
+            m=self.rng.randint(2, 5), pct=self.rng.randint(4, 30), value=self.rng.randint(1, 60),
+            days=self.rng.choice((45, 60, 90))
+        ))
+
+    def build(self, index):
+        """
+        Content and ground truth of one resume
+
+        Args:
+            index (int): Resume number within the corpus
+
+        Returns:
+            tuple: (blocks, truth). Blocks are (kind, payload) pairs: 'title',
+                'contact', 'heading', 'text' and 'bullet' carry a string, 'job'
+                a (header, dates) pair, 'table' a list of rows and 'image'
+                (width, height, pixels). Truth is the manifest entry.
+        """
+        rng = self.rng = random.Random(f"{self.seed}-{index}")
+        self.typos = 0
+        edge_cases = [case for case in EDGE_CASES if rng.random() < self.edge_case_rate]
+
+        # Half early-career (under 4 years), half spread over 4-25 years
+        total_months = rng.randint(0, 47) if rng.random() < 0.5 else rng.randint(48, 300)
+        if total_months < 12:
+            edge_cases = [case for case in edge_cases if case not in ('overlapping_dates', 'dates_only')]
+        roles = self._work_history(total_months, 'overlapping_dates' in edge_cases)
+        stated_years = None if total_months == 0 or 'dates_only' in edge_cases else total_months // 12
+        experience = float(stated_years) if stated_years is not None else round(total_months / 12, 1)
+        band = self.band_classifier.classify(experience)
+
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        name = f"{first} {last}"
+        email = f"{first.lower()}.{last.lower()}{index}@example.com"
+        phone = f"+91 {rng.randint(70000, 99999)} {rng.randint(10000, 99999)}"
+
+        pool = self.procurement_skills_pool
+        skills = rng.sample(pool, max(1, round(self.skill_density * len(pool) * rng.uniform(0.6, 1.0))))
+        premium_pool = self.premium_skills_pool
+        premium = rng.sample(premium_pool, round(self.skill_density * len(premium_pool) * rng.random()))
+        listed = [self._typo(skill) for skill in skills + premium]
+
+        if total_months == 0:
+            summary = ("Recent graduate seeking an entry-level procurement role, trained in strategic sourcing, "
+                       "vendor management and spend analysis.")
+        elif stated_years is None:
+            summary = ("Results-driven procurement professional experienced in strategic sourcing, vendor "
+                       "management, and cost optimization across diverse categories.")
+        else:
+            summary = (f"Results-driven procurement professional with {stated_years}+ years of experience in "
+                       f"strategic sourcing, vendor management, and cost optimization.")
+
+        blocks = [('title', name), ('contact', f"{email} | {phone}"),
+                  ('heading', "PROFESSIONAL SUMMARY"), ('text', self._typo(summary)),
+                  ('heading', "CORE COMPETENCIES")]
+        if 'table' in edge_cases:
+            blocks.append(('table', [listed[i:i + 3] for i in range(0, len(listed), 3)]))
+        else:
+            blocks.append(('text', " • ".join(listed)))
+
+        if roles:
+            blocks.append(('heading', "PROFESSIONAL EXPERIENCE"))
+            if 'table' in edge_cases:
+                blocks.append(('table', [["Role", "Company", "Period"]] + [
+                    [title, company, f"{self._month(start)} - {self._month(end) if end else 'Present'}"]
+                    for title, company, start, end in roles
+                ]))
+            for title, company, start, end in roles:
+                if 'table' not in edge_cases:
+                    dates = f"{self._month(start)} - {self._month(end) if end else 'Present'}"
+                    blocks.append(('job', (f"{title} | {company}", dates)))
+                level = (total_months - (self.now - (end or self.now))) // 12
+                blocks.extend(('bullet', self._typo(line)) for line in self._generate_responsibilities(level))
+
+        blocks.append(('heading', "KEY PROJECTS"))
+        blocks.append(('bullet', self._projects()))
+        while self._lines(blocks) < self.pages * LINES_PER_PAGE:
+            blocks.append(('bullet', self._projects()))
+
+        graduation = (self.now - total_months) // 12
+        blocks += [('heading', "EDUCATION"),
+                   ('text', f"MBA in Supply Chain Management | Indian Institute of Management | {graduation}"),
+                   ('text', f"B.Tech in Mechanical Engineering | National Institute of Technology | {graduation - 2}")]
+
+        if 'attachment' in edge_cases:
+            blocks += [('heading', "ANNEXURE: SCANNED CERTIFICATES"),
+                       ('image', _noise(rng, 1024, int(self.attachment_mb * 2**20)))]
+
+        truth = {
+            'id': index,
+            'format': rng.choice(self.formats),
+            'name': name,
+            'email': email,
+            'phone': phone,
+            'experience': experience,
+            'experience_months': total_months,
+            'stated_experience': stated_years,
+            'band': band['band'],
+            'designation': band['designation'],
+            'roles': len(roles),
+            'procurement_skills': sorted(skills),
+            'premium_skills': sorted(premium),
+            'edge_cases': edge_cases,
+            'typos': self.typos
+        }
+        return blocks, truth
+
+    @staticmethod
+    def _lines(blocks):
+        """Rough printed line count, to size resumes in pages"""
+        lines = 0
+        for kind, payload in blocks:
+            if kind == 'table':
+                lines += len(payload)
+            elif kind == 'job':
+                lines += 2
+            elif kind != 'image':
+                lines += len(payload) // 95 + 1
+        return lines
+
+    def write_docx(self, blocks, path, columns=False):
+        """Render blocks with python-docx"""
+        doc = Document()
+        for section in doc.sections:
+            section.top_margin = Inches(0.5)
+            section.bottom_margin = Inches(0.5)
+            section.left_margin = Inches(0.75)
+            section.right_margin = Inches(0.75)
+        # python-docx scans every style on each `style=` assignment; set the id directly
+        bullet_style_id = doc.styles['List Bullet'].style_id
+
+        for kind, payload in blocks:
+            if kind == 'title':
+                para = doc.add_paragraph()
+                run = para.add_run(payload)
+                run.font.size = Pt(20)
+                run.font.bold = True
+                para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            elif kind == 'contact':
+                para = doc.add_paragraph()
+                para.add_run(payload).font.size = Pt(11)
+                para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                if columns:
+                    # Header stays full width; the body flows in two columns
+                    section = doc.add_section(WD_SECTION.CONTINUOUS)
+                    cols = section._sectPr.find(qn('w:cols'))
+                    if cols is None:
+                        cols = OxmlElement('w:cols')
+                        section._sectPr.append(cols)
+                    cols.set(qn('w:num'), '2')
+            elif kind == 'heading':
+                self._add_heading(doc, payload)
+            elif kind == 'text':
+                doc.add_paragraph(payload)
+            elif kind == 'bullet':
+                doc.add_paragraph(payload)._p.get_or_add_pPr().style = bullet_style_id
+            elif kind == 'job':
+                header, dates = payload
+                run = doc.add_paragraph().add_run(header)
+                run.font.bold = True
+                run.font.size = Pt(11)
+                run = doc.add_paragraph().add_run(dates)
+                run.font.italic = True
+                run.font.size = Pt(10)
+            elif kind == 'table':
+                table = doc.add_table(rows=len(payload), cols=max(len(row) for row in payload))
+                table.style = doc.styles['Table Grid']
+                for row, cells in zip(table.rows, payload):
+                    for cell, text in zip(row.cells, cells):
+                        cell.text = text
+            elif kind == 'image':
+                doc.add_picture(BytesIO(_png(*payload)), width=Inches(6.5))
+        doc.save(path)
+
+    def write_pdf(self, blocks, path, columns=False):
+        """Render blocks with the built-in PDF writer"""
+        layout = PDFLayout(columns=2 if columns else 1)
+        for kind, payload in blocks:
+            if kind == 'table':
+                layout.table(payload)
+            elif kind == 'image':
+                layout.picture(payload)
+            elif kind == 'job':
+                layout.text('job', payload[0])
+                layout.text('text', payload[1])
+            else:
+                layout.text(kind, payload)
+                if kind == 'contact':
+                    layout._advance(8)
+                    layout.start_columns()
+        with open(path, 'wb') as f:
+            f.write(layout.to_bytes())
+
+    def generate(self, index, out_dir):
+        """
+        Build and write one resume
+
+        Args:
+            index (int): Resume number within the corpus
+            out_dir (str): Corpus directory; files are sharded into
+                subdirectories of FILES_PER_DIRECTORY
+
+        Returns:
+            dict: Manifest entry (ground truth plus file path and size)
+        """
+        blocks, truth = self.build(index)
+        relative = os.path.join(f"{index // FILES_PER_DIRECTORY:04d}", f"resume_{index:07d}.{truth['format']}")
+        path = os.path.join(out_dir, relative)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        columns = 'columns' in truth['edge_cases']
+        if truth['format'] == 'pdf':
+            self.write_pdf(blocks, path, columns)
+        else:
+            self.write_docx(blocks, path, columns)
+        truth['file'] = relative
+        truth['bytes'] = os.path.getsize(path)
+        return truth
+
+
+def _generate_chunk(task):
+    out_dir, start, stop, options = task
+    generator = CorpusResumeGenerator(**options)
+    return [generator.generate(index, out_dir) for index in range(start, stop)]
+
+
+def generate_corpus(out_dir, count, workers=None, chunk_size=100, **options):
+    """
+    Generate a synthetic corpus and its ground-truth manifest
+
+    Args:
+        out_dir (str): Output directory
+        count (int): Number of resumes
+        workers (int): Generator processes (default: CPU count)
+        chunk_size (int): Resumes per task handed to a worker
+        **options: CorpusResumeGenerator settings
+
+    Returns:
+        str: Path of manifest.jsonl (one entry per resume, in index order)
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, 'corpus.json'), 'w') as f:
+        json.dump({'count': count, **options}, f, indent=2)
+
+    tasks = [(out_dir, start, min(start + chunk_size, count), options) for start in range(0, count, chunk_size)]
+    manifest_path = os.path.join(out_dir, 'manifest.jsonl')
+    with open(manifest_path, 'w') as manifest, ProcessPoolExecutor(max_workers=workers) as executor:
+        done = 0
+        for entries in executor.map(_generate_chunk, tasks):
+            for entry in entries:
+                manifest.write(json.dumps(entry) + '\n')
+            done += len(entries)
+            if done % 10000 < chunk_size or done == count:
+                print(f"📄 {done}/{count} resumes written")
+    return manifest_path
+
+
 def main():
-    """Generate sample resumes for all bands"""
+    """Generate the sample resumes, or a synthetic load-test corpus with --corpus"""
+    arg_parser = argparse.ArgumentParser(description="Generate sample resumes or a synthetic load-test corpus")
+    arg_parser.add_argument('--corpus', metavar='DIR', help="Write a synthetic corpus and manifest.jsonl here")
+    arg_parser.add_argument('--count', type=int, default=10000)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--workers', type=int, default=None)
+    arg_parser.add_argument('--formats', default='docx,pdf', help="Comma-separated: docx, pdf")
+    arg_parser.add_argument('--as-of', default=datetime.now().strftime('%Y-%m'),
+                            help="YYYY-MM that 'Present' stands for (fix it for reproducible corpora)")
+    arg_parser.add_argument('--pages', type=int, default=1)
+    arg_parser.add_argument('--skill-density', type=float, default=0.5)
+    arg_parser.add_argument('--typo-rate', type=float, default=0.0)
+    arg_parser.add_argument('--edge-case-rate', type=float, default=0.1)
+    arg_parser.add_argument('--attachment-mb', type=float, default=5.0)
+    args = arg_parser.parse_args()
+
+    if args.corpus:
+        year, month = (int(part) for part in args.as_of.split('-'))
+        print(f"🚀 Generating {args.count} synthetic resumes in {args.corpus}...")
+        manifest = generate_corpus(
+            args.corpus, args.count, workers=args.workers, seed=args.seed,
+            formats=tuple(args.formats.split(',')), as_of=(year, month), pages=args.pages,
+            skill_density=args.skill_density, typo_rate=args.typo_rate,
+            edge_case_rate=args.edge_case_rate, attachment_mb=args.attachment_mb
+        )
+        print(f"✨ Corpus ready; ground truth in {manifest}")
+        return
+
     generator = SampleResumeGenerator()
     
     print("🚀 Generating Sample Resumes for Testing...\n")
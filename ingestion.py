@@ -0,0 +1,241 @@
+"""
+Bounded-memory ingestion sources for the screening pipeline
+"""
+
+import csv
+import json
+import os
+import sqlite3
+import tempfile
+import zipfile
+import zlib
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+# Text export formats by file extension
+TEXT_EXPORT_FORMATS = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.db': 'sqlite',
+    '.sqlite': 'sqlite',
+    '.sqlite3': 'sqlite'
+}
+
+
+class SpooledMember:
+    """
+    Archive member copied into a spooled temporary file
+
+    Small members stay in memory; anything above the spool threshold is
+    written to a temporary file on disk until the pipeline reads it.
+    """
+
+    def __init__(self, name, spool):
+        self.name = name
+        self._spool = spool
+
+    def read(self, size=-1):
+        return self._spool.read(size)
+
+    def close(self):
+        self._spool.close()
+
+
+class ZipIngest:
+    """
+    Stream PDF/DOCX members of a ZIP archive into the pipeline one at a time
+
+    Only the member currently being screened is materialized, so memory stays
+    bounded by the per-document cap regardless of how many resumes the archive
+    holds. Members larger than `max_member_mb` (after decompression) are
+    skipped and listed in `skipped`.
+    """
+
+    def __init__(self, archive, spool_threshold_mb=2, max_member_mb=25):
+        """
+        Args:
+            archive: Path or seekable file-like object holding the ZIP data
+            spool_threshold_mb (float): Members above this size spill to disk
+            max_member_mb (float): Per-document cap; larger members are skipped
+        """
+        self.archive = archive
+        self.spool_threshold = int(spool_threshold_mb * 1024 * 1024)
+        self.max_member_bytes = int(max_member_mb * 1024 * 1024)
+        self.skipped = []
+        # Member position of each `skipped` entry
+        self.skipped_positions = []
+
+    def _resume_members(self, zf):
+        for info in zf.infolist():
+            if info.is_dir():
+                continue
+            name = os.path.basename(info.filename)
+            # Skip macOS resource forks and other hidden files
+            if not name or name.startswith('.') or '__MACOSX' in info.filename:
+                continue
+            if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                yield info, name
+
+    def __len__(self):
+        with zipfile.ZipFile(self.archive) as zf:
+            return sum(1 for _ in self._resume_members(zf))
+
+    def __iter__(self):
+        return self.members()
+
+    def members(self, start=0):
+        """
+        Spooled members from the `start`-th resume member on
+
+        Earlier members are passed over by their directory entry, without
+        being decompressed, so a resumed job seeks straight to its remainder.
+
+        Args:
+            start (int): Position among the archive's resume members (as counted by len())
+
+        Yields:
+            SpooledMember: One member at a time, closed once the consumer moves on
+        """
+        with zipfile.ZipFile(self.archive) as zf:
+            for position, (info, name) in enumerate(self._resume_members(zf)):
+                if position < start:
+                    continue
+                if info.file_size > self.max_member_bytes:
+                    self._skip(position, name, f"larger than {self.max_member_bytes // (1024 * 1024)} MB")
+                    continue
+
+                member = self._spool_member(zf, info, name, position)
+                if member is None:
+                    continue
+                try:
+                    yield member
+                finally:
+                    member.close()
+
+    def _skip(self, position, name, reason):
+        self.skipped.append((name, reason))
+        self.skipped_positions.append(position)
+
+    def _spool_member(self, zf, info, name, position):
+        """Copy one member into a spooled file, enforcing the size cap while decompressing"""
+        spool = tempfile.SpooledTemporaryFile(max_size=self.spool_threshold)
+        copied = 0
+        try:
+            with zf.open(info) as source:
+                while True:
+                    chunk = source.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    copied += len(chunk)
+                    # Header sizes can lie, so check what was actually decompressed
+                    if copied > self.max_member_bytes:
+                        self._skip(position, name, f"larger than {self.max_member_bytes // (1024 * 1024)} MB")
+                        spool.close()
+                        return None
+                    spool.write(chunk)
+        except (zipfile.BadZipFile, zlib.error, RuntimeError, OSError) as e:
+            self._skip(position, name, str(e))
+            spool.close()
+            return None
+
+        spool.seek(0)
+        return SpooledMember(name, spool)
+
+
+class TextExportIngest:
+    """
+    Stream (candidate id, text) rows of an ATS text export in chunks
+
+    Reads CSV, JSON Lines or a SQLite table row by row, so only one chunk of
+    texts is held at a time however large the export is. Rows without an id
+    or text are skipped and listed in `skipped`.
+    """
+
+    def __init__(self, path, format=None, id_column='candidate_id', text_column='text', table='resumes',
+                 chunk_size=500):
+        """
+        Args:
+            path (str): Export file
+            format (str): 'csv', 'jsonl' or 'sqlite'; inferred from the extension if None
+            id_column (str): Column (or JSON key) holding the candidate id
+            text_column (str): Column (or JSON key) holding the resume text
+            table (str): Table to read from a SQLite export
+            chunk_size (int): Rows per chunk
+        """
+        if format is None:
+            format = TEXT_EXPORT_FORMATS.get(os.path.splitext(path)[1].lower())
+            if format is None:
+                raise ValueError(f"Cannot tell the export format of {path}; pass format explicitly")
+        if format not in TEXT_EXPORT_FORMATS.values():
+            raise ValueError(f"Unsupported export format: {format}")
+        self.path = path
+        self.format = format
+        self.id_column = id_column
+        self.text_column = text_column
+        self.table = table
+        self.chunk_size = chunk_size
+        self.skipped = []
+
+    def _csv_rows(self):
+        # Resume texts easily exceed the csv module's default 128 KB field limit
+        csv.field_size_limit(2 ** 31 - 1)
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                yield row.get(self.id_column), row.get(self.text_column)
+
+    def _jsonl_rows(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    self.skipped.append((f"line {line_number}", str(e)))
+                    continue
+                yield record.get(self.id_column), record.get(self.text_column)
+
+    def _sqlite_rows(self):
+        def quoted(name):
+            return '"' + name.replace('"', '""') + '"'
+
+        conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+        try:
+            cursor = conn.execute(
+                f"SELECT {quoted(self.id_column)}, {quoted(self.text_column)} FROM {quoted(self.table)}")
+            while True:
+                rows = cursor.fetchmany(self.chunk_size)
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            conn.close()
+
+    def rows(self):
+        """
+        Yields:
+            tuple: (candidate id as str, text)
+        """
+        reader = {'csv': self._csv_rows, 'jsonl': self._jsonl_rows, 'sqlite': self._sqlite_rows}[self.format]
+        for candidate_id, text in reader():
+            if candidate_id is None or candidate_id == '':
+                self.skipped.append(("row without id", "missing id"))
+            elif not isinstance(text, str) or not text.strip():
+                self.skipped.append((str(candidate_id), "missing text"))
+            else:
+                yield str(candidate_id), text
+
+    def __iter__(self):
+        """
+        Yields:
+            list: Up to chunk_size (candidate id, text) rows
+        """
+        chunk = []
+        for row in self.rows():
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
@@ -0,0 +1,168 @@
+"""
+Per-document isolation for text extraction
+
+Malformed or deliberately huge PDFs can keep PyPDF2 busy for minutes. The
+IsolatedExtractor runs every extraction in its own short-lived process with
+a wall-clock timeout and an address-space limit, so a hostile file costs at
+most one timeout slot while the rest of the batch keeps flowing.
+
+Workers are started from a forkserver (spawn where there is none), never by
+forking the caller: the callers are the multithreaded Streamlit server and
+job threads, and a fork taken while another thread holds a lock (logging,
+SQLite, pool queues) can deadlock the child. The forkserver is a small
+single-threaded process with this module preloaded, so starting a worker
+stays cheap; the document bytes reach it through the start-up pipe.
+"""
+
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import wait
+
+from resume_parser import ResumeParser
+from screening_pipeline import NamedBytesIO
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; extraction then runs without a memory cap
+    resource = None
+
+
+def _address_space_bytes():
+    """Current virtual memory size of this process (Linux only, 0 elsewhere)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _extract_in_child(conn, name, data, memory_limit_bytes):
+    """Worker entry point: cap memory, extract, send ('ok', text) or ('error', reason)"""
+    try:
+        if resource is not None and memory_limit_bytes:
+            # The limit is relative to what the child already maps
+            limit = _address_space_bytes() + memory_limit_bytes
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        conn.send(('ok', ResumeParser.extract_text(NamedBytesIO(data, name))))
+    except MemoryError:
+        conn.send(('error', f"exceeded memory limit of {memory_limit_bytes // (1024 * 1024)} MB"))
+    except Exception as e:
+        conn.send(('error', f"extraction failed: {e}"))
+    finally:
+        conn.close()
+
+
+class IsolatedExtractor:
+    """
+    Extract resume text in sandboxed processes with timeouts and memory limits
+    """
+
+    def __init__(self, timeout=30, memory_limit_mb=1024, workers=None):
+        """
+        Args:
+            timeout (float): Wall-clock seconds allowed per document
+            memory_limit_mb (int): Extra address space a worker may map (0 disables)
+            workers (int): Documents extracted concurrently (default: CPU count)
+        """
+        self.timeout = timeout
+        self.memory_limit_bytes = int(memory_limit_mb * 1024 * 1024)
+        self.workers = workers or os.cpu_count() or 1
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            self._context = multiprocessing.get_context('forkserver')
+            # Workers fork from a server that already imported the extraction code
+            self._context.set_forkserver_preload([__name__])
+        else:
+            self._context = multiprocessing.get_context('spawn')
+
+    def extract_iter(self, documents):
+        """
+        Extract text from documents, yielding in input order
+
+        Args:
+            documents: Iterable of file-like objects with `name` and `read()`
+
+        Yields:
+            tuple: (filename, text, error) where `error` is None on success
+        """
+        documents = iter(documents)
+        running = {}     # connection -> (index, filename, process, deadline)
+        finished = {}    # index -> (filename, text, error)
+        next_index = 0
+        next_to_yield = 0
+        exhausted = False
+
+        try:
+            while True:
+                # Keep every worker slot busy
+                while not exhausted and len(running) < self.workers:
+                    try:
+                        document = next(documents)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    running.update(self._start(next_index, document))
+                    next_index += 1
+
+                while next_to_yield in finished:
+                    yield finished.pop(next_to_yield)
+                    next_to_yield += 1
+
+                if not running:
+                    if exhausted:
+                        return
+                    continue
+
+                now = time.monotonic()
+                nearest_deadline = min(entry[3] for entry in running.values())
+                ready = wait(list(running), timeout=max(0, nearest_deadline - now))
+
+                for conn in ready:
+                    index, filename, process, _ = running.pop(conn)
+                    finished[index] = self._collect(conn, filename, process)
+
+                now = time.monotonic()
+                for conn, (index, filename, process, deadline) in list(running.items()):
+                    if now >= deadline:
+                        process.kill()
+                        process.join()
+                        conn.close()
+                        del running[conn]
+                        finished[index] = (filename, "", f"timed out after {self.timeout}s")
+        finally:
+            for conn, (_, _, process, _) in running.items():
+                process.kill()
+                process.join()
+                conn.close()
+
+    def _start(self, index, document):
+        """Launch one extraction worker"""
+        # Read in the parent so the child never touches the original stream
+        name = document.name
+        data = document.read()
+
+        parent_conn, child_conn = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_extract_in_child,
+            args=(child_conn, name, data, self.memory_limit_bytes),
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        return {parent_conn: (index, name, process, time.monotonic() + self.timeout)}
+
+    def _collect(self, conn, filename, process):
+        """Receive a finished worker's outcome"""
+        try:
+            status, payload = conn.recv()
+        except (EOFError, OSError):
+            process.join()
+            return filename, "", f"worker exited unexpectedly (exit code {process.exitcode})"
+        finally:
+            conn.close()
+
+        process.join()
+        if status == 'ok':
+            return filename, payload, None
+        return filename, "", payload
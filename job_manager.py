@@ -0,0 +1,368 @@
+"""
+Background screening jobs that outlive Streamlit reruns
+
+Clicking a widget reruns the Streamlit script and interrupts anything running
+in it, so a batch analyzed inline is lost if the user touches the page. A
+JobManager instead copies the uploaded files into a job directory and screens
+them on a background thread. The page only submits, polls and cancels.
+
+Each job directory holds:
+    job.json        Status, counts and options (rewritten atomically)
+    inputs/         The uploaded files, or the uploaded ZIP as archive.zip
+    results.jsonl   Checkpoint: one result per screened document, in input order
+
+Results are written to the checkpoint after they have been committed to the
+candidate store. A cancelled, failed or interrupted job (server restart)
+therefore resumes by skipping as many documents as the checkpoint holds; a
+ZIP job seeks past them without decompressing them again. At most one
+checkpoint batch is screened twice and none is lost. The store records
+each row's (job id, input position), so a batch that reached the store but
+not the checkpoint is not stored a second time.
+"""
+
+import itertools
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+
+from ingestion import ZipIngest
+from isolated_extraction import IsolatedExtractor
+from screening_pipeline import screen_iter
+from skills_analyzer import SkillsAnalyzer
+
+DEFAULT_JOBS_DIR = os.environ.get('RESUME_SCREENER_JOBS', 'screening_jobs')
+
+# Results committed to the store and checkpoint together
+CHECKPOINT_BATCH_SIZE = 16
+
+ACTIVE_STATES = ('queued', 'running')
+RESUMABLE_STATES = ('cancelled', 'failed', 'interrupted')
+
+
+class ScreeningJob:
+    """
+    Status of one background job, as stored in its job.json
+    """
+
+    def __init__(self, job_id, directory, kind, inputs, isolate=False, status='queued', done=0,
+                 failed=0, skipped=None, skipped_positions=None, error=None, created=None, finished=None):
+        self.job_id = job_id
+        self.directory = directory
+        self.kind = kind
+        self.inputs = inputs
+        self.isolate = isolate
+        self.status = status
+        self.done = done
+        self.failed = failed
+        self.skipped = skipped or []
+        # Archive member position of each `skipped` entry (ZIP jobs)
+        self.skipped_positions = skipped_positions or []
+        self.error = error
+        self.created = created or time.time()
+        self.finished = finished
+        self.cancel_requested = threading.Event()
+        self.thread = None
+
+    @property
+    def total(self):
+        # ZIP jobs only record how many resumes the archive holds; skipped members never finish
+        if isinstance(self.inputs, int):
+            return self.inputs - len(self.skipped)
+        return len(self.inputs)
+
+    @property
+    def results_path(self):
+        return os.path.join(self.directory, 'results.jsonl')
+
+    def to_dict(self):
+        return {
+            'job_id': self.job_id, 'kind': self.kind, 'inputs': self.inputs, 'isolate': self.isolate,
+            'status': self.status, 'done': self.done, 'failed': self.failed, 'skipped': self.skipped,
+            'skipped_positions': self.skipped_positions, 'error': self.error, 'created': self.created, 'finished': self.finished
+        }
+
+    def save(self):
+        # Write-then-rename so a crash never leaves a truncated job file
+        path = os.path.join(self.directory, 'job.json')
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(path + '.tmp', path)
+
+    @classmethod
+    def load(cls, directory):
+        with open(os.path.join(directory, 'job.json'), 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        return cls(directory=directory, **state)
+
+
+def _read_checkpoint(path):
+    """
+    Results recorded so far; a line torn by a crash is cut off
+
+    Returns:
+        list: Result dicts in input order
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return []
+    complete = data[:data.rfind(b'\n') + 1]
+    if len(complete) != len(data):
+        with open(path, 'r+b') as f:
+            f.truncate(len(complete))
+    return [json.loads(line) for line in complete.splitlines()]
+
+
+def _member_position(skipped_positions, done):
+    """Archive member position after `done` screened members, stepping over skipped ones"""
+    skipped = set(skipped_positions)
+    position = 0
+    while done:
+        if position not in skipped:
+            done -= 1
+        position += 1
+    return position
+
+
+class JobManager:
+    """
+    Run screening jobs on background threads, with progress, cancel and resume
+    """
+
+    def __init__(self, jobs_dir=DEFAULT_JOBS_DIR, store=None, pool_factory=None, pool_min_files=8,
+                 max_concurrent_jobs=1, reuse_unchanged=True):
+        """
+        Args:
+            jobs_dir (str): Directory holding one subdirectory per job
+            store (CandidateStore): Results are added here (and texts to its corpus)
+            pool_factory (callable): Returns the ScreeningPool for large batches
+            pool_min_files (int): Smaller batches are screened in-process
+            max_concurrent_jobs (int): Jobs beyond this wait in 'queued'
+            reuse_unchanged (bool): Take the stored result for a file whose exact
+                bytes were screened before with the current taxonomy
+        """
+        self.jobs_dir = jobs_dir
+        self.store = store
+        self.reuse_unchanged = reuse_unchanged
+        self.pool_factory = pool_factory
+        self.pool_min_files = pool_min_files
+        self._slots = threading.Semaphore(max_concurrent_jobs)
+        self._lock = threading.Lock()
+        self.jobs = {}
+
+        os.makedirs(jobs_dir, exist_ok=True)
+        for name in os.listdir(jobs_dir):
+            try:
+                job = ScreeningJob.load(os.path.join(jobs_dir, name))
+            except (OSError, ValueError, TypeError):
+                continue
+            if job.status in ACTIVE_STATES:
+                # The process running it is gone
+                job.status = 'interrupted'
+                job.done = len(_read_checkpoint(job.results_path))
+                job.save()
+            self.jobs[job.job_id] = job
+
+    def submit(self, uploaded_files=None, archive=None, isolate=False):
+        """
+        Copy inputs into a new job directory and start screening them
+
+        Args:
+            uploaded_files (list): File-like objects with `read()` and `name`
+            archive: A ZIP archive (file-like object) instead of individual files
+            isolate (bool): Extract each document in a sandboxed worker
+
+        Returns:
+            str: Job id
+        """
+        job_id = uuid.uuid4().hex[:12]
+        directory = os.path.join(self.jobs_dir, job_id)
+        inputs_dir = os.path.join(directory, 'inputs')
+        os.makedirs(inputs_dir)
+
+        if archive is not None:
+            if hasattr(archive, 'seek'):
+                archive.seek(0)
+            with open(os.path.join(inputs_dir, 'archive.zip'), 'wb') as f:
+                shutil.copyfileobj(archive, f)
+            kind = 'zip'
+            inputs = len(ZipIngest(os.path.join(inputs_dir, 'archive.zip')))
+        else:
+            kind = 'files'
+            inputs = []
+            for i, uploaded_file in enumerate(uploaded_files):
+                if hasattr(uploaded_file, 'seek'):
+                    uploaded_file.seek(0)
+                name = os.path.basename(getattr(uploaded_file, 'name', f'resume_{i}'))
+                with open(os.path.join(inputs_dir, f'{i:06d}'), 'wb') as f:
+                    shutil.copyfileobj(uploaded_file, f)
+                inputs.append(name)
+
+        job = ScreeningJob(job_id, directory, kind, inputs, isolate=isolate)
+        job.save()
+        with self._lock:
+            self.jobs[job_id] = job
+        self._start(job)
+        return job_id
+
+    def _sources(self, job, skip):
+        """Documents of a job after the first `skip`, in input order"""
+        if job.kind == 'zip':
+            ingest = ZipIngest(os.path.join(job.directory, 'inputs', 'archive.zip'))
+            for member in ingest.members(_member_position(job.skipped_positions, skip)):
+                self._record_skipped(job, ingest)
+                yield member
+            self._record_skipped(job, ingest)
+            return
+        for i in range(skip, job.total):
+            with open(os.path.join(job.directory, 'inputs', f'{i:06d}'), 'rb') as f:
+                yield job.inputs[i], f.read()
+
+    @staticmethod
+    def _record_skipped(job, ingest):
+        """Add members the archive skipped so far; saved with the next checkpoint"""
+        for (name, reason), position in zip(ingest.skipped, ingest.skipped_positions):
+            if position not in job.skipped_positions:
+                job.skipped.append((name, reason))
+                job.skipped_positions.append(position)
+
+    def _start(self, job):
+        job.cancel_requested.clear()
+        job.status = 'queued'
+        job.error = None
+        job.save()
+        job.thread = threading.Thread(target=self._run, args=(job,), name=f"screening-job-{job.job_id}",
+                                      daemon=True)
+        job.thread.start()
+
+    def _run(self, job):
+        with self._slots:
+            if job.cancel_requested.is_set():
+                self._finish(job, 'cancelled')
+                return
+            job.status = 'running'
+            job.save()
+            try:
+                self._screen(job)
+            except Exception as e:
+                job.error = str(e)
+                self._finish(job, 'failed')
+                return
+            self._finish(job, 'cancelled' if job.cancel_requested.is_set() else 'completed')
+
+    def _screen(self, job):
+        recorded = _read_checkpoint(job.results_path)
+        job.done = len(recorded)
+        job.failed = sum(1 for result in recorded if result.get('error'))
+        remaining = job.total - job.done
+        if remaining <= 0:
+            return
+
+        extractor = IsolatedExtractor() if job.isolate else None
+        pool = None
+        if not job.isolate and self.pool_factory is not None and remaining >= self.pool_min_files:
+            pool = self.pool_factory()
+        corpus = self.store.corpus if self.store is not None else None
+        known = None
+        if self.store is not None and self.reuse_unchanged:
+            vocabulary_id = SkillsAnalyzer().vocabulary_id
+            known = lambda digest: self.store.find_by_content(digest, vocabulary_id)  # noqa: E731
+
+        pending = []
+        results = screen_iter(self._sources(job, job.done), extractor=extractor, pool=pool, corpus=corpus,
+                              known=known)
+        try:
+            for result in results:
+                pending.append(result)
+                if len(pending) >= CHECKPOINT_BATCH_SIZE:
+                    self._checkpoint(job, pending)
+                    pending = []
+                if job.cancel_requested.is_set():
+                    break
+        finally:
+            results.close()
+            if pending:
+                self._checkpoint(job, pending)
+
+    def _checkpoint(self, job, results):
+        """Commit results to the store, then record them as done"""
+        if self.store is not None:
+            positions = [job.done + i for i, result in enumerate(results) if not result.get('error')]
+            stored = [result for result in results if not result.get('error')]
+            # A batch stored before a crash kept the checkpoint from recording it: reuse those rows
+            candidate_ids = self.store.add_many(stored, job_keys=[(job.job_id, p) for p in positions])
+            # Cards look up the candidate's earlier screenings by this id
+            for result, candidate_id in zip(stored, candidate_ids):
+                result['candidate_id'] = candidate_id
+        with open(job.results_path, 'a', encoding='utf-8') as f:
+            for result in results:
+                f.write(json.dumps(result) + '\n')
+        job.done += len(results)
+        job.failed += sum(1 for result in results if result.get('error'))
+        job.save()
+
+    def _finish(self, job, status):
+        job.status = status
+        job.finished = time.time()
+        if status == 'completed':
+            # Results live in the checkpoint; the copied uploads are no longer needed
+            shutil.rmtree(os.path.join(job.directory, 'inputs'), ignore_errors=True)
+        job.save()
+
+    def get(self, job_id):
+        """
+        Args:
+            job_id (str): Id returned by `submit`
+
+        Returns:
+            ScreeningJob: The job, or None if unknown
+        """
+        return self.jobs.get(job_id)
+
+    def list_jobs(self):
+        """All known jobs, newest first"""
+        return sorted(self.jobs.values(), key=lambda job: job.created, reverse=True)
+
+    def cancel(self, job_id):
+        """Stop a job after the document in progress; its checkpoint is kept"""
+        job = self.jobs.get(job_id)
+        if job is not None and job.status in ACTIVE_STATES:
+            job.cancel_requested.set()
+
+    def resume(self, job_id):
+        """
+        Restart a cancelled, failed or interrupted job from its checkpoint
+
+        Returns:
+            bool: Whether the job was restarted
+        """
+        job = self.jobs.get(job_id)
+        if job is None or job.status not in RESUMABLE_STATES:
+            return False
+        if job.thread is not None and job.thread.is_alive():
+            return False
+        self._start(job)
+        return True
+
+    def results(self, job_id, start=0):
+        """
+        Results checkpointed so far
+
+        Args:
+            job_id (str): Job id
+            start (int): Skip this many results (already fetched by the caller)
+
+        Returns:
+            list: Result dicts in input order, failed documents included
+        """
+        job = self.jobs[job_id]
+        try:
+            with open(job.results_path, 'r', encoding='utf-8') as f:
+                lines = itertools.islice(f, start, None)
+                return [json.loads(line) for line in lines if line.endswith('\n')]
+        except FileNotFoundError:
+            return []
@@ -1,13 +1,64 @@
 import re
-import PyPDF2
-import docx
+from functools import lru_cache
 from io import BytesIO
-try:
-    import spacy
-    from spacy.matcher import Matcher
-except ImportError:
-    spacy = None
-    Matcher = None
+from resume_sections import sectionize
+
+# PyPDF2, python-docx and spaCy are imported on first use so that importing
+# this module (and the Streamlit app) stays fast.
+
+@lru_cache(maxsize=None)
+def load_nlp():
+    """
+    Load the spaCy English model once per process
+    
+    Returns:
+        spacy.Language or None: Model, or None if spaCy or the model is unavailable
+    """
+    try:
+        import spacy
+        return spacy.load("en_core_web_sm")
+    except Exception:
+        # If spacy model not available, will use basic extraction
+        return None
+
+# Resume sections each extractor scans (see resume_sections)
+CONTACT_SECTIONS = ('header',)
+STATED_EXPERIENCE_SECTIONS = ('header', 'summary', 'experience')
+GENERIC_YEARS_SECTIONS = ('summary', 'experience')
+WORK_HISTORY_SECTIONS = ('experience',)
+
+# Characters each extractor scans at most. Real resumes are a few thousand
+# characters; a PDF that extracts as megabytes of garbage is cut off here
+# instead of being searched in full by every pattern.
+NAME_SCAN_CHARS = 2000
+CONTACT_SCAN_CHARS = 50000
+EXPERIENCE_SCAN_CHARS = 200000
+
+# The patterns below run in linear time on any input. A number is only tried
+# from the start of a digit run and a date range only from the start of a
+# word, so one giant line of digits or letters is not re-scanned from every
+# character, and no two adjacent repeats can trade characters back and forth.
+YEARS_NUMBER = r'(?<!\d)(\d+(?:\.\d*)?)'
+YEARS_UNIT = r'\s*(?:\+\s*)?(?:years?|yrs?)'
+YEARS_OF_EXPERIENCE_PATTERN = re.compile(YEARS_NUMBER + YEARS_UNIT + r'\s+(?:of\s+)?experience')
+EXPERIENCE_YEARS_PATTERN = re.compile(r'experience\s*:?\s*' + YEARS_NUMBER + YEARS_UNIT)
+GENERIC_YEARS_PATTERN = re.compile(YEARS_NUMBER + YEARS_UNIT)
+DATE_RANGE_PATTERN = re.compile(r'\b(\w+\s+\d{4})\s*[-–—to]+\s*\b(\w+\s+\d{4}|present|current)')
+
+# Emails are only searched around each '@', within the RFC 5321 length limits
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+EMAIL_LOCAL_MAX = 64
+EMAIL_DOMAIN_MAX = 255
+
+# Indian phone number patterns, most specific first
+PHONE_PATTERNS = [re.compile(pattern) for pattern in (
+    r'\+91[-.\s]?\d{10}',
+    r'\+91[-.\s]?\d{5}[-.\s]?\d{5}',
+    r'\d{10}',
+    r'\d{5}[-.\s]?\d{5}',
+    r'\(\d{3}\)[-.\s]?\d{3}[-.\s]?\d{4}',
+    r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}'
+)]
 
 class ResumeParser:
     """
@@ -15,11 +66,7 @@ class ResumeParser:
     """
     
     def __init__(self):
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except:
-            # If spacy model not available, will use basic extraction
-            self.nlp = None
+        self.nlp = load_nlp()
     
     def parse(self, uploaded_file):
         """
@@ -31,52 +78,115 @@ class ResumeParser:
         Returns:
             dict: Parsed resume data
         """
-        # Extract text based on file type
+        return self.parse_text(self.extract_text(uploaded_file))
+    
+    @staticmethod
+    def extract_text(uploaded_file):
+        """
+        Extract raw text from an uploaded PDF or DOCX file
+        
+        Args:
+            uploaded_file: File-like object with a `name` attribute
+            
+        Returns:
+            str: Extracted text (empty for unsupported formats)
+        """
         if uploaded_file.name.endswith('.pdf'):
-            text = self._extract_from_pdf(uploaded_file)
+            return ResumeParser._extract_from_pdf(uploaded_file)
         elif uploaded_file.name.endswith('.docx'):
-            text = self._extract_from_docx(uploaded_file)
-        else:
-            text = ""
+            return ResumeParser._extract_from_docx(uploaded_file)
+        return ""
+    
+    def parse_texts(self, texts, batch_size=64):
+        """
+        Extract candidate details from many texts, running spaCy over their
+        headers in batches instead of one call per resume
+        
+        Args:
+            texts (list): Resume texts
+            batch_size (int): Headers per spaCy batch
+            
+        Returns:
+            list: Parsed resume data per text, as parse_text returns it
+        """
+        all_sections = [sectionize(text) for text in texts]
+        header_docs = [None] * len(texts)
+        if self.nlp:
+            header_docs = self.nlp.pipe(
+                (sections.text_for(*CONTACT_SECTIONS)[:500] for sections in all_sections), batch_size=batch_size)
+        return [self.parse_text(text, sections, header_doc)
+                for text, sections, header_doc in zip(texts, all_sections, header_docs)]
+
+    def parse_text(self, text, sections=None, header_doc=None):
+        """
+        Extract candidate details from already extracted resume text
+        
+        Args:
+            text (str): Resume text
+            sections (ResumeSections): Precomputed sections of `text`
+            header_doc: spaCy parse of the first 500 characters of the header,
+                when parse_texts batched it
+            
+        Returns:
+            dict: Parsed resume data, including the sections for later stages
+        """
+        sections = sections or sectionize(text)
+        
+        # Contact details live in the header; only search further if they are missing there
+        contact_text = sections.text_for(*CONTACT_SECTIONS)
+        email = self._extract_email(contact_text)
+        if email == "Not found" and contact_text is not text:
+            email = self._extract_email(text)
+        phone = self._extract_phone(contact_text)
+        if phone == "Not found" and contact_text is not text:
+            phone = self._extract_phone(text)
         
-        # Extract information
         return {
             'text': text,
-            'name': self._extract_name(text),
-            'email': self._extract_email(text),
-            'phone': self._extract_phone(text),
-            'experience': self._extract_experience(text)
+            'sections': sections,
+            'name': self._extract_name(contact_text, header_doc),
+            'email': email,
+            'phone': phone,
+            'experience': self._extract_experience(text, sections)
         }
     
-    def _extract_from_pdf(self, file):
+    @staticmethod
+    def _extract_from_pdf(file):
         """Extract text from PDF file"""
+        import PyPDF2
         try:
             pdf_reader = PyPDF2.PdfReader(BytesIO(file.read()))
             text = ""
             for page in pdf_reader.pages:
                 text += page.extract_text() + "\n"
             return text
+        except MemoryError:
+            raise
         except Exception as e:
             print(f"Error extracting PDF: {e}")
             return ""
     
-    def _extract_from_docx(self, file):
+    @staticmethod
+    def _extract_from_docx(file):
         """Extract text from DOCX file"""
+        import docx
         try:
             doc = docx.Document(BytesIO(file.read()))
             text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
             return text
+        except MemoryError:
+            raise
         except Exception as e:
             print(f"Error extracting DOCX: {e}")
             return ""
     
-    def _extract_name(self, text):
-        """Extract candidate name from resume text"""
+    def _extract_name(self, text, doc=None):
+        """Extract candidate name from resume text (`doc`: spaCy parse of text[:500], if already run)"""
         if not text:
             return "Unknown"
         
         # Try to get name from first few lines
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        lines = [line.strip() for line in text[:NAME_SCAN_CHARS].split('\n') if line.strip()]
         
         if not lines:
             return "Unknown"
@@ -95,7 +205,8 @@ class ResumeParser:
         
         # Use spacy for name extraction if available
         if self.nlp:
-            doc = self.nlp(text[:500])  # Check first 500 chars
+            if doc is None:
+                doc = self.nlp(text[:500])  # Check first 500 chars
             for ent in doc.ents:
                 if ent.label_ == "PERSON":
                     return ent.text
@@ -104,58 +215,60 @@ class ResumeParser:
     
     def _extract_email(self, text):
         """Extract email address from resume text"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        return emails[0] if emails else "Not found"
+        text = text[:CONTACT_SCAN_CHARS]
+        previous, at = -1, text.find('@')
+        while at != -1:
+            following = text.find('@', at + 1)
+            # An address holds one '@', so each window stops at the neighbouring ones
+            start = max(at - EMAIL_LOCAL_MAX, previous + 1)
+            end = min(at + EMAIL_DOMAIN_MAX + 1, following if following != -1 else len(text))
+            match = EMAIL_PATTERN.search(text, start, end)
+            if match:
+                return match.group()
+            previous, at = at, following
+        return "Not found"
     
     def _extract_phone(self, text):
         """Extract phone number from resume text"""
-        # Indian phone number patterns
-        phone_patterns = [
-            r'\+91[-.\s]?\d{10}',
-            r'\+91[-.\s]?\d{5}[-.\s]?\d{5}',
-            r'\d{10}',
-            r'\d{5}[-.\s]?\d{5}',
-            r'\(\d{3}\)[-.\s]?\d{3}[-.\s]?\d{4}',
-            r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}'
-        ]
-        
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, text)
-            if phones:
-                return phones[0]
+        text = text[:CONTACT_SCAN_CHARS]
+        for pattern in PHONE_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                return match.group()
         
         return "Not found"
     
-    def _extract_experience(self, text):
+    def _extract_experience(self, text, sections=None):
         """
         Extract years of experience from resume text
         
+        Only the header, summary and experience sections are scanned, so
+        numbers in education or hobbies do not count as experience.
+        
         Returns:
             float: Years of experience
         """
-        text_lower = text.lower()
+        sections = sections or sectionize(text)
+        text_lower = sections.text_for(*STATED_EXPERIENCE_SECTIONS)[:EXPERIENCE_SCAN_CHARS].lower()
         
         # Pattern 1: "X years of experience"
-        pattern1 = r'(\d+\.?\d*)\s*(?:\+)?\s*(?:years?|yrs?)\s+(?:of\s+)?experience'
-        matches = re.findall(pattern1, text_lower)
-        if matches:
-            return float(matches[0])
+        match = YEARS_OF_EXPERIENCE_PATTERN.search(text_lower)
+        if match:
+            return float(match.group(1))
         
         # Pattern 2: "Experience: X years"
-        pattern2 = r'experience\s*:?\s*(\d+\.?\d*)\s*(?:\+)?\s*(?:years?|yrs?)'
-        matches = re.findall(pattern2, text_lower)
-        if matches:
-            return float(matches[0])
+        match = EXPERIENCE_YEARS_PATTERN.search(text_lower)
+        if match:
+            return float(match.group(1))
         
         # Pattern 3: Calculate from work history dates
-        experience_years = self._calculate_from_dates(text)
+        experience_years = self._calculate_from_dates(sections.text_for(*WORK_HISTORY_SECTIONS))
         if experience_years > 0:
             return experience_years
         
         # Pattern 4: Generic "X years" or "X+ years"
-        pattern4 = r'(\d+\.?\d*)\s*\+?\s*(?:years?|yrs?)'
-        matches = re.findall(pattern4, text_lower)
+        matches = GENERIC_YEARS_PATTERN.findall(
+            sections.text_for(*GENERIC_YEARS_SECTIONS)[:EXPERIENCE_SCAN_CHARS].lower())
         if matches:
             # Get the highest number found
             return max([float(m) for m in matches])
@@ -166,10 +279,8 @@ class ResumeParser:
         """
         Calculate total experience from work history dates
         """
-        # Date patterns (Month Year - Month Year)
-        date_pattern = r'(\w+\s+\d{4})\s*[-–—to]+\s*(\w+\s+\d{4}|present|current)'
-        
-        matches = re.findall(date_pattern, text.lower())
+        # Date ranges (Month Year - Month Year)
+        matches = DATE_RANGE_PATTERN.findall(text[:EXPERIENCE_SCAN_CHARS].lower())
         
         if not matches:
             return 0.0
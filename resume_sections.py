@@ -0,0 +1,122 @@
+"""
+Section-aware resume segmentation
+
+Splits resume text into header, summary, experience, skills, education and
+other sections in a single pass over its lines, recording character offsets
+so extractors can scan only the regions they need instead of the whole
+document.
+"""
+
+import re
+from collections import namedtuple
+
+Section = namedtuple('Section', ['name', 'start', 'end'])
+
+# Normalized heading line -> section name
+SECTION_HEADINGS = {
+    'summary': [
+        'summary', 'professional summary', 'career summary', 'executive summary', 'profile',
+        'professional profile', 'career profile', 'objective', 'career objective', 'about me'
+    ],
+    'experience': [
+        'experience', 'professional experience', 'work experience', 'work history',
+        'employment', 'employment history', 'career history', 'relevant experience'
+    ],
+    'skills': [
+        'skills', 'key skills', 'technical skills', 'core skills', 'core competencies',
+        'competencies', 'areas of expertise', 'expertise', 'skills and expertise',
+        'certifications', 'certification', 'tools', 'technical proficiency'
+    ],
+    'education': [
+        'education', 'academic background', 'academic qualifications', 'qualifications',
+        'educational qualifications'
+    ],
+    'other': [
+        'hobbies', 'interests', 'hobbies and interests', 'languages', 'personal details',
+        'personal information', 'references', 'declaration', 'projects', 'achievements',
+        'awards', 'awards and achievements', 'extracurricular activities', 'volunteering'
+    ]
+}
+
+HEADING_LOOKUP = {heading: name for name, headings in SECTION_HEADINGS.items() for heading in headings}
+
+# Longest heading alias plus some slack for bullets and trailing colons
+MAX_HEADING_LENGTH = 48
+
+_HEADING_TRIM = re.compile(r'^[^a-z]+|[^a-z]+$')
+_SPACES = re.compile(r'\s+')
+
+
+def _heading_name(line):
+    """Section name if the line is a known heading, otherwise None"""
+    if len(line) > MAX_HEADING_LENGTH:
+        return None
+    normalized = _SPACES.sub(' ', _HEADING_TRIM.sub('', line.lower())).replace('&', 'and')
+    return HEADING_LOOKUP.get(normalized)
+
+
+class ResumeSections:
+    """
+    Character spans of each resume section
+    """
+
+    def __init__(self, text, sections):
+        self.text = text
+        self.sections = sections
+
+    def __contains__(self, name):
+        return any(section.name == name for section in self.sections)
+
+    @property
+    def structured(self):
+        """True when at least one known heading was found"""
+        return any(section.name != 'header' for section in self.sections)
+
+    def text_for(self, *names):
+        """
+        Concatenated text of the named sections
+
+        Falls back to the full text when none of them exist, so unstructured
+        resumes are still scanned in full.
+
+        Args:
+            *names: Section names ('header', 'summary', 'experience', 'skills',
+                'education', 'other')
+
+        Returns:
+            str: Section text
+        """
+        parts = [self.text[s.start:s.end] for s in self.sections if s.name in names]
+        if not parts:
+            return self.text
+        return '\n'.join(parts)
+
+
+def sectionize(text):
+    """
+    Split resume text into sections in one pass over its lines
+
+    Args:
+        text (str): Resume text
+
+    Returns:
+        ResumeSections: Sections with character offsets into `text`
+    """
+    sections = []
+    current_name = 'header'
+    current_start = 0
+    offset = 0
+
+    for line in text.splitlines(keepends=True):
+        name = _heading_name(line.strip())
+        if name is not None:
+            if offset > current_start:
+                sections.append(Section(current_name, current_start, offset))
+            current_name = name
+            current_start = offset
+        offset += len(line)
+
+    if offset > current_start:
+        sections.append(Section(current_name, current_start, offset))
+
+    return ResumeSections(text, sections)
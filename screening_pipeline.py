@@ -0,0 +1,266 @@
+import os
+from collections import deque
+from itertools import chain
+from datetime import datetime
+from io import BytesIO
+from candidate_identity import content_fingerprint
+from resume_parser import ResumeParser
+from band_classifier import BandClassifier
+from skills_analyzer import SkillsAnalyzer
+
+
+# Known documents that may wait behind a screening run before it is cut short,
+# so a batch of mostly re-uploaded files still yields in a bounded window
+MAX_PENDING_REUSED = 64
+
+
+class NamedBytesIO(BytesIO):
+    """
+    In-memory file carrying a filename, mirroring Streamlit's UploadedFile
+    """
+
+    def __init__(self, data, name):
+        super().__init__(data)
+        self.name = name
+
+
+class ScreeningPipeline:
+    """
+    Run the parser, band classifier and skills analyzer over a resume and
+    combine their output into a single result record
+    """
+
+    def __init__(self, corpus=None):
+        """
+        Args:
+            corpus (TextCorpus): Append every extracted text here and record
+                its `corpus_id` in the result, so it never has to be re-extracted
+        """
+        self.corpus = corpus
+        self.parser = ResumeParser()
+        self.classifier = BandClassifier()
+        self.skills_analyzer = SkillsAnalyzer()
+
+    def screen(self, uploaded_file):
+        """
+        Screen a single resume
+
+        Args:
+            uploaded_file: File-like object with a `name` attribute and a `read()` method
+
+        Returns:
+            dict: Combined screening result
+        """
+        return self.screen_text(uploaded_file.name, self.parser.extract_text(uploaded_file))
+
+    def screen_text(self, filename, text):
+        """
+        Screen a resume whose text has already been extracted
+
+        Args:
+            filename (str): Original filename
+            text (str): Extracted resume text
+
+        Returns:
+            dict: Combined screening result
+        """
+        # Parse resume
+        resume_data = self.parser.parse_text(text)
+
+        # Classify band
+        band_info = self.classifier.classify(resume_data['experience'])
+
+        # Analyze skills
+        skills_info = self.skills_analyzer.analyze(resume_data['text'], resume_data['experience'],
+                                                   sections=resume_data['sections'])
+
+        # Combine results
+        result = {
+            'filename': filename,
+            'name': resume_data.get('name', 'Unknown'),
+            'email': resume_data.get('email', 'Not found'),
+            'phone': resume_data.get('phone', 'Not found'),
+            'experience': resume_data['experience'],
+            'band': band_info['band'],
+            'designation': band_info['designation'],
+            'procurement_skills': skills_info['procurement_skills'],
+            'premium_skills': skills_info['premium_skills'],
+            'domain_score': skills_info['domain_score'],
+            'score_breakdown': skills_info.get('score_breakdown', {}),
+            'suitability': skills_info.get('suitability', {}),
+            'best_fit_role': skills_info.get('best_fit_role', 'General Procurement'),
+            'pros': skills_info.get('pros', []),
+            'cons': skills_info.get('cons', []),
+            'features': skills_info.get('features'),
+            'analysis_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        if self.corpus is not None:
+            result['corpus_id'] = self.corpus.append(text)
+        return result
+
+    def failed_result(self, filename, reason):
+        """
+        Build the record for a document that could not be screened
+
+        Args:
+            filename (str): Original filename
+            reason (str): Why screening failed (timeout, memory limit, crash)
+
+        Returns:
+            dict: Failed result carrying an `error` field
+        """
+        return {
+            'filename': filename,
+            'error': reason,
+            'analysis_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+    def screen_bytes(self, filename, data):
+        """
+        Screen a resume held in memory
+
+        Args:
+            filename (str): Original filename, used to pick the extractor
+            data (bytes): Raw file contents
+
+        Returns:
+            dict: Combined screening result
+        """
+        return self.screen(NamedBytesIO(data, filename))
+
+
+def _sniff_extension(data):
+    """Guess the resume format from the leading bytes"""
+    if data[:4] == b'%PDF':
+        return '.pdf'
+    if data[:2] == b'PK':
+        return '.docx'
+    return ''
+
+
+def _iter_documents(sources):
+    """
+    Normalize screening sources into file-like objects, one at a time
+
+    Paths are opened only when their turn comes, so no more than one
+    document's bytes are referenced by the generator at any point.
+    """
+    for idx, source in enumerate(sources):
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as f:
+                yield NamedBytesIO(f.read(), os.path.basename(os.fspath(source)))
+        elif isinstance(source, tuple):
+            filename, data = source
+            yield NamedBytesIO(bytes(data), filename)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            data = bytes(source)
+            yield NamedBytesIO(data, f"resume_{idx + 1}{_sniff_extension(data)}")
+        elif hasattr(source, 'read'):
+            name = getattr(source, 'name', None)
+            if isinstance(name, str) and name and os.path.sep not in name:
+                yield source
+            elif isinstance(name, str) and name:
+                # Open file objects report their full path; keep only the filename
+                yield NamedBytesIO(source.read(), os.path.basename(name))
+            else:
+                data = source.read()
+                yield NamedBytesIO(data, f"resume_{idx + 1}{_sniff_extension(data)}")
+        else:
+            raise TypeError(f"Unsupported resume source: {type(source).__name__}")
+
+
+def _screen_documents(documents, pipeline, extractor, pool, corpus):
+    """Screen normalized documents in input order with the chosen backend"""
+    if pool is not None:
+        if extractor is not None:
+            raise ValueError("Use either an isolated extractor or a screening pool, not both")
+        yield from pool.imap(documents)
+        return
+
+    pipeline = pipeline or ScreeningPipeline(corpus=corpus)
+    if extractor is None:
+        for document in documents:
+            yield pipeline.screen(document)
+        return
+
+    for filename, text, error in extractor.extract_iter(documents):
+        if error:
+            yield pipeline.failed_result(filename, error)
+        else:
+            yield pipeline.screen_text(filename, text)
+
+
+def _reused_result(filename, digest, previous):
+    result = dict(previous)
+    result['filename'] = filename
+    result['content_sha1'] = digest
+    result.pop('candidate_id', None)
+    return result
+
+
+def screen_iter(sources, pipeline=None, extractor=None, pool=None, corpus=None, known=None):
+    """
+    Screen resumes lazily, yielding each result as soon as it is ready
+
+    Every result carries the `content_sha1` fingerprint of its file.
+
+    Args:
+        sources: Iterable of file paths, raw bytes, (filename, bytes) pairs or
+            file-like objects with `read()` (and optionally `name`)
+        pipeline (ScreeningPipeline): Reuse an existing pipeline instead of building one
+        extractor (IsolatedExtractor): Extract text in sandboxed worker processes;
+            documents that time out or exceed the memory limit are yielded as
+            failed results instead of stalling the batch
+        pool (ScreeningPool): Screen across warm worker processes instead of in-process
+        corpus (TextCorpus): Keep extracted texts here when building a pipeline
+            (a given pipeline or pool keeps its own setting)
+        known (callable): Maps a content fingerprint to an earlier result for
+            the same bytes (or None); such documents are not screened again and
+            the earlier result is yielded under the new filename; at most
+            MAX_PENDING_REUSED of them are read ahead of the results they follow
+
+    Yields:
+        dict: Combined screening result, in input order
+    """
+    documents = _iter_documents(sources)
+    # (filename, fingerprint, earlier result or None) per document read, in input order
+    order = deque()
+    pending_reused = 0
+    exhausted = False
+
+    def run_segment():
+        """Feed documents to the backend until the sources run out or too many reused ones wait"""
+        nonlocal pending_reused, exhausted
+        for document in documents:
+            data = document.read()
+            digest = content_fingerprint(data)
+            previous = known(digest) if known is not None else None
+            order.append((document.name, digest, previous))
+            if previous is None:
+                yield NamedBytesIO(data, document.name)
+            else:
+                pending_reused += 1
+                if pending_reused >= MAX_PENDING_REUSED:
+                    # Ending the run lets the backend drain so the reused results can be yielded
+                    return
+        exhausted = True
+
+    def flush_reused():
+        nonlocal pending_reused
+        while order and order[0][2] is not None:
+            pending_reused -= 1
+            yield _reused_result(*order.popleft())
+
+    while not exhausted:
+        segment = run_segment()
+        first = next(segment, None)
+        if first is not None:
+            if pool is None and pipeline is None:
+                # Built once, on the first document that needs screening
+                pipeline = ScreeningPipeline(corpus=corpus)
+            for result in _screen_documents(chain([first], segment), pipeline, extractor, pool, corpus):
+                # Backends read ahead, so reused documents queued before this one go first
+                yield from flush_reused()
+                result['content_sha1'] = order.popleft()[1]
+                yield result
+        yield from flush_reused()
@@ -0,0 +1,190 @@
+"""
+Multi-process screening pool with per-worker warm models
+
+Every worker process builds its ResumeParser, BandClassifier and
+SkillsAnalyzer (and loads spaCy) exactly once in the pool initializer.
+Documents are dispatched in chunks sized by file bytes, adapted to the
+observed throughput, and workers send back only the compact result records,
+never the extracted text: given a corpus path, each worker appends its texts
+to the shared TextCorpus and returns their corpus ids.
+
+Workers are started from a forkserver (spawn where there is none), like
+IsolatedExtractor's: pools are created from the multithreaded Streamlit
+server and job threads, where forking could copy a lock another thread holds.
+"""
+
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from screening_pipeline import ScreeningPipeline
+from text_corpus import TextCorpus
+
+# Per-process pipeline, built once by the pool initializer
+_worker_pipeline = None
+
+# How long a warm-up task occupies its worker
+WARM_UP_HOLD_SECONDS = 0.05
+
+
+def init_worker(corpus_path=None):
+    """Build the screening pipeline (and load spaCy) once per worker process"""
+    global _worker_pipeline
+    _worker_pipeline = ScreeningPipeline(corpus=TextCorpus(corpus_path) if corpus_path else None)
+
+
+def warm_up(hold_seconds=0.0):
+    """Report the worker pid; tasks only run once the initializer has built the pipeline"""
+    # Holding the worker briefly keeps one fast worker from taking a whole round
+    time.sleep(hold_seconds)
+    return os.getpid()
+
+
+def screen_document(filename, data):
+    """Screen one resume inside a worker process"""
+    return _worker_pipeline.screen_bytes(filename, data)
+
+
+def screen_chunk(chunk):
+    """
+    Screen a chunk of resumes inside a worker process
+
+    Args:
+        chunk (list): (filename, bytes) pairs
+
+    Returns:
+        tuple: (results, elapsed seconds, total bytes)
+    """
+    start = time.perf_counter()
+    results = []
+    for filename, data in chunk:
+        try:
+            results.append(_worker_pipeline.screen_bytes(filename, data))
+        except Exception as e:
+            results.append(_worker_pipeline.failed_result(filename, f"screening failed: {e}"))
+    return results, time.perf_counter() - start, sum(len(data) for _, data in chunk)
+
+
+class ScreeningPool:
+    """
+    Process pool that screens documents in adaptively sized chunks
+    """
+
+    def __init__(self, workers=None, target_chunk_seconds=0.5, min_chunk_bytes=64 * 1024,
+                 max_chunk_bytes=16 * 1024 * 1024, max_chunk_docs=64, corpus_path=None):
+        """
+        Args:
+            workers (int): Worker processes (default: CPU count)
+            target_chunk_seconds (float): Work per chunk the sizing aims for; large
+                enough to amortize dispatch, small enough to keep workers balanced
+            min_chunk_bytes (int): Lower bound on the byte budget of a chunk
+            max_chunk_bytes (int): Upper bound on the byte budget of a chunk
+            max_chunk_docs (int): Upper bound on documents per chunk
+            corpus_path (str): TextCorpus the workers append extracted texts to
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.target_chunk_seconds = target_chunk_seconds
+        self.min_chunk_bytes = min_chunk_bytes
+        self.max_chunk_bytes = max_chunk_bytes
+        self.max_chunk_docs = max_chunk_docs
+        # Two chunks per worker keeps every process busy while one result is in transit
+        self.max_in_flight = 2 * self.workers
+        self._bytes_per_second = None
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('forkserver')
+            # Workers fork from a server that already imported the screening code
+            context.set_forkserver_preload([__name__])
+        else:
+            context = multiprocessing.get_context('spawn')
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                            initializer=init_worker, initargs=(corpus_path,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+    def warm_up(self):
+        """
+        Block until every worker has built its pipeline
+
+        A round of one task per worker does not reach every worker (an idle
+        one can take two), so rounds repeat until each worker pid has reported.
+
+        Returns:
+            set: Pids of the warmed-up workers
+        """
+        pids = set()
+        while len(pids) < self.workers:
+            futures = [self.executor.submit(warm_up, WARM_UP_HOLD_SECONDS) for _ in range(self.workers)]
+            pids.update(future.result() for future in futures)
+        return pids
+
+    @property
+    def chunk_bytes(self):
+        """Current byte budget per chunk"""
+        if self._bytes_per_second is None:
+            # Start small so the first chunks spread across every worker
+            return self.min_chunk_bytes
+        budget = int(self._bytes_per_second * self.target_chunk_seconds)
+        return max(self.min_chunk_bytes, min(self.max_chunk_bytes, budget))
+
+    def _record_rate(self, total_bytes, elapsed):
+        if elapsed <= 0 or total_bytes <= 0:
+            return
+        rate = total_bytes / elapsed
+        if self._bytes_per_second is None:
+            self._bytes_per_second = rate
+        else:
+            # Exponential moving average smooths out unusually slow documents
+            self._bytes_per_second = 0.8 * self._bytes_per_second + 0.2 * rate
+
+    def _next_chunk(self, documents):
+        chunk = []
+        chunk_size = 0
+        budget = self.chunk_bytes
+        for document in documents:
+            data = document.read()
+            chunk.append((document.name, data))
+            chunk_size += len(data)
+            if chunk_size >= budget or len(chunk) >= self.max_chunk_docs:
+                break
+        return chunk
+
+    def imap(self, documents):
+        """
+        Screen documents across the pool, yielding results in input order
+
+        At most `max_in_flight` chunks are read ahead, so memory stays bounded
+        by the chunk budget times the worker count.
+
+        Args:
+            documents: Iterable of file-like objects with `name` and `read()`
+
+        Yields:
+            dict: Compact screening result (no extracted text)
+        """
+        documents = iter(documents)
+        pending = deque()
+        exhausted = False
+
+        while True:
+            while not exhausted and len(pending) < self.max_in_flight:
+                chunk = self._next_chunk(documents)
+                if not chunk:
+                    exhausted = True
+                    break
+                pending.append(self.executor.submit(screen_chunk, chunk))
+
+            if not pending:
+                return
+
+            results, elapsed, total_bytes = pending.popleft().result()
+            self._record_rate(total_bytes, elapsed)
+            yield from results
@@ -0,0 +1,331 @@
+"""
+Local HTTP screening service for programmatic resume submission
+
+Runs the ResumeParser / BandClassifier / SkillsAnalyzer pipeline behind a
+small asyncio HTTP server. CPU work is handed to a process pool whose workers
+each build the pipeline once; requests wait in a bounded queue and are
+rejected with 429 when it is full (413 if a batch could never fit). At most
+`max_connections` requests are read at once, so concurrent uploads hold at
+most max_connections x max_body_mb in memory; further connections get 503.
+A connection that does not send its request line and headers within
+`header_timeout` seconds gets 408, so idle sockets cannot hold every slot.
+
+Endpoints:
+    GET  /healthz        Liveness probe
+    GET  /readyz         Readiness probe (200 once every worker process has reported
+                         in after building its pipeline and loading spaCy)
+    POST /screen         Single resume as the raw request body, filename in
+                         the `filename` query parameter or `X-Filename` header
+    POST /screen/batch   multipart/form-data upload with one part per resume
+
+Usage:
+    python screening_service.py --host 127.0.0.1 --port 8600 --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from email import policy
+from email.parser import BytesParser
+from urllib.parse import urlsplit, parse_qs
+
+from screening_pool import ScreeningPool, screen_document
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+STATUS_TEXT = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    408: 'Request Timeout',
+    411: 'Length Required',
+    413: 'Payload Too Large',
+    415: 'Unsupported Media Type',
+    429: 'Too Many Requests',
+    500: 'Internal Server Error',
+    503: 'Service Unavailable'
+}
+
+
+class HTTPError(Exception):
+    """
+    Error that maps directly onto an HTTP response
+    """
+
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+
+
+class ScreeningService:
+    """
+    Asyncio HTTP front end with a bounded queue in front of a process pool
+    """
+
+    def __init__(self, workers=None, queue_size=64, max_body_mb=25, max_connections=32, header_timeout=10.0):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.max_body_bytes = int(max_body_mb * 1024 * 1024)
+        self.max_connections = max_connections
+        self.header_timeout = header_timeout
+        self.ready = False
+        # Pids of the workers that have warmed up
+        self.warm_workers = set()
+        self._pool = None
+        self._queue = None
+        self._dispatchers = []
+        self._warm_up = None
+        self._connections = 0
+        self._server = None
+
+    async def start(self, host='127.0.0.1', port=8600):
+        """
+        Start the process pool, the dispatchers and the HTTP listener
+
+        Returns:
+            tuple: Bound (host, port), useful when `port` is 0
+        """
+        self._pool = ScreeningPool(workers=self.workers)
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+        # Held so the task is not garbage-collected and its failure stays visible
+        self._warm_up = asyncio.create_task(self._warm_up_pool())
+
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        """Stop accepting connections and shut the pool down"""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in self._dispatchers:
+            task.cancel()
+        if self._warm_up is not None and not self._warm_up.done():
+            self._warm_up.cancel()
+        if self._pool:
+            self._pool.close()
+
+    async def _warm_up_pool(self):
+        loop = asyncio.get_running_loop()
+        try:
+            # ScreeningPool.warm_up blocks until every worker pid has reported, so run it off the loop
+            self.warm_workers = await loop.run_in_executor(None, self._pool.warm_up)
+            self.ready = True
+        except Exception as e:
+            print(f"Worker warm-up failed: {e}")
+
+    async def _dispatch(self):
+        """Move queued documents onto the process pool, one at a time per dispatcher"""
+        loop = asyncio.get_running_loop()
+        while True:
+            filename, data, future = await self._queue.get()
+            try:
+                result = await loop.run_in_executor(self._pool.executor, screen_document, filename, data)
+                if not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    def _enqueue(self, documents):
+        """
+        Queue documents for screening, all or nothing
+
+        Args:
+            documents (list): (filename, bytes) pairs
+
+        Returns:
+            list: Futures resolving to the screening results
+        """
+        if len(documents) > self.queue_size:
+            raise HTTPError(413, f"Batch of {len(documents)} resumes exceeds the queue size of {self.queue_size}; "
+                                 f"split it into smaller batches")
+        if self._queue.qsize() + len(documents) > self.queue_size:
+            raise HTTPError(429, "Screening queue is full, retry later", {'Retry-After': '1'})
+
+        loop = asyncio.get_running_loop()
+        futures = []
+        for filename, data in documents:
+            future = loop.create_future()
+            self._queue.put_nowait((filename, data, future))
+            futures.append(future)
+        return futures
+
+    async def _handle_connection(self, reader, writer):
+        if self._connections >= self.max_connections:
+            # Refuse without reading the body, so uploads of excess connections never reach memory;
+            # the headers are read (briefly) so closing does not reset the connection before the reply
+            try:
+                await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), timeout=1)
+                await self._write_response(writer, 503, {'error': "Too many concurrent connections"},
+                                           {'Retry-After': '1'})
+            except (ConnectionError, asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                pass
+            finally:
+                writer.close()
+            return
+
+        self._connections += 1
+        try:
+            try:
+                method, target, headers, body = await self._read_request(reader)
+                status, payload, extra_headers = await self._route(method, target, headers, body)
+            except HTTPError as e:
+                status, payload, extra_headers = e.status, {'error': e.message}, e.headers
+            except Exception as e:
+                status, payload, extra_headers = 500, {'error': str(e)}, {}
+            await self._write_response(writer, status, payload, extra_headers)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections -= 1
+            writer.close()
+
+    async def _read_request(self, reader):
+        try:
+            method, target, headers = await asyncio.wait_for(self._read_head(reader), self.header_timeout)
+        except asyncio.TimeoutError:
+            raise HTTPError(408, f"Request line and headers not received within {self.header_timeout:g}s")
+
+        body = b''
+        if method == 'POST':
+            if 'content-length' not in headers:
+                raise HTTPError(411, "Content-Length header is required")
+            length = headers['content-length']
+            if not (length.isascii() and length.isdigit()):
+                raise HTTPError(400, "Content-Length must be a non-negative integer")
+            length = int(length)
+            if length > self.max_body_bytes:
+                raise HTTPError(413, f"Request body exceeds {self.max_body_bytes} bytes")
+            body = await reader.readexactly(length)
+        return method, target, headers, body
+
+    async def _read_head(self, reader):
+        request_line = (await reader.readline()).decode('latin-1').strip()
+        parts = request_line.split()
+        if len(parts) != 3:
+            raise HTTPError(400, "Malformed request line")
+        method, target, _ = parts
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1')
+            if line in ('\r\n', '\n', ''):
+                break
+            key, _, value = line.partition(':')
+            headers[key.strip().lower()] = value.strip()
+        return method, target, headers
+
+    async def _route(self, method, target, headers, body):
+        url = urlsplit(target)
+
+        if url.path == '/healthz':
+            return 200, {'status': 'ok'}, {}
+
+        if url.path == '/readyz':
+            if self.ready:
+                return 200, {'status': 'ready', 'workers': len(self.warm_workers)}, {}
+            return 503, {'status': 'warming_up'}, {}
+
+        if url.path == '/screen':
+            if method != 'POST':
+                raise HTTPError(405, "Use POST")
+            query = parse_qs(url.query)
+            filename = query.get('filename', [headers.get('x-filename', '')])[0]
+            self._check_filename(filename)
+            result = await self._enqueue([(filename, body)])[0]
+            return 200, result, {}
+
+        if url.path == '/screen/batch':
+            if method != 'POST':
+                raise HTTPError(405, "Use POST")
+            documents = self._parse_multipart(headers.get('content-type', ''), body)
+            results = await asyncio.gather(*self._enqueue(documents))
+            return 200, {'count': len(results), 'results': results}, {}
+
+        raise HTTPError(404, f"Unknown path {url.path}")
+
+    def _check_filename(self, filename):
+        if not filename.lower().endswith(SUPPORTED_EXTENSIONS):
+            raise HTTPError(415, "Only PDF and DOCX resumes are supported")
+
+    def _parse_multipart(self, content_type, body):
+        """Split a multipart/form-data body into (filename, bytes) pairs"""
+        if not content_type.startswith('multipart/form-data'):
+            raise HTTPError(415, "Batch uploads must be multipart/form-data")
+
+        message = BytesParser(policy=policy.HTTP).parsebytes(
+            b'Content-Type: ' + content_type.encode('latin-1') + b'\r\n\r\n' + body
+        )
+        documents = []
+        for part in message.iter_parts():
+            filename = part.get_filename()
+            if not filename:
+                continue
+            self._check_filename(filename)
+            documents.append((filename, part.get_payload(decode=True) or b''))
+
+        if not documents:
+            raise HTTPError(400, "No resume files found in the upload")
+        return documents
+
+    async def _write_response(self, writer, status, payload, extra_headers):
+        body = json.dumps(payload).encode('utf-8')
+        lines = [
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+            "Connection: close"
+        ]
+        lines.extend(f"{key}: {value}" for key, value in extra_headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + body)
+        await writer.drain()
+
+
+async def _run(args):
+    service = ScreeningService(workers=args.workers, queue_size=args.queue_size,
+                               max_body_mb=args.max_body_mb, max_connections=args.max_connections,
+                               header_timeout=args.header_timeout)
+    host, port = await service.start(args.host, args.port)
+    print(f"Screening service listening on http://{host}:{port} ({service.workers} workers)")
+    try:
+        await service.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main():
+    """Run the screening service from the command line"""
+    arg_parser = argparse.ArgumentParser(description="Local HTTP resume screening service")
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--port', type=int, default=8600)
+    arg_parser.add_argument('--workers', type=int, default=None,
+                            help="Worker processes (default: CPU count)")
+    arg_parser.add_argument('--queue-size', type=int, default=64,
+                            help="Maximum queued documents before returning 429")
+    arg_parser.add_argument('--max-body-mb', type=float, default=25)
+    arg_parser.add_argument('--max-connections', type=int, default=32,
+                            help="Concurrent requests read at once; more get 503")
+    arg_parser.add_argument('--header-timeout', type=float, default=10.0,
+                            help="Seconds a client has to send its request line and headers; then 408")
+    args = arg_parser.parse_args()
+
+    try:
+        asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+"More like this": candidate similarity search over skill vectors
+
+Every stored result carries a bit-packed feature record: one bit per skill,
+role and achievement term of the vocabulary (see feature_vectors.py). Each
+candidate becomes that bitmap weighted by inverse document frequency (a term
+everyone has says little) and normalized, so a dot product is the cosine
+similarity of two skill profiles. The vectors live in one float32 matrix.
+
+Queries are approximate nearest neighbour lookups: random-hyperplane LSH
+signatures of every vector are kept in a few tables, each sorted by
+signature, so a query binary-searches its own bucket (and the buckets one bit
+away) in every table and ranks only the candidates found there exactly. When
+the buckets come up short, it falls back to an exact scan of the matrix,
+which is still milliseconds at 100k candidates.
+
+A refresh appends its batch with the weights already in use and merges the
+new signatures into the sorted tables; the weights are only refitted to the
+whole corpus, and the tables re-sorted, once it has grown by REFIT_GROWTH.
+numpy is imported on first use, so importing the app does not load it.
+"""
+
+import threading
+
+from skills_analyzer import SkillsAnalyzer
+
+# LSH tables and hyperplanes (signature bits) per table
+LSH_TABLES = 8
+LSH_BITS = 12
+
+# Hyperplanes are drawn from a fixed seed so signatures are reproducible
+LSH_SEED = 20240101
+
+# IDF weights are refitted, and every signature recomputed, once the index has grown by this factor
+REFIT_GROWTH = 2
+
+
+class SimilarityIndex:
+    """
+    IDF-weighted skill vectors of stored candidates with LSH bucketing
+    """
+
+    def __init__(self, store=None, analyzer=None):
+        """
+        Args:
+            store (CandidateStore): Candidates are loaded from here by `refresh()`
+            analyzer (SkillsAnalyzer): Vocabulary the feature records must use
+        """
+        import numpy as np
+
+        self.store = store
+        self.analyzer = analyzer or SkillsAnalyzer()
+        n_terms = len(self.analyzer.feature_terms)
+        self._planes = np.random.default_rng(LSH_SEED).standard_normal(
+            (n_terms, LSH_TABLES * LSH_BITS)).astype(np.float32)
+        self._powers = (1 << np.arange(LSH_BITS)).astype(np.int64)
+        self._lock = threading.RLock()
+        self._reset()
+        self.refresh()
+
+    def _reset(self):
+        import numpy as np
+
+        n_terms = len(self.analyzer.feature_terms)
+        self.ids = np.zeros(0, dtype=np.int64)
+        self._hits = np.zeros((0, n_terms), dtype=bool)
+        self.vectors = np.zeros((0, n_terms), dtype=np.float32)
+        self._codes = np.zeros((0, LSH_TABLES), dtype=np.int64)
+        # Per table: row order sorted by signature, and the sorted signatures
+        self._orders = []
+        self._sorted_codes = []
+        self._idf = None
+        # Rows the current IDF weights were fitted to
+        self._fitted_rows = 0
+        self._last_id = 0
+        self._version = self.store.version() if self.store is not None else None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def refresh(self):
+        """
+        Load candidates stored since the last call; a store that was cleared,
+        rescored or re-encoded is reloaded from scratch
+
+        Returns:
+            int: Number of new candidates
+        """
+        if self.store is None:
+            return 0
+        with self._lock:
+            if self.store.version() != self._version:
+                self._reset()
+            ids, features = self.store.load_features(self.analyzer.vocabulary_id, after_id=self._last_id)
+            if ids:
+                self.add(ids, features)
+                self._last_id = ids[-1]
+            return len(ids)
+
+    def add(self, ids, features):
+        """
+        Index feature records
+
+        Args:
+            ids (list): Ascending candidate ids, above every id already indexed
+            features (list): Matching feature dicts of the analyzer's vocabulary
+        """
+        import numpy as np
+        from feature_vectors import FeatureMatrix
+
+        if not ids:
+            return
+        matrix = FeatureMatrix.from_features(features, self.analyzer)
+        with self._lock:
+            self.ids = np.concatenate([self.ids, np.asarray(ids, dtype=np.int64)])
+            self._hits = np.concatenate([self._hits, matrix.hits])
+            if len(self._hits) >= REFIT_GROWTH * self._fitted_rows:
+                self._build()
+            else:
+                self._append(matrix.hits)
+
+    def _weigh(self, hits):
+        """
+        IDF-weighted, normalized vectors and LSH signatures of bitmap rows
+
+        Returns:
+            tuple: (vectors, codes)
+        """
+        import numpy as np
+
+        vectors = hits * self._idf
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms > 0, norms, 1)
+        signs = (vectors @ self._planes > 0).reshape(len(hits), LSH_TABLES, LSH_BITS)
+        return vectors, signs @ self._powers
+
+    def _build(self):
+        """Fit the weights to every indexed row and sort the tables from scratch"""
+        import numpy as np
+
+        hits = self._hits
+        df = hits.sum(axis=0)
+        self._idf = (np.log((1 + len(hits)) / (1 + df)) + 1).astype(np.float32)
+        self._fitted_rows = len(hits)
+        self.vectors, self._codes = self._weigh(hits)
+        self._orders = [np.argsort(self._codes[:, t], kind='stable') for t in range(LSH_TABLES)]
+        self._sorted_codes = [self._codes[order, t] for t, order in enumerate(self._orders)]
+
+    def _append(self, hits):
+        """Weigh new rows with the current weights and merge them into the sorted tables"""
+        import numpy as np
+
+        first = len(self.vectors)
+        vectors, codes = self._weigh(hits)
+        self.vectors = np.concatenate([self.vectors, vectors])
+        self._codes = np.concatenate([self._codes, codes])
+        for t in range(LSH_TABLES):
+            order = np.argsort(codes[:, t], kind='stable')
+            new_codes = codes[order, t]
+            # After equal signatures already there, as a stable sort of the whole table would put them
+            at = np.searchsorted(self._sorted_codes[t], new_codes, side='right')
+            self._sorted_codes[t] = np.insert(self._sorted_codes[t], at, new_codes)
+            self._orders[t] = np.insert(self._orders[t], at, order + first)
+
+    def _row(self, candidate_id):
+        import numpy as np
+
+        row = int(np.searchsorted(self.ids, candidate_id))
+        return row if row < len(self.ids) and self.ids[row] == candidate_id else None
+
+    def _bucket_rows(self, row):
+        """Rows sharing a signature, or differing in one bit, in any table"""
+        import numpy as np
+
+        found = []
+        for t in range(LSH_TABLES):
+            code = int(self._codes[row, t])
+            for probe in [code] + [code ^ (1 << b) for b in range(LSH_BITS)]:
+                lo = np.searchsorted(self._sorted_codes[t], probe, side='left')
+                hi = np.searchsorted(self._sorted_codes[t], probe, side='right')
+                found.append(self._orders[t][lo:hi])
+        return np.unique(np.concatenate(found))
+
+    def similar(self, candidate_id, k=5, exact=False):
+        """
+        Candidates with the most similar skill profiles
+
+        Args:
+            candidate_id (int): Stored candidate to match
+            k (int): Number of neighbours
+            exact (bool): Scan every vector instead of the LSH buckets
+
+        Returns:
+            list: (candidate id, cosine similarity) pairs, most similar first;
+                empty if the candidate is not indexed
+        """
+        import numpy as np
+
+        with self._lock:
+            row = self._row(candidate_id)
+            if row is None:
+                return []
+            rows = None if exact else self._bucket_rows(row)
+            if rows is None or len(rows) <= k:
+                rows = np.arange(len(self.ids))
+            rows = rows[rows != row]
+            similarity = self.vectors[rows] @ self.vectors[row]
+            if len(rows) > k:
+                top = np.argpartition(-similarity, k)[:k]
+            else:
+                top = np.arange(len(rows))
+            top = top[np.argsort(-similarity[top], kind='stable')]
+            return [(int(self.ids[rows[i]]), float(similarity[i])) for i in top]
@@ -1,11 +1,53 @@
+import hashlib
+import os
 import re
+from fuzzy_matcher import FuzzyMatcher
+from resume_sections import sectionize
+
+# Resume sections scanned for skills and role keywords, and for job date ranges
+SKILL_SECTIONS = ('summary', 'skills', 'experience')
+WORK_HISTORY_SECTIONS = ('experience',)
+
+# Domain score weights: points per match and the cap of each component
+DEFAULT_WEIGHTS = {
+    'base_skill_points': 3,
+    'base_skills_max': 30,
+    'advanced_concept_points': 3,
+    'advanced_concepts_max': 30,
+    'premium_skill_points': 5,
+    'premium_skills_max': 20,
+    'density_keyword_points': 1,
+    'density_max': 10,
+    'stability_points': 10,
+    'stability_unknown_points': 5,
+    'stability_min_avg_tenure': 2.0
+}
+
+# Job date ranges (Month Year - Month Year), used to estimate the number of roles.
+# Matches only start at word boundaries, which keeps the search linear on
+# garbage such as one endless word or digit run.
+ROLE_DATE_PATTERN = re.compile(r'\b(\w+\s+\d{4})\s*[-–—to]+\s*\b(\w+\s+\d{4}|present|current)')
+
+# Characters of work history scanned for date ranges (see resume_parser)
+HISTORY_SCAN_CHARS = 200000
 
 class SkillsAnalyzer:
     """
     Analyze resume text for procurement, sourcing, and premium skills
     """
     
-    def __init__(self):
+    def __init__(self, weights=None, fuzzy=None, max_edit_distance=1):
+        """
+        Args:
+            weights (dict): Overrides for DEFAULT_WEIGHTS
+            fuzzy (bool): Also match misspelled keywords; defaults to the
+                RESUME_SCREENER_FUZZY environment variable
+            max_edit_distance (int): Edits tolerated per keyword word in fuzzy mode
+        """
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        if fuzzy is None:
+            fuzzy = os.environ.get('RESUME_SCREENER_FUZZY', '0').lower() in ('1', 'true', 'yes')
+
         # Core procurement and sourcing keywords
         self.procurement_keywords = {
             'procurement': ['procurement', 'purchase', 'purchasing', 'buy', 'buying'],
@@ -47,7 +89,112 @@ class SkillsAnalyzer:
             'sustainability', 'green procurement', 'ethical sourcing',
             'e-procurement', 'procure to pay', 'p2p', 'source to pay', 's2p'
         ]
-    
+
+        # Concepts that score the "Advanced Concepts" component
+        self.scoring_concepts = ['tco', 'jit', 'erp', 'mrp', 'kanban', 'six sigma', 'kaizen', 'payable',
+                                 'contract', 'negotiation']
+
+        # Role keywords counted for density
+        self.density_keywords = [
+            'sourcing', 'source', 'rfq', 'rfp', 'rfi', 'negotiation', 'supplier', 'bid',
+            'procurement', 'purchase', 'buying', 'order', 'po', 'requisition', 'procure',
+            'vendor', 'supplier', 'relationship', 'srm', 'performance', 'evaluation', 'onboarding'
+        ]
+
+        # Specific keywords for each role type
+        self.role_keywords = {
+            'Sourcing': self.procurement_keywords['sourcing'] + ['strategic sourcing', 'supplier discovery'],
+            'Procurement': self.procurement_keywords['procurement'] + ['purchase order', 'purchasing', 'buying'],
+            'Vendor Development': self.procurement_keywords['vendor_management'] + ['supplier development', 'vendor improvement']
+        }
+
+        self.achievement_keywords = [
+            'achieved', 'saved', 'increased', 'decreased', 'reduced', 'improved',
+            'delivered', 'awarded', 'accolade', 'revenue', 'budget', 'cost saving',
+            'optimization', '%', 'million', 'billion', 'usd', 'inr'
+        ]
+
+        # Every term the scorer looks up, in a fixed order: a resume's matches
+        # are stored as one bit per term so it can be re-scored without re-parsing
+        groups = (
+            [keyword for keywords in self.procurement_keywords.values() for keyword in keywords],
+            [keyword for keywords in self.premium_skills_keywords.values() for keyword in keywords],
+            self.scoring_concepts,
+            self.density_keywords,
+            [keyword for keywords in self.role_keywords.values() for keyword in keywords],
+            self.achievement_keywords
+        )
+        self.feature_terms = list(dict.fromkeys(term for group in groups for term in group))
+        self.fuzzy_matcher = FuzzyMatcher(self.feature_terms, max_edit_distance) if fuzzy else None
+        # Typo-tolerant matches differ from exact ones, so the matching mode is
+        # part of the vocabulary (exact mode keeps the id of the terms alone)
+        self.matching = {'fuzzy': bool(fuzzy), 'max_edit_distance': max_edit_distance if fuzzy else 0}
+        vocabulary = '\n'.join(self.feature_terms)
+        if fuzzy:
+            vocabulary += f"\n#fuzzy:{max_edit_distance}"
+        self.vocabulary_id = hashlib.sha1(vocabulary.encode('utf-8')).hexdigest()[:12]
+
+    def taxonomy(self):
+        """
+        Snapshot of every keyword group the scorer uses
+
+        Returns:
+            dict: JSON-serializable groups plus the ordered feature terms
+        """
+        return {
+            'procurement_keywords': self.procurement_keywords,
+            'premium_skills_keywords': self.premium_skills_keywords,
+            'scoring_concepts': self.scoring_concepts,
+            'density_keywords': self.density_keywords,
+            'role_keywords': self.role_keywords,
+            'achievement_keywords': self.achievement_keywords,
+            'feature_terms': self.feature_terms,
+            'matching': self.matching
+        }
+
+    def match_terms(self, text):
+        """
+        Find which feature terms occur in (lowercased) text
+
+        Returns:
+            set: Matched terms
+        """
+        matched = {term for term in self.feature_terms if term in text}
+        if self.fuzzy_matcher is not None:
+            matched |= self.fuzzy_matcher.match(text)
+        return matched
+
+    def encode_matches(self, matched):
+        """Pack matched terms into an int bitmap over `feature_terms`"""
+        return sum(1 << i for i, term in enumerate(self.feature_terms) if term in matched)
+
+    def decode_matches(self, hits):
+        """Unpack an int bitmap back into the set of matched terms"""
+        return {term for i, term in enumerate(self.feature_terms) if hits >> i & 1}
+
+    def extract_features(self, text, experience_years=0, sections=None):
+        """
+        Compact feature record: everything scoring needs, nothing it does not
+
+        Args:
+            text (str): Resume text
+            experience_years (float): Years of experience
+            sections (ResumeSections): Precomputed sections of `text`
+
+        Returns:
+            dict: vocabulary id, hex term bitmap, experience, role count and word count
+        """
+        sections = sections or sectionize(text)
+        text_lower = sections.text_for(*SKILL_SECTIONS).lower()
+        history_lower = sections.text_for(*WORK_HISTORY_SECTIONS)[:HISTORY_SCAN_CHARS].lower()
+        return {
+            'vocabulary': self.vocabulary_id,
+            'hits': format(self.encode_matches(self.match_terms(text_lower)), 'x'),
+            'experience': experience_years,
+            'num_roles': len(ROLE_DATE_PATTERN.findall(history_lower)),
+            'word_count': len(text.split())
+        }
+
     def check_suitability(self, text):
         """
         Check if the profile suits specific roles
@@ -58,20 +205,14 @@ class SkillsAnalyzer:
         Returns:
             dict: Suitability analysis
         """
-        text_lower = text.lower()
-        
-        # Define specific keywords for each role type
-        role_keywords = {
-            'Sourcing': self.procurement_keywords['sourcing'] + ['strategic sourcing', 'supplier discovery'],
-            'Procurement': self.procurement_keywords['procurement'] + ['purchase order', 'purchasing', 'buying'],
-            'Vendor Development': self.procurement_keywords['vendor_management'] + ['supplier development', 'vendor improvement']
-        }
-        
+        return self._check_suitability(self.match_terms(text.lower()))
+
+    def _check_suitability(self, matched):
+        """Suitability per role from a set of matched terms"""
         suitability = {}
         
-        for role, keywords in role_keywords.items():
-            matches = [k for k in keywords if k in text_lower]
-            unique_matches = list(set(matches))
+        for role, keywords in self.role_keywords.items():
+            unique_matches = [k for k in dict.fromkeys(keywords) if k in matched]
             
             # Simple scoring: High if > 2 unique keywords, Medium if > 0, Low otherwise
             if len(unique_matches) >= 2:
@@ -88,32 +229,58 @@ class SkillsAnalyzer:
             
         return suitability
 
-    def analyze(self, text, experience_years=0):
+    def analyze(self, text, experience_years=0, sections=None):
         """
         Analyze resume text for key skills and domain knowledge
         
+        Skills and role keywords are looked up in the summary, skills and
+        experience sections only; job date ranges in the experience section.
+        The result carries the compact `features` record it was scored from.
+        
         Args:
             text (str): Resume text
             experience_years (float): Years of experience
+            sections (ResumeSections): Precomputed sections of `text`
             
         Returns:
             dict: Analysis results
         """
-        text_lower = text.lower()
+        features = self.extract_features(text, experience_years, sections)
+        analysis = self.analyze_features(features)
+        analysis['features'] = features
+        return analysis
+
+    def analyze_features(self, features):
+        """
+        Score a feature record produced by `extract_features`
+
+        Args:
+            features (dict): Feature record; its vocabulary must match this analyzer's
+
+        Returns:
+            dict: Analysis results
+        """
+        if features['vocabulary'] != self.vocabulary_id:
+            raise ValueError("Feature record was built with a different skill vocabulary")
+
+        matched = self.decode_matches(int(features['hits'] or '0', 16))
+        experience_years = features['experience']
+        num_roles = features['num_roles']
         
         # Find procurement skills
-        procurement_skills = self._find_procurement_skills(text_lower)
+        procurement_skills = self._find_procurement_skills(matched)
         
         # Find premium skills
-        premium_skills = self._find_premium_skills(text_lower)
+        premium_skills = self._find_premium_skills(matched)
         
         # Calculate domain score
-        score_data = self._calculate_domain_score(text_lower, procurement_skills, premium_skills, experience_years)
+        score_data = self._calculate_domain_score(matched, procurement_skills, premium_skills, experience_years,
+                                                  num_roles=num_roles, word_count=features['word_count'])
         domain_score = score_data['total_score']
         score_breakdown = score_data['breakdown']
         
         # Check role suitability
-        suitability = self.check_suitability(text_lower)
+        suitability = self._check_suitability(matched)
         
         # Determine best fit role
         best_fit_role = "General Procurement"
@@ -132,7 +299,8 @@ class SkillsAnalyzer:
             best_fit_role = "General Procurement"
             
         # Generate Pros and Cons
-        pros, cons = self._generate_pros_cons(domain_score, premium_skills, suitability, score_breakdown, text_lower, experience_years)
+        pros, cons = self._generate_pros_cons(domain_score, premium_skills, suitability, score_breakdown, matched,
+                                              experience_years, num_roles)
         
         return {
             'procurement_skills': procurement_skills,
@@ -145,11 +313,10 @@ class SkillsAnalyzer:
             'cons': cons
         }
         
-    def _generate_pros_cons(self, score, premium_skills, suitability, breakdown, text, experience_years):
+    def _generate_pros_cons(self, score, premium_skills, suitability, breakdown, matched, experience_years, num_roles):
         """Generate pros and cons based on analysis"""
         pros = []
         cons = []
-        import re
         
         # Score based
         if score >= 70:
@@ -164,12 +331,7 @@ class SkillsAnalyzer:
             cons.append("No premium skills (Python, PowerBI, etc.) detected")
             
         # Achievement Analysis
-        achievement_keywords = [
-            'achieved', 'saved', 'increased', 'decreased', 'reduced', 'improved', 
-            'delivered', 'awarded', 'accolade', 'revenue', 'budget', 'cost saving',
-            'optimization', '%', 'million', 'billion', 'usd', 'inr'
-        ]
-        achievement_count = sum(1 for word in achievement_keywords if word in text)
+        achievement_count = sum(1 for word in self.achievement_keywords if word in matched)
         
         if achievement_count >= 5:
             pros.append("Strong track record of quantifiable achievements")
@@ -180,12 +342,7 @@ class SkillsAnalyzer:
 
         # Stability/Tenure Analysis (Job Hopping)
         if experience_years > 0:
-            # Heuristic: Count date ranges to estimate number of roles
-            # Pattern: Month Year - Month Year
-            date_pattern = r'(\w+\s+\d{4})\s*[-–—to]+\s*(\w+\s+\d{4}|present|current)'
-            matches = re.findall(date_pattern, text)
-            num_roles = len(matches)
-            
+            # Heuristic: date ranges in the work history estimate the number of roles
             # If no matches found, fallback isn't possible easily, so skip
             if num_roles > 0:
                 avg_tenure = experience_years / num_roles
@@ -204,31 +361,31 @@ class SkillsAnalyzer:
                 cons.append("Weak alignment with core procurement roles")
                 
         # Density based
-        if breakdown.get('Keyword Density', 0) < 3:
+        if breakdown.get('Density (Role Keywords)', 0) < 3:
             cons.append("Low keyword density in resume")
             
         return pros, cons
     
-    def _find_procurement_skills(self, text):
-        """Find procurement and sourcing skills in resume text"""
+    def _find_procurement_skills(self, matched):
+        """Find procurement and sourcing skills among the matched terms"""
         found_skills = set()
         
         for category, keywords in self.procurement_keywords.items():
             for keyword in keywords:
-                if keyword in text:
+                if keyword in matched:
                     # Add readable version of the skill
                     skill_name = self._format_skill_name(keyword)
                     found_skills.add(skill_name)
         
         return sorted(list(found_skills))
     
-    def _find_premium_skills(self, text):
-        """Find premium skills (Excel, Power BI, Tableau, etc.) in resume text"""
+    def _find_premium_skills(self, matched):
+        """Find premium skills (Excel, Power BI, Tableau, etc.) among the matched terms"""
         found_skills = set()
         
         for category, keywords in self.premium_skills_keywords.items():
             for keyword in keywords:
-                if keyword in text:
+                if keyword in matched:
                     # Add the category name instead of individual keyword
                     category_name = self._get_premium_category_name(category)
                     found_skills.add(category_name)
@@ -236,71 +393,58 @@ class SkillsAnalyzer:
         
         return sorted(list(found_skills))
 
-    def _calculate_domain_score(self, text, procurement_skills, premium_skills, experience_years=0):
+    def _calculate_domain_score(self, matched, procurement_skills, premium_skills, experience_years=0,
+                                num_roles=0, word_count=0):
         """
         Calculate domain score based on identified skills and stability
-        Total: 100 Points
+        Total: 100 Points with DEFAULT_WEIGHTS
         - Base Procurement Skills: 30 pts
         - Advanced Concepts: 30 pts
         - Premium Skills: 20 pts
         - Keyword Density (Procurement/Sourcing/Vendor): 10 pts
         - Stability (Avg Tenure > 2 yrs): 10 pts
         """
+        weights = self.weights
         score = 0
         
-        # 1. Base Procurement Skills (Max 30)
+        # 1. Base Procurement Skills
         skill_categories_found = set()
         for skill in procurement_skills:
             root = skill.split()[0].lower()
             skill_categories_found.add(root)
             
-        base_score = min(30, len(skill_categories_found) * 3)
+        base_score = min(weights['base_skills_max'], len(skill_categories_found) * weights['base_skill_points'])
         score += base_score
         
-        # 2. Advanced Concepts (Max 30)
-        # Assuming advanced_concepts is defined in __init__ or we use a local list if not
-        # To be safe, I'll define it locally as I did in my logic design, unless simple self.advanced_concepts is reliable.
-        # The previous code had it as a list. I will use the list from previous context.
-        advanced_concepts = ['tco', 'jit', 'erp', 'mrp', 'kanban', 'six sigma', 'kaizen', 'payable', 'contract', 'negotiation']
-        advanced_found = sum(1 for concept in advanced_concepts if concept in text)
-        advanced_score = min(30, advanced_found * 3)
+        # 2. Advanced Concepts
+        advanced_found = sum(1 for concept in self.scoring_concepts if concept in matched)
+        advanced_score = min(weights['advanced_concepts_max'], advanced_found * weights['advanced_concept_points'])
         score += advanced_score
         
-        # 3. Premium Skills (Max 20)
-        premium_score = min(20, len(premium_skills) * 5)
+        # 3. Premium Skills
+        premium_score = min(weights['premium_skills_max'], len(premium_skills) * weights['premium_skill_points'])
         score += premium_score
         
-        # 4. Keyword Density (Procurement/Sourcing/Vendor) (Max 10)
-        role_keywords = [
-            'sourcing', 'source', 'rfq', 'rfp', 'rfi', 'negotiation', 'supplier', 'bid',
-            'procurement', 'purchase', 'buying', 'order', 'po', 'requisition', 'procure',
-            'vendor', 'supplier', 'relationship', 'srm', 'performance', 'evaluation', 'onboarding'
-        ]
-        
-        density_count = sum(1 for word in role_keywords if word in text)
+        # 4. Keyword Density (Procurement/Sourcing/Vendor)
+        density_count = sum(1 for word in self.density_keywords if word in matched)
         # Simple cap: 10+ matching keywords gives full points
-        density_score = min(10, density_count)
+        density_score = min(weights['density_max'], density_count * weights['density_keyword_points'])
         score += density_score
         
-        # 5. Stability Check (Max 10)
+        # 5. Stability Check
         stability_score = 0
         if experience_years > 2:
-            import re
-            date_pattern = r'(\w+\s+\d{4})\s*[-–—to]+\s*(\w+\s+\d{4}|present|current)'
-            matches = re.findall(date_pattern, text)
-            num_roles = len(matches)
-            
             if num_roles > 0:
                 avg_tenure = experience_years / num_roles
-                if avg_tenure >= 2.0:
-                    stability_score = 10
+                if avg_tenure >= weights['stability_min_avg_tenure']:
+                    stability_score = weights['stability_points']
         elif experience_years == 0:
              stability_score = 0
-             if len(text.split()) > 100: # Heuristic: if valid resume text but extraction failed, assume neutral/stable
-                 stability_score = 5 
+             if word_count > 100: # Heuristic: if valid resume text but extraction failed, assume neutral/stable
+                 stability_score = weights['stability_unknown_points']
         else:
              # For < 2 years experience, default to full points (entry level)
-             stability_score = 10
+             stability_score = weights['stability_points']
              
         score += stability_score
         
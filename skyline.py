@@ -0,0 +1,278 @@
+"""
+Pareto shortlist: candidates nobody else beats on every axis
+
+A candidate is dominated when another one is at least as good on every
+criterion (experience, domain score, premium skill count and the fit level of
+each role) and better on one. Every role is a dimension of its own: a strong
+Sourcing fit is not traded against a weak Procurement fit. The shortlist is
+the set of non-dominated candidates (the skyline) of the whole pool; the
+dashboard's band filter then picks from it, so a junior candidate whom a
+senior one beats on every axis is not shortlisted just for being in a
+different band. Results analyzed with different role taxonomies have
+different dimensions and get separate frontiers.
+
+The frontier is computed with sort-filter-skyline: vectors are sorted by the
+sum of their criteria, highest first, so a vector can only be dominated by
+one already accepted, and each one is compared against the current frontier
+instead of every other candidate. Candidates with identical vectors share one
+entry. Appended batches are merged by running the same sweep over the old
+frontier plus the new vectors only, so the shortlist follows the list as it
+grows without rescanning it.
+"""
+
+from abc import ABC, abstractmethod
+from operator import ge
+
+from candidate_index import SORT_OPTIONS, SORT_KEYS
+from candidate_result import CandidateResult, FIT_LEVELS, as_dict
+
+# New vectors merged into the frontier per sort-filter-skyline pass
+MERGE_CHUNK_SIZE = 1024
+
+
+def fit_roles(result):
+    """
+    Roles whose fit levels end a result's criteria vector, in that order
+
+    Args:
+        result: Result dict or CandidateResult
+
+    Returns:
+        tuple: Role names, sorted
+    """
+    if isinstance(result, CandidateResult):
+        return tuple(sorted(role for role, _, _ in result.suitability_codes))
+    return tuple(sorted(result.get('suitability', {})))
+
+
+def criteria(result):
+    """
+    Shortlist criteria of one result, all to be maximized
+
+    Args:
+        result: Result dict or CandidateResult
+
+    Returns:
+        tuple: (experience, domain score, premium skill count, then the fit
+            level of each role in fit_roles() order, 0 for Low to 2 for High)
+    """
+    if isinstance(result, CandidateResult):
+        fits = sorted((role, fit) for role, fit, _ in result.suitability_codes)
+        return (result.experience, result.domain_score, bin(result.premium_mask).count('1'),
+                *(fit for _, fit in fits))
+    suitability = result.get('suitability', {})
+    return (result['experience'], result['domain_score'], len(result.get('premium_skills', [])),
+            *(FIT_LEVELS.index(suitability[role]['fit']) for role in sorted(suitability)))
+
+
+def pareto_frontier(vectors):
+    """
+    Non-dominated vectors, all criteria maximized (sort-filter-skyline)
+
+    Args:
+        vectors (iterable): Tuples of numbers, all of the same length
+
+    Returns:
+        list: The distinct frontier vectors, by descending criteria sum
+    """
+    frontier = []
+    # The vector itself breaks sum ties (and float rounding) in favour of a dominator
+    for v in sorted(vectors, key=lambda v: (sum(v), v), reverse=True):
+        # Everything sorted earlier either dominates v, equals it (a duplicate
+        # to drop) or is incomparable
+        for w in frontier:
+            # The three scalar criteria rule out most candidates before the role fits
+            if w[0] >= v[0] and w[1] >= v[1] and w[2] >= v[2] and all(map(ge, w[3:], v[3:])):
+                break
+        else:
+            frontier.append(v)
+    return frontier
+
+
+class ParetoFrontier:
+    """
+    Incrementally maintained skyline of keyed criteria vectors
+    """
+
+    def __init__(self):
+        # criteria vector -> keys of the candidates that have it
+        self._members = {}
+
+    def __len__(self):
+        return sum(len(keys) for keys in self._members.values())
+
+    def add(self, items):
+        """
+        Merge new candidates into the frontier
+
+        Args:
+            items (iterable): (key, criteria vector) pairs
+        """
+        incoming = {}
+        for key, vector in items:
+            incoming.setdefault(vector, []).append(key)
+        if not incoming:
+            return
+        vectors = list(incoming)
+        frontier = list(self._members)
+        # The frontier stays small, so sorting chunks against it beats one big sort
+        for i in range(0, len(vectors), MERGE_CHUNK_SIZE):
+            frontier = pareto_frontier(frontier + vectors[i:i + MERGE_CHUNK_SIZE])
+        members = self._members
+        self._members = {
+            vector: members.get(vector, []) + incoming.get(vector, [])
+            for vector in frontier
+        }
+
+    def keys(self):
+        """Keys of the non-dominated candidates, in insertion order"""
+        return sorted(key for keys in self._members.values() for key in keys)
+
+
+class Shortlist(ABC):
+    """
+    Pareto frontier of a candidate pool with the dashboard's count/page interface
+    """
+
+    def __init__(self):
+        # fit roles -> ParetoFrontier over every band
+        self._frontiers = {}
+        # key -> band, for filtering the frontier
+        self._bands = {}
+
+    def add(self, items):
+        """
+        Args:
+            items (iterable): (key, band, fit roles, criteria vector) tuples
+        """
+        by_roles = {}
+        for key, band, roles, vector in items:
+            self._bands[key] = band
+            by_roles.setdefault(roles, []).append((key, vector))
+        for roles, members in by_roles.items():
+            self._frontiers.setdefault(roles, ParetoFrontier()).add(members)
+        # A dominated candidate stays dominated, so only frontier members need a band
+        self._bands = {key: self._bands[key] for frontier in self._frontiers.values() for key in frontier.keys()}
+
+    def keys(self, bands=None):
+        """Shortlisted keys of the given bands (all bands when empty)"""
+        return sorted(key for frontier in self._frontiers.values() for key in frontier.keys()
+                      if not bands or self._bands[key] in bands)
+
+    def count(self, bands=None):
+        """
+        Number of shortlisted candidates in the given bands (all when empty)
+        """
+        if not bands:
+            return sum(len(frontier) for frontier in self._frontiers.values())
+        return len(self.keys(bands))
+
+    def band_counts(self):
+        """Shortlisted candidates per band"""
+        counts = {}
+        for key in self.keys():
+            band = self._bands[key]
+            counts[band] = counts.get(band, 0) + 1
+        return counts
+
+    @abstractmethod
+    def _fetch(self, keys):
+        """Result dicts of the given keys, in order"""
+
+    def page(self, bands=None, sort_by=SORT_OPTIONS[0], offset=0, limit=20):
+        """
+        Get one page of shortlisted candidates
+
+        The shortlist is small next to the candidate list, so it is fetched
+        and sorted whole.
+
+        Args:
+            bands (list): Bands to keep; empty or None keeps all
+            sort_by (str): One of SORT_OPTIONS
+            offset (int): Candidates to skip in sorted order
+            limit (int): Page size
+
+        Returns:
+            list: Result dicts for the requested page
+        """
+        results = self._fetch(self.keys(bands))
+        # sorted() is stable, so ties keep insertion order like CandidateIndex
+        results.sort(key=SORT_KEYS[sort_by])
+        return results[offset:offset + limit]
+
+
+class ResultShortlist(Shortlist):
+    """
+    Shortlist of a result list, keyed by position and extended by `refresh()`
+    """
+
+    def __init__(self, results):
+        """
+        Args:
+            results (list): Result dicts or CandidateResults; held by reference
+                like CandidateIndex does
+        """
+        super().__init__()
+        self.results = results
+        self._size = 0
+        self.refresh()
+
+    def refresh(self):
+        """
+        Merge results appended since the last call
+
+        Returns:
+            int: Number of new results
+        """
+        new_results = self.results[self._size:]
+        start = self._size
+        self.add((start + i, result['band'], fit_roles(result), criteria(result))
+                 for i, result in enumerate(new_results))
+        self._size += len(new_results)
+        return len(new_results)
+
+    def _fetch(self, keys):
+        return [as_dict(self.results[pos]) for pos in keys]
+
+
+class StoreShortlist(Shortlist):
+    """
+    Shortlist of a CandidateStore, keyed by candidate id
+
+    Candidates added through this process are merged incrementally. Changes
+    by another process (an offline rescore, a folder watcher) or a cleared
+    store rebuild the shortlist from scratch.
+    """
+
+    def __init__(self, store):
+        """
+        Args:
+            store (CandidateStore): Store to shortlist
+        """
+        super().__init__()
+        self.store = store
+        self._last_id = 0
+        self._version = store.version()
+        self.refresh()
+
+    def refresh(self):
+        """
+        Merge candidates stored since the last call
+
+        Returns:
+            int: Number of new candidates
+        """
+        version = self.store.version()
+        if version != self._version:
+            self._frontiers = {}
+            self._bands = {}
+            self._last_id = 0
+            self._version = version
+        rows = list(self.store.shortlist_criteria(after_id=self._last_id))
+        if rows:
+            self.add(rows)
+            self._last_id = rows[-1][0]
+        return len(rows)
+
+    def _fetch(self, keys):
+        return self.store.fetch(keys)
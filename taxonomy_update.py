@@ -0,0 +1,205 @@
+"""
+Targeted re-analysis after a skills taxonomy change
+
+Adding or removing a keyword in SkillsAnalyzer can only change the results of
+candidates whose text contains that keyword. This diffs the taxonomy stored
+results were scored with against the current one, looks the changed keywords
+up in the store's token index, re-analyzes only those candidates from their
+stored text and re-encodes everyone else's feature vector for the new
+vocabulary without touching their text.
+
+With typo-tolerant matching (before or after the change) a candidate may
+match a keyword only through a misspelling, which the exact token lookup
+cannot see; stored tokens that correct to a changed keyword's words count
+as mentions too. Switching the matching mode itself can change any match,
+so then every candidate with stored text is re-analyzed.
+
+Usage:
+    python taxonomy_update.py --db candidates.db [--dry-run]
+"""
+
+import argparse
+from collections import Counter, defaultdict
+
+from candidate_store import CandidateStore
+from fuzzy_matcher import TOKEN_PATTERN, FuzzyMatcher
+from skills_analyzer import SkillsAnalyzer
+
+# Taxonomy groups whose membership affects scoring
+KEYWORD_GROUPS = ('procurement_keywords', 'premium_skills_keywords', 'scoring_concepts',
+                  'density_keywords', 'role_keywords', 'achievement_keywords')
+
+
+def _memberships(taxonomy):
+    """Count (group, category, term) memberships; list groups have no category"""
+    memberships = Counter()
+    for group in KEYWORD_GROUPS:
+        keywords = taxonomy.get(group, [])
+        if isinstance(keywords, dict):
+            for category, terms in keywords.items():
+                memberships.update((group, category, term) for term in terms)
+        else:
+            memberships.update((group, None, term) for term in keywords)
+    return memberships
+
+
+def diff_taxonomies(old, new):
+    """
+    Keywords whose role in scoring differs between two taxonomies
+
+    Args:
+        old (dict): Taxonomy snapshot (SkillsAnalyzer.taxonomy())
+        new (dict): Taxonomy snapshot
+
+    Returns:
+        dict: added, removed and changed keyword lists
+    """
+    old_memberships = _memberships(old)
+    new_memberships = _memberships(new)
+    old_terms = {term for _, _, term in old_memberships}
+    new_terms = {term for _, _, term in new_memberships}
+    changed = {
+        key[2] for key in set(old_memberships) | set(new_memberships)
+        if old_memberships[key] != new_memberships[key]
+    }
+    return {
+        'added': sorted(new_terms - old_terms),
+        'removed': sorted(old_terms - new_terms),
+        'changed': sorted(changed & old_terms & new_terms)
+    }
+
+
+def _matching(taxonomy):
+    # Taxonomies recorded before the matching mode was part of the vocabulary were exact
+    return taxonomy.get('matching') or {'fuzzy': False, 'max_edit_distance': 0}
+
+
+def candidates_with_misspellings(store, keywords, max_edit_distance):
+    """
+    Candidates whose stored text holds every word of a keyword, allowing
+    the misspellings typo-tolerant matching accepts
+
+    Args:
+        store (CandidateStore): Candidate database
+        keywords (list): Changed keywords
+        max_edit_distance (int): Edit budget of the fuzzy matcher
+
+    Returns:
+        set: Candidate ids (a superset, like candidates_mentioning)
+    """
+    matcher = FuzzyMatcher(keywords, max_edit_distance)
+    token_ids = defaultdict(set)
+    for token_id, token in store.iter_tokens():
+        for part in TOKEN_PATTERN.findall(token):
+            word = matcher.correct(part)
+            if word in matcher.words:
+                token_ids[word].add(token_id)
+
+    candidates = set()
+    for phrase in matcher.terms.values():
+        mentioning = None
+        for word in phrase.split():
+            ids = store.candidates_with_tokens(token_ids[word])
+            mentioning = ids if mentioning is None else mentioning & ids
+            if not mentioning:
+                break
+        candidates |= mentioning or set()
+    return candidates
+
+
+def reencode_features(features, old_terms, analyzer):
+    """Translate a feature record to the analyzer's vocabulary (terms it lacks are dropped)"""
+    hits = int(features['hits'] or '0', 16)
+    matched = {term for i, term in enumerate(old_terms) if hits >> i & 1}
+    return dict(features, vocabulary=analyzer.vocabulary_id,
+                hits=format(analyzer.encode_matches(matched), 'x'))
+
+
+def apply_taxonomy_change(store, analyzer=None, dry_run=False):
+    """
+    Bring stored results up to date with the current taxonomy
+
+    Args:
+        store (CandidateStore): Candidate database
+        analyzer (SkillsAnalyzer): Analyzer with the new taxonomy
+        dry_run (bool): Only report what would be touched
+
+    Returns:
+        dict: Counts of re-analyzed, changed, re-encoded and skipped candidates
+    """
+    analyzer = analyzer or SkillsAnalyzer()
+    report = {'vocabulary': analyzer.vocabulary_id, 'keywords': [], 'reanalyzed': 0, 'changed': 0,
+              'reencoded': 0, 'without_text': 0}
+    with_text = store.document_ids()
+
+    for vocabulary_id, taxonomy in store.vocabulary_taxonomies().items():
+        if vocabulary_id == analyzer.vocabulary_id:
+            continue
+        ids, features = store.load_features(vocabulary_id)
+        if not ids:
+            continue
+
+        diff = diff_taxonomies(taxonomy, analyzer.taxonomy())
+        keywords = diff['added'] + diff['removed'] + diff['changed']
+        report['keywords'] = sorted(set(report['keywords']) | set(keywords))
+
+        old_matching, new_matching = _matching(taxonomy), analyzer.matching
+        if old_matching != new_matching:
+            # Exact and typo-tolerant matching can disagree on any keyword
+            candidates = set(ids)
+        else:
+            candidates = set()
+            for keyword in keywords:
+                candidates |= store.candidates_mentioning(keyword)
+            if new_matching['fuzzy'] and keywords:
+                candidates |= candidates_with_misspellings(store, keywords, new_matching['max_edit_distance'])
+
+        old_terms = taxonomy['feature_terms']
+        features_by_id = dict(zip(ids, features))
+        affected = [i for i in ids if i in candidates and i in with_text]
+        untouched = [i for i in ids if i not in candidates and i in with_text]
+        # Without text there is no way to tell whether a new keyword applies
+        report['without_text'] += sum(1 for i in ids if i not in with_text)
+
+        updates = []
+        for candidate_id, text, experience, _ in store.iter_documents(affected):
+            analysis = analyzer.analyze(text, experience)
+            previous = reencode_features(features_by_id[candidate_id], old_terms, analyzer)
+            if analysis['features']['hits'] != previous['hits']:
+                report['changed'] += 1
+            updates.append((candidate_id, analysis))
+        report['reanalyzed'] += len(updates)
+
+        reencoded = [(i, reencode_features(features_by_id[i], old_terms, analyzer)) for i in untouched]
+        report['reencoded'] += len(reencoded)
+
+        if not dry_run:
+            store.update_analyses(updates)
+            store.update_features(reencoded)
+
+    if not dry_run:
+        store.add_vocabulary(analyzer.vocabulary_id, analyzer.taxonomy())
+    return report
+
+
+def main():
+    """Apply the current skills taxonomy to a candidate database"""
+    arg_parser = argparse.ArgumentParser(description="Re-analyze candidates affected by a taxonomy change")
+    arg_parser.add_argument('--db', default='candidates.db', help="Candidate database")
+    arg_parser.add_argument('--dry-run', action='store_true', help="Report without writing")
+    args = arg_parser.parse_args()
+
+    report = apply_taxonomy_change(CandidateStore(args.db), dry_run=args.dry_run)
+    if not report['keywords'] and not report['reencoded'] and not report['reanalyzed']:
+        print("✅ Stored results already use the current taxonomy")
+        return
+
+    print(f"🔤 Changed keywords: {', '.join(report['keywords']) or 'none (term order or matching mode only)'}")
+    print(f"🔁 Re-analyzed {report['reanalyzed']} candidate(s), {report['changed']} with different matches")
+    print(f"📦 Re-encoded {report['reencoded']} unaffected feature vector(s)")
+    if report['without_text']:
+        print(f"⚠️ {report['without_text']} candidate(s) have no stored text and need a full re-screen")
+
+
+if __name__ == "__main__":
+    main()
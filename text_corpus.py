@@ -0,0 +1,156 @@
+"""
+Memory-mapped corpus of extracted resume texts
+
+Extraction is the expensive stage, so its output is kept: every text is
+zlib-compressed and appended to a data file, and a fixed-width entry
+(offset, compressed length, text length) is appended to an index file. A
+document's id is its position in the index. Readers mmap both files and
+decompress straight out of the mapping, so any text can be fetched without
+re-parsing its PDF/DOCX or copying the corpus into process memory.
+
+Appends take an exclusive file lock, so the app, screening pool workers and
+the folder watcher can all write to the same corpus. Data is written before
+its index entry, so a reader never sees an entry pointing at missing bytes.
+"""
+
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-writer use only
+    fcntl = None
+
+# Index entry: data offset, compressed length, uncompressed UTF-8 length
+INDEX_ENTRY = struct.Struct('<QII')
+
+COMPRESSION_LEVEL = 6
+
+
+class TextCorpus:
+    """
+    Append-only, compressed text store with an mmap-ed offset index
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Data file; the index lives next to it as `<path>.idx`
+        """
+        self.path = path
+        self.index_path = path + '.idx'
+        for file_path in (self.path, self.index_path):
+            open(file_path, 'ab').close()
+        self._data = None
+        self._index = None
+        self._count = 0
+        # Remapping must not race a read of the old mapping in another thread
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        with self._lock:
+            self._refresh()
+            return self._count
+
+    def __getstate__(self):
+        # Mappings are per process; other processes reopen the files by path
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    def _close(self):
+        for mapping in (self._data, self._index):
+            if mapping is not None:
+                mapping.close()
+        self._data = self._index = None
+        self._count = 0
+
+    def append(self, text):
+        """
+        Compress and append one text
+
+        Args:
+            text (str): Extracted resume text
+
+        Returns:
+            int: Document id
+        """
+        raw = text.encode('utf-8')
+        compressed = zlib.compress(raw, COMPRESSION_LEVEL)
+
+        with open(self.index_path, 'r+b') as index_file, open(self.path, 'ab') as data_file:
+            if fcntl is not None:
+                fcntl.flock(index_file, fcntl.LOCK_EX)
+            try:
+                # A torn entry from a crashed writer is dropped before appending
+                index_size = os.fstat(index_file.fileno()).st_size
+                doc_id = index_size // INDEX_ENTRY.size
+                index_file.truncate(doc_id * INDEX_ENTRY.size)
+
+                offset = data_file.seek(0, os.SEEK_END)
+                data_file.write(compressed)
+                data_file.flush()
+
+                index_file.seek(doc_id * INDEX_ENTRY.size)
+                index_file.write(INDEX_ENTRY.pack(offset, len(compressed), len(raw)))
+                index_file.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(index_file, fcntl.LOCK_UN)
+        return doc_id
+
+    def _refresh(self):
+        """Remap the files if other writers have appended since the last mapping"""
+        index_size = os.path.getsize(self.index_path)
+        count = index_size // INDEX_ENTRY.size
+        if count == self._count:
+            return
+        self._close()
+        if count == 0:
+            return
+        with open(self.index_path, 'rb') as f:
+            self._index = mmap.mmap(f.fileno(), count * INDEX_ENTRY.size, access=mmap.ACCESS_READ)
+        with open(self.path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._count = count
+
+    def _entry(self, doc_id):
+        if not 0 <= doc_id < self._count:
+            self._refresh()
+            if not 0 <= doc_id < self._count:
+                raise IndexError(f"No document {doc_id} in corpus {self.path}")
+        return INDEX_ENTRY.unpack_from(self._index, doc_id * INDEX_ENTRY.size)
+
+    def get(self, doc_id):
+        """
+        Fetch one text
+
+        Args:
+            doc_id (int): Id returned by `append`
+
+        Returns:
+            str: The stored text
+        """
+        with self._lock:
+            offset, length, _ = self._entry(doc_id)
+            # Decompress from a view of the mapping rather than a copied slice
+            with memoryview(self._data) as view, view[offset:offset + length] as record:
+                return zlib.decompress(record).decode('utf-8')
+
+    def text_length(self, doc_id):
+        """Size of a stored text in UTF-8 bytes, read from the index alone"""
+        with self._lock:
+            return self._entry(doc_id)[2]
+
+    def __iter__(self):
+        """Iterate over (doc id, text) for every stored document"""
+        for doc_id in range(len(self)):
+            yield doc_id, self.get(doc_id)
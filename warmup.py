@@ -0,0 +1,49 @@
+"""
+Background warm-up of heavy dependencies
+
+The app defers pandas, PyPDF2, python-docx and spaCy until they are needed.
+Once the first page has painted, a background thread can preload them so the
+first "Start Analysis" or export click does not pay the import cost.
+Set RESUME_SCREENER_WARMUP=0 to disable.
+"""
+
+import importlib
+import os
+import threading
+
+from resume_parser import load_nlp
+
+WARMUP_MODULES = ('pandas', 'openpyxl', 'PyPDF2', 'docx')
+
+_lock = threading.Lock()
+_thread = None
+
+
+def warmup_enabled():
+    return os.environ.get('RESUME_SCREENER_WARMUP', '1').lower() not in ('0', 'false', 'no')
+
+
+def _warm_up():
+    for module in WARMUP_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+    load_nlp()
+
+
+def start_background_warmup():
+    """
+    Preload heavy dependencies on a daemon thread, once per process
+
+    Returns:
+        threading.Thread or None: The warm-up thread, or None when disabled
+    """
+    global _thread
+    if not warmup_enabled():
+        return None
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_warm_up, name="resume-screener-warmup", daemon=True)
+            _thread.start()
+    return _thread